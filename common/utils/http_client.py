@@ -0,0 +1,523 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP Client for Advent Automation 2025
+
+One retrying, pooled HTTP client used by the day-level extractors instead
+of hand-written request loops:
+1. Keep-alive connection pool (requests.Session + HTTPAdapter)
+2. Exponential backoff with jitter on timeouts, connection errors and
+   retryable statuses (429 / 5xx), honoring Retry-After
+3. Per-host token-bucket rate limiting, shared by every thread
+4. Optional on-disk cache of GET responses, with per-request (or
+   per-response) lifetimes and ETag / Last-Modified revalidation
+5. Per-endpoint latency histograms
+
+Usage:
+    import sys
+    from pathlib import Path
+    sys.path.append(str(Path(__file__).parent.parent / 'common'))
+
+    from utils.http_client import RetryingHTTPClient
+
+    client = RetryingHTTPClient(rate_limits={'api.example.com': 5})
+    response = client.get('https://api.example.com/items', params={'page': 1})
+    response.raise_for_status()
+    client.print_latency_report()
+"""
+
+import base64
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+# Statuses worth retrying: rate limited or a transient server error
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Response headers replayed as conditional request headers when a cached entry expires
+VALIDATOR_HEADERS = {'ETag': 'If-None-Match', 'Last-Modified': 'If-Modified-Since'}
+
+# Cache lifetime: seconds, or a function of the response returning seconds
+# (math.inf: never expires, 0 / None: don't cache)
+CacheTTL = Union[float, Callable[[requests.Response], Optional[float]]]
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Path segments that identify a resource (numeric IDs, hashes, bech32 IDs)
+_ID_SEGMENT = re.compile(r'^(?=.*\d)[\w-]{8,}$|^\d+$')
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value: Delay in seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting the request rate to one host.
+
+    penalize() pauses every thread using the bucket, so a 429 seen by one
+    worker slows all of them down.
+    """
+
+    def __init__(self, rate_per_second: float, burst: int = 1):
+        """
+        Initialize the bucket.
+
+        Args:
+            rate_per_second: Sustained requests per second
+            burst: Bucket capacity (requests sent back-to-back)
+        """
+        self.rate = rate_per_second
+        self.capacity = max(1, burst)
+
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self.waited_seconds = 0.0
+
+    def acquire(self, tokens: int = 1):
+        """Block until `tokens` requests may be sent."""
+        tokens = min(max(1, tokens), self.capacity)
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self._tokens >= tokens:
+                        self._tokens -= tokens
+                        return
+                    wait = (tokens - self._tokens) / self.rate
+                self.waited_seconds += wait
+
+            time.sleep(wait)
+
+    def penalize(self, seconds: float):
+        """Pause every thread using this bucket for `seconds`."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class RetryingHTTPClient:
+    """
+    Pooled HTTP client with retries, rate limiting, caching and latency metrics.
+
+    request() returns the final response, including a non-2xx one after
+    the last attempt, so callers keep their own raise_for_status() or
+    status handling. Timeouts and connection errors are re-raised once the
+    attempts are used up.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_seconds: float = 1.0,
+        max_backoff_seconds: float = 60.0,
+        timeout: float = 30,
+        rate_limits: Optional[Dict[str, float]] = None,
+        burst: int = 1,
+        pool_maxsize: int = 10,
+        headers: Optional[Dict[str, str]] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        cache_ttl_seconds: Optional[CacheTTL] = None,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        verbose: bool = True,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            max_attempts: Attempts per request (1 disables retries)
+            backoff_seconds: Base delay, doubled on every retry (with jitter)
+            max_backoff_seconds: Cap on a single delay (including Retry-After)
+            timeout: Default request timeout in seconds
+            rate_limits: Host -> requests per second (hosts not listed are unlimited)
+            burst: Token bucket capacity of each rate-limited host
+            pool_maxsize: Keep-alive connections per host (≥ concurrent workers)
+            headers: Headers sent with every request
+            cache_dir: Directory for cached GET responses (None disables caching)
+            cache_ttl_seconds: Default cache lifetime of GET responses
+                (None: only requests passing cache_ttl are cached)
+            retry_statuses: HTTP statuses retried
+            verbose: Print a line for every retry
+            sleep: Sleep function (replaceable in tests)
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.timeout = timeout
+        self.retry_statuses = frozenset(retry_statuses)
+        self.verbose = verbose
+        self.sleep = sleep
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(1, pool_maxsize))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        if headers:
+            self.session.headers.update(headers)
+
+        self.limiters = {
+            host: TokenBucket(rate, burst) for host, rate in (rate_limits or {}).items()
+        }
+
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.cache_ttl_seconds = cache_ttl_seconds
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.stats = {
+            'requests': 0,
+            'retries': 0,
+            'rate_limited': 0,
+            'errors': 0,
+            'cache_hits': 0,
+            'revalidated': 0
+        }
+        self._latency: Dict[str, Dict[str, Any]] = {}
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """GET with retries (see request)."""
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """POST with retries (see request)."""
+        return self.request('POST', url, **kwargs)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        endpoint: Optional[str] = None,
+        cache_ttl: Optional[CacheTTL] = None,
+        limiter: Optional[Any] = None,
+        cost: int = 1,
+        retry_if: Optional[Callable[[requests.Response], bool]] = None,
+        on_response: Optional[Callable[[requests.Response], None]] = None,
+        max_attempts: Optional[int] = None,
+        **kwargs: Any
+    ) -> requests.Response:
+        """
+        Send a request, retrying transient failures.
+
+        Cached GET responses are returned without a request until they
+        expire. An expired entry whose response carried an ETag or
+        Last-Modified header is revalidated with a conditional request; on
+        304 Not Modified the cached response is returned and its lifetime
+        renewed.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            params: Query parameters
+            endpoint: Label for latency metrics (default: method + URL path with IDs collapsed)
+            cache_ttl: Seconds a cached GET response stays valid, or a function
+                of the response returning them (overrides cache_ttl_seconds)
+            limiter: Rate limiter with acquire(tokens) / penalize(seconds) to use
+                instead of the host's token bucket (e.g. an API-specific limiter)
+            cost: Tokens this request takes from the limiter
+            retry_if: Extra predicate marking a response as retryable
+                (e.g. rate-limit errors an API reports with HTTP 400)
+            on_response: Called with every response received, retried or not
+            max_attempts: Override of the client's max_attempts
+            **kwargs: Passed to requests (json, data, headers, timeout, ...)
+
+        Returns:
+            Final response (may be an error response after the last attempt)
+
+        Raises:
+            requests.exceptions.RequestException: Timeout or connection error on the last attempt
+        """
+        attempts = self.max_attempts if max_attempts is None else max(1, max_attempts)
+        label = endpoint or self.endpoint_label(method, url)
+        limiter = limiter if limiter is not None else self.limiters.get(urlsplit(url).hostname)
+        kwargs.setdefault('timeout', self.timeout)
+
+        ttl = cache_ttl if cache_ttl is not None else self.cache_ttl_seconds
+        cache_path = None
+        stale = None
+        if method.upper() == 'GET' and self.cache_dir is not None and ttl:
+            cache_path = self._cache_path(url, params)
+            cached = self._read_cache(cache_path, ttl, url)
+            if cached is not None:
+                if cached.expires_at is None or time.time() < cached.expires_at:
+                    self._count('cache_hits')
+                    return cached
+
+                conditional = {
+                    request_header: cached.headers[header]
+                    for header, request_header in VALIDATOR_HEADERS.items()
+                    if header in cached.headers
+                }
+                if conditional:
+                    stale = cached
+                    kwargs['headers'] = {**(kwargs.get('headers') or {}), **conditional}
+
+        for attempt in range(attempts):
+            if limiter is not None:
+                limiter.acquire(cost)
+
+            started = time.perf_counter()
+            try:
+                response = self.session.request(method, url, params=params, **kwargs)
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                self._record(label, time.perf_counter() - started, error=True)
+                if attempt == attempts - 1:
+                    raise
+                delay = self._backoff(attempt)
+                self._log(f"   ⏳ {type(e).__name__} on {label}, retrying in {delay:.1f}s "
+                          f"(attempt {attempt + 1}/{attempts})")
+                self._count('retries')
+                self.sleep(delay)
+                continue
+
+            self._record(label, time.perf_counter() - started, error=response.status_code >= 400)
+            if on_response is not None:
+                on_response(response)
+
+            rate_limited = response.status_code == 429 or (retry_if is not None and retry_if(response))
+            if not (rate_limited or response.status_code in self.retry_statuses) or attempt == attempts - 1:
+                break
+
+            delay = parse_retry_after(response.headers.get('Retry-After'))
+            if delay is None:
+                delay = self._backoff(attempt)
+            delay = min(delay, self.max_backoff_seconds)
+
+            self._count('retries')
+            if rate_limited:
+                self._count('rate_limited')
+            self._log(f"   ⏳ HTTP {response.status_code} on {label}, retrying in {delay:.1f}s "
+                      f"(attempt {attempt + 1}/{attempts})")
+
+            if rate_limited and limiter is not None:
+                # Pauses every worker sharing the limiter, not just this one
+                limiter.penalize(delay)
+            else:
+                self.sleep(delay)
+
+        if stale is not None and response.status_code == 304:
+            self._count('revalidated')
+            for header in VALIDATOR_HEADERS:
+                if header in response.headers:
+                    stale.headers[header] = response.headers[header]
+            self._write_cache(cache_path, stale, ttl)
+            return stale
+
+        if cache_path is not None and response.status_code == 200:
+            self._write_cache(cache_path, response, ttl)
+        return response
+
+    @staticmethod
+    def endpoint_label(method: str, url: str) -> str:
+        """
+        Group URLs for latency metrics: resource IDs in the path become {id}.
+
+        Example:
+            GET https://graph.facebook.com/v24.0/17841234567890/media
+            -> GET graph.facebook.com/v24.0/{id}/media
+        """
+        parts = urlsplit(url)
+        path = '/'.join(
+            '{id}' if _ID_SEGMENT.match(segment) else segment
+            for segment in parts.path.split('/')
+        )
+        return f"{method.upper()} {parts.hostname}{path}"
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get request counters and per-endpoint latency summaries.
+
+        Returns:
+            Dictionary with requests, retries, rate_limited, errors,
+            cache_hits, revalidated (304 responses) and an 'endpoints' mapping of label -> count, errors,
+            mean_ms, p50_ms, p95_ms (histogram bucket bounds), max_ms and
+            histogram (bucket bound -> count)
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            latency = {label: dict(entry, buckets=list(entry['buckets'])) for label, entry in self._latency.items()}
+
+        stats['endpoints'] = {}
+        for label, entry in latency.items():
+            bounds = [f"≤{bound}s" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}s"]
+            stats['endpoints'][label] = {
+                'count': entry['count'],
+                'errors': entry['errors'],
+                'mean_ms': round(1000 * entry['total'] / entry['count'], 1),
+                'p50_ms': self._percentile_ms(entry, 0.50),
+                'p95_ms': self._percentile_ms(entry, 0.95),
+                'max_ms': round(1000 * entry['max'], 1),
+                'histogram': dict(zip(bounds, entry['buckets']))
+            }
+        return stats
+
+    def print_latency_report(self):
+        """Print per-endpoint request counts and latency percentiles."""
+        stats = self.get_stats()
+        if not stats['endpoints']:
+            return
+
+        print("\n⏱️  HTTP latency by endpoint:")
+        print(f"   {'Endpoint':<55} {'Calls':>6} {'Errors':>6} {'Mean':>8} {'p50≤':>8} {'p95≤':>8} {'Max':>8}")
+        for label, entry in sorted(stats['endpoints'].items()):
+            print(f"   {label[:55]:<55} {entry['count']:>6} {entry['errors']:>6} "
+                  f"{entry['mean_ms']:>6.0f}ms {self._fmt_ms(entry['p50_ms'])} "
+                  f"{self._fmt_ms(entry['p95_ms'])} {entry['max_ms']:>6.0f}ms")
+        print(f"   Requests: {stats['requests']}, retries: {stats['retries']} "
+              f"({stats['rate_limited']} rate limited), cache hits: {stats['cache_hits']}, "
+              f"revalidated (304): {stats['revalidated']}")
+
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with jitter for a 0-based attempt."""
+        delay = self.backoff_seconds * (2 ** attempt) * random.uniform(1.0, 1.5)
+        return min(delay, self.max_backoff_seconds)
+
+    def _record(self, label: str, seconds: float, error: bool = False):
+        """Add one request to the endpoint's latency histogram."""
+        bucket = next((i for i, bound in enumerate(LATENCY_BUCKETS) if seconds <= bound), len(LATENCY_BUCKETS))
+
+        with self._lock:
+            self.stats['requests'] += 1
+            if error:
+                self.stats['errors'] += 1
+
+            entry = self._latency.get(label)
+            if entry is None:
+                entry = self._latency[label] = {
+                    'count': 0, 'errors': 0, 'total': 0.0, 'max': 0.0,
+                    'buckets': [0] * (len(LATENCY_BUCKETS) + 1)
+                }
+            entry['count'] += 1
+            entry['errors'] += int(error)
+            entry['total'] += seconds
+            entry['max'] = max(entry['max'], seconds)
+            entry['buckets'][bucket] += 1
+
+    @staticmethod
+    def _percentile_ms(entry: Dict[str, Any], quantile: float) -> Optional[float]:
+        """Upper bound (ms) of the histogram bucket holding the quantile, capped at the max (None: open-ended bucket)."""
+        target = quantile * entry['count']
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, entry['buckets']):
+            seen += count
+            if seen >= target:
+                return round(min(bound, entry['max']) * 1000, 1)
+        return None
+
+    @staticmethod
+    def _fmt_ms(value: Optional[float]) -> str:
+        return f"{value:>6.0f}ms" if value is not None else f"{'>' + str(int(LATENCY_BUCKETS[-1])) + 's':>8}"
+
+    def _count(self, key: str, amount: int = 1):
+        """Increment a counter (thread-safe)."""
+        with self._lock:
+            self.stats[key] += amount
+
+    def _log(self, message: str):
+        if self.verbose:
+            print(message)
+
+    def _cache_path(self, url: str, params: Optional[Dict[str, Any]]) -> Path:
+        """Cache file of a GET request (hashed, so tokens in params never hit the file name)."""
+        key = json.dumps({'url': url, 'params': params or {}}, sort_keys=True, default=str)
+        return self.cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def _read_cache(self, path: Path, ttl: CacheTTL, url: str) -> Optional[requests.Response]:
+        """
+        Rebuild a cached response, fresh or not, or None if missing.
+
+        The response's expires_at is the expiry stored with the entry (None:
+        never expires); entries written without one expire ttl seconds after
+        they were cached.
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        response = requests.Response()
+        if 'expires_at' in entry:
+            response.expires_at = entry['expires_at']
+        else:
+            response.expires_at = entry['cached_at'] + (0 if callable(ttl) else ttl)
+        response.status_code = entry['status_code']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response._content = base64.b64decode(entry['content'])
+        response.encoding = entry.get('encoding')
+        response.url = url
+        response.from_cache = True
+        return response
+
+    def _write_cache(self, path: Path, response: requests.Response, ttl: CacheTTL):
+        """Store a response atomically (temp file + rename) with its expiry."""
+        seconds = ttl(response) if callable(ttl) else ttl
+        if not seconds or seconds <= 0:
+            return
+
+        cached_at = time.time()
+        entry = {
+            'cached_at': cached_at,
+            'expires_at': None if math.isinf(seconds) else cached_at + seconds,
+            'status_code': response.status_code,
+            # The body is stored decoded, so drop transfer/content encodings
+            'headers': {
+                name: value for name, value in response.headers.items()
+                if name.lower() not in ('content-encoding', 'transfer-encoding', 'content-length')
+            },
+            'encoding': response.encoding,
+            'content': base64.b64encode(response.content).decode('ascii')
+        }
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        tmp_path.replace(path)
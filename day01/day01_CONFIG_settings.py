@@ -23,12 +23,34 @@ day01_BQ_LOCATION = os.getenv('DAY01_BQ_LOCATION', 'US')
 day01_GA4_TABLE = 'ga4_sessions'
 day01_ADS_TABLE = 'google_ads_campaigns'
 
+# Incremental loads: tables are partitioned by date and clustered by these columns;
+# (date, cluster column) identifies a row for MERGE
+day01_BQ_PARTITION_FIELD = 'date'
+day01_BQ_CLUSTER_FIELDS = {
+    day01_GA4_TABLE: 'source',
+    day01_ADS_TABLE: 'campaign_name'
+}
+day01_BQ_STAGING_SUFFIX = '_staging'
+day01_BQ_STAGING_EXPIRATION_HOURS = 6  # Staging tables left behind by failed runs expire
+day01_BQ_LOOKBACK_DAYS = int(os.getenv('DAY01_BQ_LOOKBACK_DAYS', '2'))  # Re-merge recent days (late data)
+day01_BQ_READ_CHUNK_ROWS = 500_000
+
 # ============================================================================
 # GA4 Configuration
 # ============================================================================
 day01_GA4_PROPERTY_ID = os.getenv('DAY01_GA4_PROPERTY_ID', '213025502')  # Google Merchandise Store Demo
 day01_GA4_CREDENTIALS_PATH = os.getenv('DAY01_GA4_CREDENTIALS_PATH', './credentials/ga4_service_account.json')
 
+# Real extraction: long date ranges are split into chunks of this many days,
+# each paged through with limit/offset; GA4 and Ads chunks share one thread pool
+day01_EXTRACT_CHUNK_DAYS = int(os.getenv('DAY01_EXTRACT_CHUNK_DAYS', '30'))
+day01_EXTRACT_MAX_WORKERS = int(os.getenv('DAY01_EXTRACT_MAX_WORKERS', '4'))  # GA4 allows 10 concurrent requests per property
+day01_GA4_PAGE_SIZE = 100000  # Rows per run_report call (API maximum is 250,000)
+day01_GA4_MAX_RETRIES = 5
+day01_GA4_BACKOFF_SECONDS = 2.0  # Doubled per retry on quota / unavailable errors
+day01_GA4_MIN_TOKENS_REMAINING = 500  # Slow down when the hourly property quota gets this low
+day01_GA4_LOW_QUOTA_PAUSE_SECONDS = 5.0
+
 # ============================================================================
 # Feature Flags
 # ============================================================================
@@ -68,6 +90,21 @@ day01_CAMPAIGN_NAMES = [
     'Black Friday Special'
 ]
 
+# Session volume multiplier per traffic source (other sources: 0.5)
+day01_GA4_SOURCE_MULTIPLIERS = {
+    'google': 1.5,
+    'direct': 1.2,
+    'facebook': 0.8
+}
+day01_GA4_DEFAULT_SOURCE_MULTIPLIER = 0.5
+
+# Interchange format of data/raw and data/processed ('parquet' or 'csv' for compatibility)
+day01_OUTPUT_FORMAT = os.getenv('DAY01_OUTPUT_FORMAT', 'parquet').lower()
+
+# Large synthetic datasets are generated and written this many days at a time
+day01_SYNTHETIC_CHUNK_DAYS = int(os.getenv('DAY01_SYNTHETIC_CHUNK_DAYS', '365'))
+day01_SYNTHETIC_SEED = int(os.getenv('DAY01_SYNTHETIC_SEED')) if os.getenv('DAY01_SYNTHETIC_SEED') else None  # unset = random
+
 # GA4 Synthetic Data Ranges
 day01_GA4_SESSIONS_MIN = 1000
 day01_GA4_SESSIONS_MAX = 2000
@@ -97,3 +134,9 @@ day01_ADS_SYNTHETIC_FILE = f'{day01_RAW_DATA_DIR}/ads_synthetic.csv'
 
 day01_GA4_PROCESSED_FILE = f'{day01_PROCESSED_DATA_DIR}/ga4_sessions.csv'
 day01_ADS_PROCESSED_FILE = f'{day01_PROCESSED_DATA_DIR}/ads_campaigns.csv'
+
+# Last date merged into each BigQuery table (incremental mode)
+day01_BQ_WATERMARK_FILE = f'{day01_PROCESSED_DATA_DIR}/bq_watermarks.json'
+
+# Rows, bytes and elapsed time of every load job (one JSON object per line)
+day01_BQ_LOAD_LOG_FILE = f'{day01_PROCESSED_DATA_DIR}/bq_load_log.jsonl'
@@ -4,25 +4,113 @@ Generates realistic synthetic Google Ads campaign data since no free sandbox exi
 
 Usage:
     python day01_DATA_extract_ads.py
+
+    # Large dataset, streamed to Parquet in yearly chunks:
+    python day01_DATA_extract_ads.py --days 20000 --campaigns 300 --format parquet
 """
 
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+import argparse
 import os
 import sys
 
 # Import day01 configuration
 import day01_CONFIG_settings as config
+from day01_DATA_io import (
+    day01_OUTPUT_FORMATS,
+    day01_combine_summaries,
+    day01_copy_output,
+    day01_output_path,
+    day01_write_chunks,
+)
+
+# Summary columns added up across chunks
+day01_ADS_SUMMARY_SUMS = ['spend', 'clicks', 'impressions', 'conversions', 'rows']
+
+
+def day01_ads_campaign_names(num_campaigns=None):
+    """
+    Campaigns to simulate: the configured ones, then "Campaign NNN" names.
+
+    Args:
+        num_campaigns (int): Number of campaigns (defaults to config)
+
+    Returns:
+        list: Campaign names
+    """
+    if num_campaigns is None:
+        num_campaigns = config.day01_NUM_CAMPAIGNS
+
+    campaigns = list(config.day01_CAMPAIGN_NAMES[:num_campaigns])
+    return campaigns + [f'Campaign {i:03d}' for i in range(len(campaigns) + 1, num_campaigns + 1)]
+
+
+def day01_iter_ads_synthetic_chunks(days=None, num_campaigns=None, chunk_days=None, seed=None, start_date=None):
+    """
+    Generate synthetic Google Ads campaign data in chunks of whole days.
+
+    Every metric is drawn as one array per chunk (days x campaigns).
+
+    Args:
+        days (int): Number of days of historical data to generate
+        num_campaigns (int): Number of campaigns to simulate
+        chunk_days (int): Days per yielded chunk
+        seed (int): Random seed (None for non-reproducible data)
+        start_date (date): First day (defaults to `days` days ago)
+
+    Yields:
+        pd.DataFrame: Rows ordered by date, then campaign
+    """
+    if days is None:
+        days = config.day01_SYNTHETIC_DAYS
+    if chunk_days is None:
+        chunk_days = config.day01_SYNTHETIC_CHUNK_DAYS
+
+    rng = np.random.default_rng(seed)
+    campaigns = np.array(day01_ads_campaign_names(num_campaigns))
+    start_date = pd.Timestamp(start_date or datetime.now() - timedelta(days=days)).normalize()
 
+    for first_day in range(0, days, max(1, chunk_days)):
+        n_days = min(chunk_days, days - first_day)
+        shape = (n_days, len(campaigns))
 
-def day01_generate_ads_synthetic_data(days=None, num_campaigns=None):
+        dates = pd.date_range(start_date + pd.Timedelta(days=first_day), periods=n_days, freq='D')
+
+        spend = rng.uniform(config.day01_ADS_SPEND_MIN, config.day01_ADS_SPEND_MAX, shape)
+        impressions = rng.uniform(
+            config.day01_ADS_IMPRESSIONS_MIN, config.day01_ADS_IMPRESSIONS_MAX, shape
+        ).astype(np.int64)
+
+        # CTR (Click-Through Rate): 2-4%
+        ctr = rng.uniform(config.day01_ADS_CTR_MIN, config.day01_ADS_CTR_MAX, shape)
+        clicks = (impressions * ctr).astype(np.int64)
+
+        # Conversion rate: 3-8% of clicks
+        conversion_rate = rng.uniform(
+            config.day01_ADS_CONVERSION_RATE_MIN, config.day01_ADS_CONVERSION_RATE_MAX, shape
+        )
+        conversions = (clicks * conversion_rate).astype(np.int64)
+
+        yield pd.DataFrame({
+            'date': np.repeat(dates.strftime('%Y-%m-%d'), len(campaigns)),
+            'campaign_name': np.tile(campaigns, n_days),
+            'spend': np.round(spend.ravel(), 2),
+            'clicks': clicks.ravel(),
+            'impressions': impressions.ravel(),
+            'conversions': conversions.ravel()
+        })
+
+
+def day01_generate_ads_synthetic_data(days=None, num_campaigns=None, seed=None):
     """
     Generate synthetic Google Ads campaign data.
 
     Args:
         days (int): Number of days of historical data to generate
         num_campaigns (int): Number of campaigns to simulate
+        seed (int): Random seed (None for non-reproducible data)
 
     Returns:
         pd.DataFrame: Synthetic Google Ads data with realistic metrics
@@ -34,116 +122,142 @@ def day01_generate_ads_synthetic_data(days=None, num_campaigns=None):
 
     print(f"🔄 Generating {days} days of synthetic Google Ads data for {num_campaigns} campaigns...")
 
-    # Select campaigns
-    campaigns = config.day01_CAMPAIGN_NAMES[:num_campaigns]
-
-    data = []
-    start_date = datetime.now() - timedelta(days=days)
-
-    for i in range(days):
-        date = start_date + timedelta(days=i)
-
-        for campaign in campaigns:
-            # Generate realistic metrics
-            spend = np.random.uniform(
-                config.day01_ADS_SPEND_MIN,
-                config.day01_ADS_SPEND_MAX
-            )
-
-            impressions = int(np.random.uniform(
-                config.day01_ADS_IMPRESSIONS_MIN,
-                config.day01_ADS_IMPRESSIONS_MAX
-            ))
-
-            # CTR (Click-Through Rate): 2-4%
-            ctr = np.random.uniform(
-                config.day01_ADS_CTR_MIN,
-                config.day01_ADS_CTR_MAX
-            )
-            clicks = int(impressions * ctr)
-
-            # Conversion rate: 3-8% of clicks
-            conversion_rate = np.random.uniform(
-                config.day01_ADS_CONVERSION_RATE_MIN,
-                config.day01_ADS_CONVERSION_RATE_MAX
-            )
-            conversions = int(clicks * conversion_rate)
-
-            data.append({
-                'date': date.strftime('%Y-%m-%d'),
-                'campaign_name': campaign,
-                'spend': round(spend, 2),
-                'clicks': clicks,
-                'impressions': impressions,
-                'conversions': conversions
-            })
-
-    df = pd.DataFrame(data)
+    df = pd.concat(
+        day01_iter_ads_synthetic_chunks(days, num_campaigns=num_campaigns, seed=seed),
+        ignore_index=True
+    )
     print(f"✅ Generated {len(df)} rows of synthetic Google Ads data")
     return df
 
 
-def day01_save_ads_data(df, file_path=None):
+def day01_save_ads_data(df, file_path=None, output_format=None):
     """
-    Save Google Ads data to CSV.
+    Save Google Ads data to Parquet (typed with day01_ADS_SCHEMA) or CSV.
 
     Args:
         df (pd.DataFrame): Ads data to save
-        file_path (str): Path to save CSV file
+        file_path (str): Raw output path (extension follows output_format)
+        output_format (str): 'parquet' or 'csv' (defaults to config)
     """
-    if file_path is None:
-        file_path = config.day01_ADS_SYNTHETIC_FILE
-
-    # Ensure directory exists
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    output_format = output_format or config.day01_OUTPUT_FORMAT
+    file_path = day01_output_path(file_path or config.day01_ADS_SYNTHETIC_FILE, output_format)
 
-    df.to_csv(file_path, index=False)
+    day01_write_chunks([df], file_path, output_format, bq_schema=config.day01_ADS_SCHEMA)
     print(f"💾 Saved synthetic Google Ads data to: {file_path}")
 
-    # Also save to processed directory
-    processed_path = config.day01_ADS_PROCESSED_FILE
-    os.makedirs(os.path.dirname(processed_path), exist_ok=True)
-    df.to_csv(processed_path, index=False)
+    # Publish the same file to the processed directory (no second serialization)
+    processed_path = day01_output_path(config.day01_ADS_PROCESSED_FILE, output_format)
+    day01_copy_output(file_path, processed_path)
+    print(f"💾 Saved processed data to: {processed_path}")
+
+
+def day01_save_ads_chunks(chunks, output_format=None, file_path=None):
+    """
+    Stream synthetic Google Ads chunks to disk without holding the dataset in memory.
+
+    Args:
+        chunks (iterable): DataFrames from day01_iter_ads_synthetic_chunks
+        output_format (str): 'parquet' or 'csv' (defaults to config)
+        file_path (str): Raw output path (extension follows output_format)
+
+    Returns:
+        pd.DataFrame: Per-campaign summary for day01_show_ads_summary
+    """
+    output_format = output_format or config.day01_OUTPUT_FORMAT
+    file_path = day01_output_path(file_path or config.day01_ADS_SYNTHETIC_FILE, output_format)
+    summaries = []
+
+    rows = day01_write_chunks(
+        chunks, file_path, output_format,
+        on_chunk=lambda chunk: summaries.append(day01_summarize_ads(chunk)),
+        bq_schema=config.day01_ADS_SCHEMA
+    )
+    print(f"💾 Saved {rows:,} rows of synthetic Google Ads data to: {file_path}")
+
+    processed_path = day01_output_path(config.day01_ADS_PROCESSED_FILE, output_format)
+    day01_copy_output(file_path, processed_path)
     print(f"💾 Saved processed data to: {processed_path}")
 
+    return day01_combine_summaries(summaries, day01_ADS_SUMMARY_SUMS)
+
+
+def day01_summarize_ads(df):
+    """Per-campaign totals of Google Ads rows (combinable across chunks)."""
+    return df.groupby('campaign_name', sort=False).agg(
+        spend=('spend', 'sum'),
+        clicks=('clicks', 'sum'),
+        impressions=('impressions', 'sum'),
+        conversions=('conversions', 'sum'),
+        rows=('date', 'size'),
+        date_min=('date', 'min'),
+        date_max=('date', 'max')
+    )
+
+
+def day01_show_ads_summary(summary):
+    """
+    Display summary statistics of the generated data.
+
+    Args:
+        summary (pd.DataFrame): Output of day01_summarize_ads / day01_save_ads_chunks
+    """
+    spend = summary['spend'].sum()
+    clicks = summary['clicks'].sum()
+    conversions = summary['conversions'].sum()
 
-def day01_show_ads_summary(df):
-    """Display summary statistics of the generated data."""
     print("\n" + "="*60)
     print("📊 GOOGLE ADS SYNTHETIC DATA SUMMARY")
     print("="*60)
-    print(f"Total rows: {len(df)}")
-    print(f"Date range: {df['date'].min()} to {df['date'].max()}")
-    print(f"Campaigns: {df['campaign_name'].nunique()}")
+    print(f"Total rows: {summary['rows'].sum():,}")
+    print(f"Date range: {summary['date_min'].min()} to {summary['date_max'].max()}")
+    print(f"Campaigns: {len(summary)}")
     print(f"\nCampaigns list:")
-    for campaign in df['campaign_name'].unique():
+    for campaign in summary.index[:20]:
         print(f"  - {campaign}")
+    if len(summary) > 20:
+        print(f"  ... and {len(summary) - 20} more")
     print(f"\nMetrics summary:")
-    print(f"  Total Spend: ${df['spend'].sum():,.2f}")
-    print(f"  Total Impressions: {df['impressions'].sum():,}")
-    print(f"  Total Clicks: {df['clicks'].sum():,}")
-    print(f"  Total Conversions: {df['conversions'].sum():,}")
-    print(f"  Avg CTR: {(df['clicks'].sum() / df['impressions'].sum() * 100):.2f}%")
-    print(f"  Avg Conversion Rate: {(df['conversions'].sum() / df['clicks'].sum() * 100):.2f}%")
-    print(f"  Cost per Click: ${df['spend'].sum() / df['clicks'].sum():.2f}")
-    print(f"  Cost per Conversion: ${df['spend'].sum() / df['conversions'].sum():.2f}")
+    print(f"  Total Spend: ${spend:,.2f}")
+    print(f"  Total Impressions: {summary['impressions'].sum():,}")
+    print(f"  Total Clicks: {clicks:,}")
+    print(f"  Total Conversions: {conversions:,}")
+    print(f"  Avg CTR: {(clicks / summary['impressions'].sum() * 100):.2f}%")
+    print(f"  Avg Conversion Rate: {(conversions / clicks * 100):.2f}%")
+    print(f"  Cost per Click: ${spend / clicks:.2f}")
+    print(f"  Cost per Conversion: ${spend / conversions:.2f}")
     print("="*60 + "\n")
 
 
 if __name__ == '__main__':
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(description='Generate synthetic Google Ads data')
+    parser.add_argument('--days', type=int, default=config.day01_SYNTHETIC_DAYS,
+                       help='Days of synthetic data to generate')
+    parser.add_argument('--campaigns', type=int, default=config.day01_NUM_CAMPAIGNS,
+                       help='Number of campaigns to simulate')
+    parser.add_argument('--chunk-days', type=int, default=config.day01_SYNTHETIC_CHUNK_DAYS,
+                       help='Days generated and written per chunk')
+    parser.add_argument('--format', choices=day01_OUTPUT_FORMATS, default=config.day01_OUTPUT_FORMAT,
+                       help='Output file format')
+    parser.add_argument('--seed', type=int, default=config.day01_SYNTHETIC_SEED,
+                       help='Random seed for reproducible data')
+    args = parser.parse_args()
+
     try:
         print("\n" + "="*60)
         print("🚀 DAY 01 - GOOGLE ADS DATA EXTRACTION (SYNTHETIC)")
         print("="*60 + "\n")
 
-        # Generate synthetic data
-        df_ads = day01_generate_ads_synthetic_data()
-
-        # Save to files
-        day01_save_ads_data(df_ads)
+        # Generate synthetic data and stream it to files
+        print(f"🔄 Generating {args.days} days of synthetic Google Ads data for {args.campaigns} campaigns "
+              f"({args.chunk_days} days per chunk, {args.format})...")
+        chunks = day01_iter_ads_synthetic_chunks(
+            args.days, num_campaigns=args.campaigns, chunk_days=args.chunk_days, seed=args.seed
+        )
+        summary = day01_save_ads_chunks(chunks, output_format=args.format)
 
         # Show summary
-        day01_show_ads_summary(df_ads)
+        day01_show_ads_summary(summary)
 
         print("✅ Google Ads data extraction completed successfully!\n")
         print("Next steps:")
@@ -9,6 +9,9 @@ Usage:
 
     # Force synthetic data:
     python day01_DATA_extract_ga4.py --synthetic
+
+    # Large synthetic dataset, streamed to Parquet in yearly chunks:
+    python day01_DATA_extract_ga4.py --synthetic --days 20000 --sources 200 --format parquet
 """
 
 import pandas as pd
@@ -20,94 +23,140 @@ import argparse
 
 # Import day01 configuration
 import day01_CONFIG_settings as config
+from day01_DATA_io import (
+    day01_OUTPUT_FORMATS,
+    day01_combine_summaries,
+    day01_copy_output,
+    day01_output_path,
+    day01_write_chunks,
+)
+from day01_DATA_extractor import day01_create_ga4_client, day01_extract_concurrently
+
+# Summary columns added up across chunks
+day01_GA4_SUMMARY_SUMS = ['sessions', 'conversions', 'bounce_rate_sum', 'rows']
 
 
-def day01_extract_ga4_real():
+def day01_extract_ga4_real(days=None):
     """
     Attempt to extract real GA4 data from Demo Account.
 
+    The date range is split into chunks that are fetched concurrently and
+    paged through (limit/offset), so large properties are not truncated.
+
+    Args:
+        days (int): Days to extract, ending today
+
     Returns:
         pd.DataFrame or None: GA4 data if successful, None if failed
     """
+    if days is None:
+        days = config.day01_SYNTHETIC_DAYS
+
     print("🔄 Attempting to connect to GA4 Demo Account...")
     print(f"   Property ID: {config.day01_GA4_PROPERTY_ID}")
 
     try:
-        from google.analytics.data_v1beta import BetaAnalyticsDataClient
-        from google.analytics.data_v1beta.types import (
-            DateRange,
-            Dimension,
-            Metric,
-            RunReportRequest,
-        )
-        from google.oauth2 import service_account
-
-        # Check if credentials file exists
-        if not os.path.exists(config.day01_GA4_CREDENTIALS_PATH):
-            print(f"⚠️  Credentials file not found: {config.day01_GA4_CREDENTIALS_PATH}")
+        client = day01_create_ga4_client()
+        if client is None:
             print("   Pivoting to synthetic data...")
             return None
 
-        # Load credentials
-        credentials = service_account.Credentials.from_service_account_file(
-            config.day01_GA4_CREDENTIALS_PATH
-        )
-
-        client = BetaAnalyticsDataClient(credentials=credentials)
-
-        # Build request for last 30 days
-        request = RunReportRequest(
-            property=f"properties/{config.day01_GA4_PROPERTY_ID}",
-            dimensions=[
-                Dimension(name="date"),
-                Dimension(name="sessionSource"),
-            ],
-            metrics=[
-                Metric(name="sessions"),
-                Metric(name="conversions"),
-                Metric(name="bounceRate"),
-            ],
-            date_ranges=[DateRange(start_date="30daysAgo", end_date="today")],
+        end_date = datetime.now().date()
+        df, _, stats = day01_extract_concurrently(
+            client, end_date - timedelta(days=days), end_date, ads_fetch=None
         )
 
-        response = client.run_report(request)
-
-        # Parse response
-        data = []
-        for row in response.rows:
-            data.append({
-                'date': row.dimension_values[0].value,
-                'source': row.dimension_values[1].value,
-                'sessions': int(row.metric_values[0].value),
-                'conversions': int(row.metric_values[1].value),
-                'bounce_rate': float(row.metric_values[2].value),
-            })
-
-        df = pd.DataFrame(data)
-
-        # Format date
-        df['date'] = pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d')
-
-        print(f"✅ Successfully extracted {len(df)} rows from GA4")
+        print(f"✅ Successfully extracted {len(df)} rows from GA4 "
+              f"({stats['chunks']} chunks, {stats['ga4_calls']} requests, {stats['retries']} retries)")
         return df
 
-    except ImportError:
-        print("⚠️  Google Analytics Data API library not installed")
-        print("   Run: pip install google-analytics-data")
-        print("   Pivoting to synthetic data...")
-        return None
     except Exception as e:
         print(f"⚠️  Failed to extract GA4 data: {str(e)}")
         print("   Pivoting to synthetic data...")
         return None
 
 
-def day01_generate_ga4_synthetic_data(days=None):
+def day01_ga4_source_names(num_sources=None):
+    """
+    Traffic sources to simulate: the configured ones, then source_NNN names.
+
+    Args:
+        num_sources (int): Number of sources (defaults to the configured list)
+
+    Returns:
+        list: Source names
+    """
+    sources = list(config.day01_TRAFFIC_SOURCES)
+    if num_sources is None:
+        return sources
+    return sources[:num_sources] + [f'source_{i:03d}' for i in range(len(sources) + 1, num_sources + 1)]
+
+
+def day01_iter_ga4_synthetic_chunks(days=None, num_sources=None, chunk_days=None, seed=None):
+    """
+    Generate synthetic GA4 session data in chunks of whole days.
+
+    Every metric is drawn as one array per chunk (days x sources), so the
+    cost is a handful of NumPy calls per chunk instead of several per row.
+
+    Args:
+        days (int): Number of days of historical data to generate
+        num_sources (int): Number of traffic sources
+        chunk_days (int): Days per yielded chunk
+        seed (int): Random seed (None for non-reproducible data)
+
+    Yields:
+        pd.DataFrame: Rows ordered by date, then source
+    """
+    if days is None:
+        days = config.day01_SYNTHETIC_DAYS
+    if chunk_days is None:
+        chunk_days = config.day01_SYNTHETIC_CHUNK_DAYS
+
+    rng = np.random.default_rng(seed)
+    sources = np.array(day01_ga4_source_names(num_sources))
+    multipliers = np.array([
+        config.day01_GA4_SOURCE_MULTIPLIERS.get(source, config.day01_GA4_DEFAULT_SOURCE_MULTIPLIER)
+        for source in sources
+    ])
+    start_date = pd.Timestamp(datetime.now() - timedelta(days=days)).normalize()
+
+    for first_day in range(0, days, max(1, chunk_days)):
+        n_days = min(chunk_days, days - first_day)
+        shape = (n_days, len(sources))
+
+        dates = pd.date_range(start_date + pd.Timedelta(days=first_day), periods=n_days, freq='D')
+
+        # Realistic session counts, adjusted by source (Google gets more traffic)
+        base_sessions = rng.uniform(config.day01_GA4_SESSIONS_MIN, config.day01_GA4_SESSIONS_MAX, shape)
+        sessions = (base_sessions * multipliers).astype(np.int64)
+
+        # Conversion rate: 2-5% of sessions
+        conversion_rate = rng.uniform(
+            config.day01_GA4_CONVERSION_RATE_MIN, config.day01_GA4_CONVERSION_RATE_MAX, shape
+        )
+        conversions = (sessions * conversion_rate).astype(np.int64)
+
+        # Bounce rate: 35-55%
+        bounce_rate = rng.uniform(config.day01_GA4_BOUNCE_RATE_MIN, config.day01_GA4_BOUNCE_RATE_MAX, shape)
+
+        yield pd.DataFrame({
+            'date': np.repeat(dates.strftime('%Y-%m-%d'), len(sources)),
+            'sessions': sessions.ravel(),
+            'conversions': conversions.ravel(),
+            'bounce_rate': np.round(bounce_rate.ravel(), 4),
+            'source': np.tile(sources, n_days)
+        })
+
+
+def day01_generate_ga4_synthetic_data(days=None, num_sources=None, seed=None):
     """
     Generate synthetic GA4 session data.
 
     Args:
         days (int): Number of days of historical data to generate
+        num_sources (int): Number of traffic sources
+        seed (int): Random seed (None for non-reproducible data)
 
     Returns:
         pd.DataFrame: Synthetic GA4 data with realistic metrics
@@ -117,98 +166,103 @@ def day01_generate_ga4_synthetic_data(days=None):
 
     print(f"🔄 Generating {days} days of synthetic GA4 data...")
 
-    data = []
-    start_date = datetime.now() - timedelta(days=days)
-
-    for i in range(days):
-        date = start_date + timedelta(days=i)
-
-        # Generate data for each traffic source
-        for source in config.day01_TRAFFIC_SOURCES:
-            # Generate realistic session counts (varies by source)
-            base_sessions = np.random.uniform(
-                config.day01_GA4_SESSIONS_MIN,
-                config.day01_GA4_SESSIONS_MAX
-            )
-
-            # Adjust by source (Google gets more traffic)
-            if source == 'google':
-                sessions = int(base_sessions * 1.5)
-            elif source == 'direct':
-                sessions = int(base_sessions * 1.2)
-            elif source == 'facebook':
-                sessions = int(base_sessions * 0.8)
-            else:
-                sessions = int(base_sessions * 0.5)
-
-            # Conversion rate: 2-5% of sessions
-            conversion_rate = np.random.uniform(
-                config.day01_GA4_CONVERSION_RATE_MIN,
-                config.day01_GA4_CONVERSION_RATE_MAX
-            )
-            conversions = int(sessions * conversion_rate)
-
-            # Bounce rate: 35-55%
-            bounce_rate = np.random.uniform(
-                config.day01_GA4_BOUNCE_RATE_MIN,
-                config.day01_GA4_BOUNCE_RATE_MAX
-            )
-
-            data.append({
-                'date': date.strftime('%Y-%m-%d'),
-                'sessions': sessions,
-                'conversions': conversions,
-                'bounce_rate': round(bounce_rate, 4),
-                'source': source
-            })
-
-    df = pd.DataFrame(data)
+    df = pd.concat(
+        day01_iter_ga4_synthetic_chunks(days, num_sources=num_sources, seed=seed),
+        ignore_index=True
+    )
     print(f"✅ Generated {len(df)} rows of synthetic GA4 data")
     return df
 
 
-def day01_save_ga4_data(df, file_path=None, is_synthetic=True):
+def day01_save_ga4_data(df, file_path=None, is_synthetic=True, output_format=None):
     """
-    Save GA4 data to CSV.
+    Save GA4 data to Parquet (typed with day01_GA4_SCHEMA) or CSV.
 
     Args:
         df (pd.DataFrame): GA4 data to save
-        file_path (str): Path to save CSV file
+        file_path (str): Raw output path (extension follows output_format)
         is_synthetic (bool): Whether data is synthetic or real
+        output_format (str): 'parquet' or 'csv' (defaults to config)
     """
+    output_format = output_format or config.day01_OUTPUT_FORMAT
     if file_path is None:
         file_path = config.day01_GA4_SYNTHETIC_FILE if is_synthetic else config.day01_RAW_DATA_DIR + '/ga4_real.csv'
+    file_path = day01_output_path(file_path, output_format)
 
-    # Ensure directory exists
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-
-    df.to_csv(file_path, index=False)
+    day01_write_chunks([df], file_path, output_format, bq_schema=config.day01_GA4_SCHEMA)
     print(f"💾 Saved {'synthetic' if is_synthetic else 'real'} GA4 data to: {file_path}")
 
-    # Also save to processed directory
-    processed_path = config.day01_GA4_PROCESSED_FILE
-    os.makedirs(os.path.dirname(processed_path), exist_ok=True)
-    df.to_csv(processed_path, index=False)
+    # Publish the same file to the processed directory (no second serialization)
+    processed_path = day01_output_path(config.day01_GA4_PROCESSED_FILE, output_format)
+    day01_copy_output(file_path, processed_path)
     print(f"💾 Saved processed data to: {processed_path}")
 
 
-def day01_show_ga4_summary(df):
-    """Display summary statistics of the extracted/generated data."""
+def day01_save_ga4_chunks(chunks, output_format=None, file_path=None):
+    """
+    Stream synthetic GA4 chunks to disk without holding the dataset in memory.
+
+    Args:
+        chunks (iterable): DataFrames from day01_iter_ga4_synthetic_chunks
+        output_format (str): 'parquet' or 'csv' (defaults to config)
+        file_path (str): Raw output path (extension follows output_format)
+
+    Returns:
+        pd.DataFrame: Per-source summary for day01_show_ga4_summary
+    """
+    output_format = output_format or config.day01_OUTPUT_FORMAT
+    file_path = day01_output_path(file_path or config.day01_GA4_SYNTHETIC_FILE, output_format)
+    summaries = []
+
+    rows = day01_write_chunks(
+        chunks, file_path, output_format,
+        on_chunk=lambda chunk: summaries.append(day01_summarize_ga4(chunk)),
+        bq_schema=config.day01_GA4_SCHEMA
+    )
+    print(f"💾 Saved {rows:,} rows of synthetic GA4 data to: {file_path}")
+
+    processed_path = day01_output_path(config.day01_GA4_PROCESSED_FILE, output_format)
+    day01_copy_output(file_path, processed_path)
+    print(f"💾 Saved processed data to: {processed_path}")
+
+    return day01_combine_summaries(summaries, day01_GA4_SUMMARY_SUMS)
+
+
+def day01_summarize_ga4(df):
+    """Per-source totals of GA4 rows (combinable across chunks)."""
+    return df.groupby('source', sort=False).agg(
+        sessions=('sessions', 'sum'),
+        conversions=('conversions', 'sum'),
+        bounce_rate_sum=('bounce_rate', 'sum'),
+        rows=('date', 'size'),
+        date_min=('date', 'min'),
+        date_max=('date', 'max')
+    )
+
+
+def day01_show_ga4_summary(summary):
+    """
+    Display summary statistics of the extracted/generated data.
+
+    Args:
+        summary (pd.DataFrame): Output of day01_summarize_ga4 / day01_save_ga4_chunks
+    """
     print("\n" + "="*60)
     print("📊 GA4 DATA SUMMARY")
     print("="*60)
-    print(f"Total rows: {len(df)}")
-    print(f"Date range: {df['date'].min()} to {df['date'].max()}")
-    print(f"Traffic sources: {df['source'].nunique()}")
+    print(f"Total rows: {summary['rows'].sum():,}")
+    print(f"Date range: {summary['date_min'].min()} to {summary['date_max'].max()}")
+    print(f"Traffic sources: {len(summary)}")
     print(f"\nSources list:")
-    for source in df['source'].unique():
-        source_data = df[df['source'] == source]
-        print(f"  - {source}: {source_data['sessions'].sum():,} sessions")
+    for source, sessions in summary['sessions'].head(20).items():
+        print(f"  - {source}: {sessions:,} sessions")
+    if len(summary) > 20:
+        print(f"  ... and {len(summary) - 20} more")
     print(f"\nMetrics summary:")
-    print(f"  Total Sessions: {df['sessions'].sum():,}")
-    print(f"  Total Conversions: {df['conversions'].sum():,}")
-    print(f"  Avg Conversion Rate: {(df['conversions'].sum() / df['sessions'].sum() * 100):.2f}%")
-    print(f"  Avg Bounce Rate: {df['bounce_rate'].mean():.2%}")
+    print(f"  Total Sessions: {summary['sessions'].sum():,}")
+    print(f"  Total Conversions: {summary['conversions'].sum():,}")
+    print(f"  Avg Conversion Rate: {(summary['conversions'].sum() / summary['sessions'].sum() * 100):.2f}%")
+    print(f"  Avg Bounce Rate: {summary['bounce_rate_sum'].sum() / summary['rows'].sum():.2%}")
     print("="*60 + "\n")
 
 
@@ -217,20 +271,39 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Extract GA4 data')
     parser.add_argument('--synthetic', action='store_true',
                        help='Force use of synthetic data (skip GA4 API attempt)')
+    parser.add_argument('--days', type=int, default=config.day01_SYNTHETIC_DAYS,
+                       help='Days of synthetic data to generate')
+    parser.add_argument('--sources', type=int, default=None,
+                       help='Number of synthetic traffic sources (default: configured list)')
+    parser.add_argument('--chunk-days', type=int, default=config.day01_SYNTHETIC_CHUNK_DAYS,
+                       help='Days generated and written per chunk')
+    parser.add_argument('--format', choices=day01_OUTPUT_FORMATS, default=config.day01_OUTPUT_FORMAT,
+                       help='Output file format for synthetic data')
+    parser.add_argument('--seed', type=int, default=config.day01_SYNTHETIC_SEED,
+                       help='Random seed for reproducible synthetic data')
     args = parser.parse_args()
 
+    def day01_stream_synthetic():
+        """Generate and save synthetic data chunk by chunk."""
+        print(f"🔄 Generating {args.days} days of synthetic GA4 data "
+              f"({args.chunk_days} days per chunk, {args.format})...")
+        chunks = day01_iter_ga4_synthetic_chunks(
+            args.days, num_sources=args.sources, chunk_days=args.chunk_days, seed=args.seed
+        )
+        return day01_save_ga4_chunks(chunks, output_format=args.format)
+
     try:
         print("\n" + "="*60)
         print("🚀 DAY 01 - GA4 DATA EXTRACTION")
         print("="*60 + "\n")
 
-        df_ga4 = None
+        summary = None
         is_synthetic = False
 
         # Check config flag or command line argument
         if config.day01_USE_SYNTHETIC_DATA or args.synthetic:
             print("📋 Using synthetic data (configured or forced)")
-            df_ga4 = day01_generate_ga4_synthetic_data()
+            summary = day01_stream_synthetic()
             is_synthetic = True
         else:
             # Try real GA4 first
@@ -239,14 +312,14 @@ if __name__ == '__main__':
             if df_ga4 is None:
                 # Fall back to synthetic
                 print("\n⚠️  PIVOT: Switching to synthetic data generation")
-                df_ga4 = day01_generate_ga4_synthetic_data()
+                summary = day01_stream_synthetic()
                 is_synthetic = True
-
-        # Save data
-        day01_save_ga4_data(df_ga4, is_synthetic=is_synthetic)
+            else:
+                day01_save_ga4_data(df_ga4, is_synthetic=False)
+                summary = day01_summarize_ga4(df_ga4)
 
         # Show summary
-        day01_show_ga4_summary(df_ga4)
+        day01_show_ga4_summary(summary)
 
         print("✅ GA4 data extraction completed successfully!\n")
         print("Next steps:")
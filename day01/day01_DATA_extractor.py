@@ -0,0 +1,336 @@
+"""
+Day 01 - Concurrent GA4 + Google Ads Extractor
+Splits long date ranges into chunks, pages through GA4 run_report results
+(limit/offset) and runs GA4 and Ads chunks concurrently in a bounded pool.
+
+Usage:
+    python day01_DATA_extractor.py --days 365
+
+    # Smaller chunks, more workers:
+    python day01_DATA_extractor.py --days 365 --chunk-days 14 --workers 6
+"""
+
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+
+import pandas as pd
+
+# Import day01 configuration
+import day01_CONFIG_settings as config
+
+
+# HTTP status codes of retryable GA4 errors (google.api_core exceptions carry .code)
+day01_RETRYABLE_STATUS = {429, 500, 503}
+
+day01_GA4_DIMENSIONS = ['date', 'sessionSource']
+day01_GA4_METRICS = ['sessions', 'conversions', 'bounceRate']
+
+
+class Day01QuotaBackoff:
+    """
+    Backoff shared by every worker calling the same GA4 property.
+
+    A quota error pauses all workers (not just the one that hit it), and
+    responses reporting a low hourly token balance slow everyone down.
+    """
+
+    def __init__(self, max_retries=None, base_seconds=None, min_tokens=None, sleep=time.sleep):
+        self.max_retries = config.day01_GA4_MAX_RETRIES if max_retries is None else max_retries
+        self.base_seconds = config.day01_GA4_BACKOFF_SECONDS if base_seconds is None else base_seconds
+        self.min_tokens = config.day01_GA4_MIN_TOKENS_REMAINING if min_tokens is None else min_tokens
+        self.sleep = sleep
+
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        self.stats = {'retries': 0, 'quota_pauses': 0, 'waited_seconds': 0.0}
+
+    def wait(self):
+        """Block while a shared pause is active."""
+        with self._lock:
+            delay = self._paused_until - time.monotonic()
+        if delay > 0:
+            self.sleep(delay)
+            with self._lock:
+                self.stats['waited_seconds'] += delay
+
+    def on_error(self, error, attempt):
+        """
+        Decide whether to retry a failed call, pausing all workers if so.
+
+        Args:
+            error (Exception): Error raised by run_report
+            attempt (int): 0-based attempt number
+
+        Returns:
+            bool: True to retry
+        """
+        if getattr(error, 'code', None) not in day01_RETRYABLE_STATUS or attempt >= self.max_retries:
+            return False
+
+        delay = self.base_seconds * (2 ** attempt) * random.uniform(1.0, 1.5)
+        self._pause(delay)
+        with self._lock:
+            self.stats['retries'] += 1
+        return True
+
+    def on_response(self, response):
+        """Slow down when the response reports few hourly tokens left."""
+        quota = getattr(response, 'property_quota', None)
+        tokens = getattr(quota, 'tokens_per_hour', None) if quota is not None else None
+        remaining = getattr(tokens, 'remaining', None)
+
+        if remaining is not None and remaining < self.min_tokens:
+            self._pause(config.day01_GA4_LOW_QUOTA_PAUSE_SECONDS)
+            with self._lock:
+                self.stats['quota_pauses'] += 1
+
+    def _pause(self, seconds):
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+def day01_date_chunks(start_date, end_date, chunk_days=None):
+    """
+    Split an inclusive date range into consecutive chunks.
+
+    Args:
+        start_date (date): First day
+        end_date (date): Last day (inclusive)
+        chunk_days (int): Days per chunk
+
+    Returns:
+        list: (chunk_start, chunk_end) date tuples
+    """
+    if chunk_days is None:
+        chunk_days = config.day01_EXTRACT_CHUNK_DAYS
+    chunk_days = max(1, chunk_days)
+
+    chunks = []
+    chunk_start = start_date
+    while chunk_start <= end_date:
+        chunk_end = min(end_date, chunk_start + timedelta(days=chunk_days - 1))
+        chunks.append((chunk_start, chunk_end))
+        chunk_start = chunk_end + timedelta(days=1)
+    return chunks
+
+
+def day01_run_report_paged(client, start_date, end_date, backoff, page_size=None, property_id=None):
+    """
+    Fetch every row of a GA4 report for one date range.
+
+    Pages with limit/offset until response.row_count rows are read, so
+    large properties are no longer truncated to the first page. Rows are
+    ordered by every dimension: without order_bys GA4 does not guarantee a
+    stable order between requests, and pages could skip or repeat rows.
+
+    Args:
+        client: BetaAnalyticsDataClient (or a fake with run_report)
+        start_date (date): First day
+        end_date (date): Last day (inclusive)
+        backoff (Day01QuotaBackoff): Shared retry / quota state
+        page_size (int): Rows per request
+        property_id (str): GA4 property ID
+
+    Returns:
+        tuple: (DataFrame of rows, number of run_report calls)
+    """
+    page_size = page_size or config.day01_GA4_PAGE_SIZE
+    property_id = property_id or config.day01_GA4_PROPERTY_ID
+
+    rows = []
+    calls = 0
+    offset = 0
+
+    while True:
+        # A plain dict is accepted by the GAPIC client in place of RunReportRequest
+        request = {
+            'property': f"properties/{property_id}",
+            'dimensions': [{'name': name} for name in day01_GA4_DIMENSIONS],
+            'metrics': [{'name': name} for name in day01_GA4_METRICS],
+            'date_ranges': [{'start_date': start_date.isoformat(), 'end_date': end_date.isoformat()}],
+            'order_bys': [{'dimension': {'dimension_name': name}} for name in day01_GA4_DIMENSIONS],
+            'limit': page_size,
+            'offset': offset,
+            'return_property_quota': True,
+        }
+
+        attempt = 0
+        while True:
+            backoff.wait()
+            try:
+                response = client.run_report(request)
+                calls += 1
+                break
+            except Exception as e:
+                if not backoff.on_error(e, attempt):
+                    raise
+                attempt += 1
+
+        backoff.on_response(response)
+
+        for row in response.rows:
+            rows.append({
+                'date': row.dimension_values[0].value,
+                'source': row.dimension_values[1].value,
+                'sessions': int(row.metric_values[0].value),
+                'conversions': int(float(row.metric_values[1].value)),
+                'bounce_rate': float(row.metric_values[2].value),
+            })
+
+        offset += len(response.rows)
+        if not response.rows or offset >= response.row_count:
+            break
+
+    df = pd.DataFrame(rows, columns=['date', 'source', 'sessions', 'conversions', 'bounce_rate'])
+    df['date'] = pd.to_datetime(df['date'], format='%Y%m%d').dt.strftime('%Y-%m-%d')
+    return df, calls
+
+
+def day01_synthetic_ads_range(start_date, end_date):
+    """Google Ads rows for one date range (no free Ads sandbox: synthetic)."""
+    from day01_DATA_extract_ads import day01_iter_ads_synthetic_chunks
+
+    days = (end_date - start_date).days + 1
+    return pd.concat(
+        day01_iter_ads_synthetic_chunks(days, chunk_days=days, start_date=start_date),
+        ignore_index=True
+    )
+
+
+def day01_extract_concurrently(ga4_client, start_date, end_date, chunk_days=None, max_workers=None,
+                               ads_fetch=day01_synthetic_ads_range, backoff=None, page_size=None):
+    """
+    Extract GA4 and Google Ads data for a date range, chunk by chunk, in parallel.
+
+    Args:
+        ga4_client: GA4 client (None to skip GA4)
+        start_date (date): First day
+        end_date (date): Last day (inclusive)
+        chunk_days (int): Days per chunk
+        max_workers (int): Thread pool size (bounds concurrent GA4 requests)
+        ads_fetch (callable): (start_date, end_date) -> Ads DataFrame (None to skip Ads)
+        backoff (Day01QuotaBackoff): Shared retry / quota state
+        page_size (int): GA4 rows per request
+
+    Returns:
+        tuple: (ga4_df, ads_df, stats dict)
+    """
+    max_workers = max_workers or config.day01_EXTRACT_MAX_WORKERS
+    backoff = backoff or Day01QuotaBackoff()
+    chunks = day01_date_chunks(start_date, end_date, chunk_days)
+
+    results = {'ga4': {}, 'ads': {}}
+    stats = {'chunks': len(chunks), 'ga4_calls': 0, 'chunk_seconds': 0.0}
+    started = time.perf_counter()
+
+    def run_chunk(kind, chunk_start, chunk_end):
+        chunk_started = time.perf_counter()
+        if kind == 'ga4':
+            df, calls = day01_run_report_paged(ga4_client, chunk_start, chunk_end, backoff, page_size=page_size)
+        else:
+            df, calls = ads_fetch(chunk_start, chunk_end), 0
+        return df, calls, time.perf_counter() - chunk_started
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for chunk_start, chunk_end in chunks:
+            if ga4_client is not None:
+                futures[executor.submit(run_chunk, 'ga4', chunk_start, chunk_end)] = ('ga4', chunk_start)
+            if ads_fetch is not None:
+                futures[executor.submit(run_chunk, 'ads', chunk_start, chunk_end)] = ('ads', chunk_start)
+
+        for future in as_completed(futures):
+            kind, chunk_start = futures[future]
+            df, calls, seconds = future.result()
+            results[kind][chunk_start] = df
+            stats['ga4_calls'] += calls
+            stats['chunk_seconds'] += seconds
+
+    stats['wall_seconds'] = time.perf_counter() - started
+    stats.update(backoff.stats)
+
+    # Reassemble in date order regardless of completion order
+    frames = {
+        kind: pd.concat([parts[key] for key in sorted(parts)], ignore_index=True) if parts else None
+        for kind, parts in results.items()
+    }
+    return frames['ga4'], frames['ads'], stats
+
+
+def day01_create_ga4_client():
+    """
+    Create a GA4 Data API client from the configured service account.
+
+    Returns:
+        BetaAnalyticsDataClient or None if the library or credentials are missing
+    """
+    try:
+        from google.analytics.data_v1beta import BetaAnalyticsDataClient
+        from google.oauth2 import service_account
+    except ImportError:
+        print("⚠️  Google Analytics Data API library not installed")
+        print("   Run: pip install google-analytics-data")
+        return None
+
+    if not os.path.exists(config.day01_GA4_CREDENTIALS_PATH):
+        print(f"⚠️  Credentials file not found: {config.day01_GA4_CREDENTIALS_PATH}")
+        return None
+
+    credentials = service_account.Credentials.from_service_account_file(
+        config.day01_GA4_CREDENTIALS_PATH
+    )
+    return BetaAnalyticsDataClient(credentials=credentials)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Extract GA4 + Google Ads data concurrently')
+    parser.add_argument('--days', type=int, default=config.day01_SYNTHETIC_DAYS,
+                       help='Days to extract (ending today)')
+    parser.add_argument('--chunk-days', type=int, default=config.day01_EXTRACT_CHUNK_DAYS,
+                       help='Days per GA4 / Ads chunk')
+    parser.add_argument('--workers', type=int, default=config.day01_EXTRACT_MAX_WORKERS,
+                       help='Concurrent chunk requests')
+    args = parser.parse_args()
+
+    try:
+        from day01_DATA_extract_ads import day01_save_ads_data
+        from day01_DATA_extract_ga4 import day01_save_ga4_data
+
+        print("\n" + "="*60)
+        print("🚀 DAY 01 - CONCURRENT GA4 + GOOGLE ADS EXTRACTION")
+        print("="*60 + "\n")
+
+        end_date = date.today()
+        start_date = end_date - timedelta(days=args.days)
+
+        print(f"🔄 Connecting to GA4 property {config.day01_GA4_PROPERTY_ID}...")
+        ga4_client = day01_create_ga4_client()
+        if ga4_client is None:
+            print("   Extracting Google Ads only (use day01_DATA_extract_ga4.py for synthetic GA4 data)")
+
+        ga4_df, ads_df, stats = day01_extract_concurrently(
+            ga4_client, start_date, end_date,
+            chunk_days=args.chunk_days, max_workers=args.workers
+        )
+
+        if ga4_df is not None:
+            day01_save_ga4_data(ga4_df, is_synthetic=False)
+        day01_save_ads_data(ads_df)
+
+        print(f"\n✅ Extracted {start_date} to {end_date} in {stats['chunks']} chunks "
+              f"({stats['wall_seconds']:.1f}s wall, {stats['chunk_seconds']:.1f}s of chunk work)")
+        print(f"   GA4 rows: {0 if ga4_df is None else len(ga4_df):,} ({stats['ga4_calls']} run_report calls, "
+              f"{stats['retries']} retries, {stats['quota_pauses']} low-quota pauses)")
+        print(f"   Ads rows: {len(ads_df):,}")
+
+    except Exception as e:
+        print(f"\n❌ ERROR: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
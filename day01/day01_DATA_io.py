@@ -0,0 +1,196 @@
+"""
+Day 01 - Chunked File Output
+Streams DataFrame chunks to CSV or Parquet so large synthetic datasets
+never have to be held in memory at once.
+
+Parquet files are written with the column types of the BigQuery schemas
+in day01_CONFIG_settings (DATE -> date32, INTEGER -> int64, ...), so
+loaders and day11 read typed columns without re-parsing dates.
+"""
+
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+
+day01_OUTPUT_FORMATS = ('csv', 'parquet')
+
+
+def day01_arrow_schema(bq_schema):
+    """
+    Build the Parquet (Arrow) schema matching a BigQuery schema.
+
+    Args:
+        bq_schema (list): Fields like {'name': 'date', 'type': 'DATE', 'mode': 'REQUIRED'}
+
+    Returns:
+        pyarrow.Schema
+    """
+    import pyarrow as pa
+
+    types = {
+        'DATE': pa.date32(),
+        'INTEGER': pa.int64(),
+        'FLOAT': pa.float64(),
+        'STRING': pa.string(),
+    }
+    return pa.schema([
+        pa.field(field['name'], types[field['type']], nullable=field.get('mode') != 'REQUIRED')
+        for field in bq_schema
+    ])
+
+
+def day01_to_arrow_table(df, arrow_schema):
+    """
+    Convert a DataFrame to an Arrow table with the given schema.
+
+    Date columns may hold ISO strings, datetimes or dates.
+
+    Args:
+        df (pd.DataFrame): Rows to convert
+        arrow_schema (pyarrow.Schema): Output of day01_arrow_schema
+
+    Returns:
+        pyarrow.Table
+    """
+    import pyarrow as pa
+
+    arrays = []
+    for field in arrow_schema:
+        values = df[field.name]
+        if pa.types.is_date32(field.type):
+            values = pd.to_datetime(values).to_numpy().astype('datetime64[D]')
+        arrays.append(pa.array(np.asarray(values), type=field.type))
+
+    return pa.Table.from_arrays(arrays, schema=arrow_schema)
+
+
+def day01_output_path(file_path, output_format):
+    """
+    Return file_path with the extension matching the output format.
+
+    Args:
+        file_path (str): Configured path (e.g. ./data/raw/ga4_synthetic.csv)
+        output_format (str): 'csv' or 'parquet'
+
+    Returns:
+        str: Path with .csv or .parquet extension
+    """
+    return os.path.splitext(file_path)[0] + f'.{output_format}'
+
+
+def day01_write_chunks(chunks, file_path, output_format='csv', on_chunk=None, bq_schema=None):
+    """
+    Write an iterable of DataFrames to a single CSV or Parquet file.
+
+    CSV chunks are appended (header written once); Parquet chunks become
+    row groups of one file. The file is written under a temporary name and
+    renamed at the end, so readers never see a partial file.
+
+    Args:
+        chunks (iterable): DataFrames with identical columns
+        file_path (str): Destination file
+        output_format (str): 'csv' or 'parquet'
+        on_chunk (callable): Optional callback receiving each chunk after it is written
+        bq_schema (list): BigQuery schema for typed Parquet columns (None: inferred)
+
+    Returns:
+        int: Total rows written
+    """
+    if output_format not in day01_OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format: {output_format} (use csv or parquet)")
+
+    os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+    tmp_path = file_path + '.tmp'
+    total_rows = 0
+    writer = None
+
+    if output_format == 'parquet':
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet output requires pyarrow. Run: pip install pyarrow")
+
+        arrow_schema = day01_arrow_schema(bq_schema) if bq_schema is not None else None
+
+    try:
+        for chunk in chunks:
+            if output_format == 'csv':
+                chunk.to_csv(tmp_path, mode='w' if total_rows == 0 else 'a',
+                             header=total_rows == 0, index=False)
+            else:
+                if arrow_schema is not None:
+                    table = day01_to_arrow_table(chunk, arrow_schema)
+                else:
+                    table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp_path, table.schema, compression='snappy')
+                writer.write_table(table)
+
+            total_rows += len(chunk)
+            if on_chunk is not None:
+                on_chunk(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if total_rows == 0:
+        raise ValueError(f"No rows to write to {file_path}")
+
+    os.replace(tmp_path, file_path)
+    return total_rows
+
+
+def day01_copy_output(source_path, destination_path):
+    """
+    Publish a written output file (e.g. raw -> processed) without re-serializing it.
+
+    Uses a hard link where the filesystem allows it, a file copy otherwise.
+    """
+    os.makedirs(os.path.dirname(destination_path) or '.', exist_ok=True)
+    tmp_path = destination_path + '.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    try:
+        os.link(source_path, tmp_path)
+    except OSError:
+        shutil.copyfile(source_path, tmp_path)
+    os.replace(tmp_path, destination_path)
+
+
+def day01_find_processed_file(csv_path):
+    """
+    Locate a processed dataset in either format.
+
+    When both a .parquet and a .csv exist, the most recently written one
+    wins, so switching DAY01_OUTPUT_FORMAT never serves stale data.
+
+    Args:
+        csv_path (str): Configured processed path (.csv)
+
+    Returns:
+        str or None: Existing path, or None if neither format exists
+    """
+    candidates = [day01_output_path(csv_path, fmt) for fmt in day01_OUTPUT_FORMATS]
+    existing = [path for path in candidates if os.path.exists(path)]
+    return max(existing, key=os.path.getmtime) if existing else None
+
+
+def day01_combine_summaries(parts, sum_columns):
+    """
+    Merge per-chunk summaries indexed by the same key.
+
+    Args:
+        parts (list): DataFrames with sum_columns plus date_min / date_max
+        sum_columns (list): Columns to add up across chunks
+
+    Returns:
+        pd.DataFrame: One row per key
+    """
+    aggregations = {column: 'sum' for column in sum_columns}
+    aggregations.update({'date_min': 'min', 'date_max': 'max'})
+    return pd.concat(parts).groupby(level=0, sort=False).agg(aggregations)
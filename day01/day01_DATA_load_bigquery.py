@@ -8,15 +8,29 @@ Usage:
     # Load specific table only:
     python day01_DATA_load_bigquery.py --table ga4
     python day01_DATA_load_bigquery.py --table ads
+
+    # Daily runs: merge only dates newer than the local watermark into
+    # date-partitioned, clustered tables (via a staging table + MERGE):
+    python day01_DATA_load_bigquery.py --mode incremental
 """
 
 import pandas as pd
+from datetime import date, timedelta
+import io
+import json
 import os
 import sys
 import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Import day01 configuration
 import day01_CONFIG_settings as config
+from day01_DATA_io import day01_arrow_schema, day01_find_processed_file, day01_to_arrow_table
+
+
+day01_WATERMARK_LOCK = threading.Lock()
 
 
 def day01_check_bigquery_available():
@@ -97,13 +111,98 @@ def day01_ensure_dataset_exists(client, dataset_id):
         return False
 
 
+def day01_submit_load_job(client, source, table_name, schema):
+    """
+    Start a load job that overwrites a table, without waiting for it.
+
+    The file is uploaded before this returns; BigQuery then runs the job
+    server-side, so several jobs can be submitted and awaited together.
+
+    Args:
+        client: BigQuery client
+        source (pd.DataFrame or str): Data to load, or path of a Parquet file
+            to upload as-is
+        table_name (str): Table name
+        schema (list): BigQuery schema
+
+    Returns:
+        bigquery.LoadJob: Running load job
+    """
+    from google.cloud import bigquery
+
+    table_id = f"{client.project}.{config.day01_BQ_DATASET}.{table_name}"
+
+    if isinstance(source, str):
+        print(f"🔄 Uploading {source} to {table_id} (Parquet)...")
+        return day01_upload_parquet(
+            client, source, table_id, schema, bigquery.WriteDisposition.WRITE_TRUNCATE, wait=False
+        )
+
+    job_config = bigquery.LoadJobConfig(
+        schema=schema,
+        write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,  # Overwrite table
+    )
+    print(f"🔄 Loading {len(source)} rows to {table_id}...")
+    return client.load_table_from_dataframe(source, table_id, job_config=job_config)
+
+
+def day01_job_stats(job):
+    """
+    Read rows, bytes and elapsed time of a finished load job from its metadata.
+
+    Args:
+        job (bigquery.LoadJob): Finished job
+
+    Returns:
+        dict: output_rows, output_bytes, input_bytes, elapsed_seconds (None if unknown)
+    """
+    elapsed = None
+    if job.started is not None and job.ended is not None:
+        elapsed = (job.ended - job.started).total_seconds()
+
+    return {
+        'output_rows': job.output_rows,
+        'output_bytes': job.output_bytes,
+        'input_bytes': job.input_file_bytes,
+        'elapsed_seconds': elapsed,
+    }
+
+
+def day01_wait_for_load_jobs(client, jobs):
+    """
+    Wait for several submitted load jobs, which run concurrently in BigQuery.
+
+    The destination row count is read from table metadata (tables.get is
+    free), not with a billed COUNT(*) query.
+
+    Args:
+        client: BigQuery client
+        jobs (dict): table name -> running bigquery.LoadJob
+
+    Returns:
+        dict: table name -> job stats plus num_rows, or None if the job failed
+    """
+    results = {}
+    for table_name, job in jobs.items():
+        try:
+            job.result()
+            stats = day01_job_stats(job)
+            stats['num_rows'] = client.get_table(job.destination).num_rows
+            results[table_name] = stats
+        except Exception as e:
+            print(f"❌ Failed to load data to BigQuery ({table_name}): {str(e)}")
+            results[table_name] = None
+    return results
+
+
 def day01_load_to_bigquery(client, df, table_name, schema):
     """
-    Load DataFrame to BigQuery table.
+    Load data to BigQuery table (overwrites it) and wait for the job.
 
     Args:
         client: BigQuery client
-        df (pd.DataFrame): Data to load
+        df (pd.DataFrame or str): Data to load, or path of a Parquet file
+            to upload as-is
         table_name (str): Table name
         schema (list): BigQuery schema
 
@@ -111,140 +210,484 @@ def day01_load_to_bigquery(client, df, table_name, schema):
         bool: True if successful, False otherwise
     """
     try:
-        from google.cloud import bigquery
+        job = day01_submit_load_job(client, df, table_name, schema)
+    except Exception as e:
+        print(f"❌ Failed to load data to BigQuery: {str(e)}")
+        return False
 
-        # Construct table ID
-        table_id = f"{client.project}.{config.day01_BQ_DATASET}.{table_name}"
+    stats = day01_wait_for_load_jobs(client, {table_name: job})[table_name]
+    if stats is None:
+        return False
 
-        # Configure load job
-        job_config = bigquery.LoadJobConfig(
-            schema=schema,
-            write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,  # Overwrite table
-        )
+    print(f"✅ Loaded {stats['num_rows']} rows to {job.destination.table_id}")
+    return True
 
-        # Load data
-        print(f"🔄 Loading {len(df)} rows to {table_id}...")
-        job = client.load_table_from_dataframe(df, table_id, job_config=job_config)
 
-        # Wait for job to complete
+def day01_read_watermarks():
+    """
+    Read the last merged date per table from the local watermark file.
+
+    Returns:
+        dict: table name -> 'YYYY-MM-DD'
+    """
+    if not os.path.exists(config.day01_BQ_WATERMARK_FILE):
+        return {}
+    with open(config.day01_BQ_WATERMARK_FILE, 'r') as f:
+        return json.load(f)
+
+
+def day01_save_watermark(table_name, last_date):
+    """
+    Record the last merged date of a table (atomic file replace).
+
+    Args:
+        table_name (str): BigQuery table name
+        last_date (str): Last date merged ('YYYY-MM-DD')
+    """
+    # Tables are merged concurrently: serialize the read-modify-write
+    with day01_WATERMARK_LOCK:
+        watermarks = day01_read_watermarks()
+        watermarks[table_name] = last_date
+
+        os.makedirs(os.path.dirname(config.day01_BQ_WATERMARK_FILE), exist_ok=True)
+        tmp_path = config.day01_BQ_WATERMARK_FILE + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(watermarks, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, config.day01_BQ_WATERMARK_FILE)
+
+
+def day01_read_new_rows(file_path, schema, since_date=None):
+    """
+    Read the rows of a processed file dated on or after since_date.
+
+    Parquet is read with the date predicate pushed down (row groups outside
+    the range are skipped); CSV is scanned in chunks so only the new rows
+    are kept in memory.
+
+    Args:
+        file_path (str): Processed .parquet or .csv file
+        schema (list): BigQuery schema of the table
+        since_date (str): First date to keep ('YYYY-MM-DD'), None for all rows
+
+    Returns:
+        pyarrow.Table: Matching rows typed with the BigQuery schema
+    """
+    import pyarrow.parquet as pq
+
+    arrow_schema = day01_arrow_schema(schema)
+
+    if file_path.endswith('.parquet'):
+        filters = [('date', '>=', date.fromisoformat(since_date))] if since_date else None
+        return pq.read_table(file_path, columns=arrow_schema.names, filters=filters).cast(arrow_schema)
+
+    chunks = []
+    for chunk in pd.read_csv(file_path, chunksize=config.day01_BQ_READ_CHUNK_ROWS):
+        if since_date is not None:
+            # ISO dates compare correctly as strings
+            chunk = chunk[chunk['date'].astype(str) >= since_date]
+        chunks.append(chunk)
+
+    return day01_to_arrow_table(pd.concat(chunks, ignore_index=True), arrow_schema)
+
+
+def day01_upload_parquet(client, source, table_id, schema, write_disposition, wait=True):
+    """
+    Upload Parquet to BigQuery as-is (SourceFormat.PARQUET).
+
+    Args:
+        client: BigQuery client
+        source: Parquet file path, or pyarrow.Table to serialize in memory
+        table_id (str): Destination table
+        schema (list): BigQuery schema
+        write_disposition (str): e.g. bigquery.WriteDisposition.WRITE_TRUNCATE
+        wait (bool): Block until the job finishes
+
+    Returns:
+        bigquery.LoadJob: Finished (or, with wait=False, running) load job
+    """
+    from google.cloud import bigquery
+    import pyarrow.parquet as pq
+
+    job_config = bigquery.LoadJobConfig(
+        schema=schema,
+        source_format=bigquery.SourceFormat.PARQUET,
+        write_disposition=write_disposition,
+    )
+
+    if isinstance(source, str):
+        with open(source, 'rb') as f:
+            job = client.load_table_from_file(f, table_id, job_config=job_config)
+    else:
+        buffer = io.BytesIO()
+        pq.write_table(source, buffer, compression='snappy')
+        buffer.seek(0)
+        job = client.load_table_from_file(buffer, table_id, job_config=job_config)
+
+    if wait:
         job.result()
+    return job
 
-        # Get table info
-        table = client.get_table(table_id)
-        print(f"✅ Loaded {table.num_rows} rows to {table_id}")
 
+def day01_ensure_partitioned_table(client, table_name, schema):
+    """
+    Create the target table partitioned by date and clustered if it doesn't exist.
+
+    Args:
+        client: BigQuery client
+        table_name (str): Table name
+        schema (list): BigQuery schema
+
+    Returns:
+        bool: True if the table exists with date partitioning, False otherwise
+    """
+    from google.cloud import bigquery
+    from google.api_core.exceptions import NotFound
+
+    table_id = f"{client.project}.{config.day01_BQ_DATASET}.{table_name}"
+
+    try:
+        table = client.get_table(table_id)
+    except NotFound:
+        table = bigquery.Table(table_id, schema=[bigquery.SchemaField.from_api_repr(f) for f in schema])
+        table.time_partitioning = bigquery.TimePartitioning(
+            type_=bigquery.TimePartitioningType.DAY,
+            field=config.day01_BQ_PARTITION_FIELD
+        )
+        table.clustering_fields = [config.day01_BQ_CLUSTER_FIELDS[table_name]]
+        client.create_table(table)
+        print(f"✅ Created partitioned table: {table_id} "
+              f"(by {config.day01_BQ_PARTITION_FIELD}, clustered by {config.day01_BQ_CLUSTER_FIELDS[table_name]})")
         return True
 
-    except Exception as e:
-        print(f"❌ Failed to load data to BigQuery: {str(e)}")
+    partitioning = table.time_partitioning
+    if partitioning is None or partitioning.field != config.day01_BQ_PARTITION_FIELD:
+        print(f"❌ {table_id} exists but is not partitioned by {config.day01_BQ_PARTITION_FIELD}")
+        print("   Drop it once (bq rm -t) and rerun with --mode incremental to recreate it")
         return False
 
+    return True
+
 
-def day01_load_ga4_to_bigquery(client):
+def day01_incremental_load_to_bigquery(client, file_path, table_name, schema, stats=None):
     """
-    Load GA4 data to BigQuery.
+    Merge only new dates of a processed file into a partitioned table.
+
+    Rows dated after the table's watermark (minus a small lookback for late
+    data) are loaded into a staging table and MERGEd on (date, cluster
+    column), touching only the affected partitions. The watermark is saved
+    after the MERGE succeeds; because MERGE is keyed, rerunning after a
+    failure at any step never duplicates rows.
 
     Args:
         client: BigQuery client
+        file_path (str): Processed .parquet or .csv file
+        table_name (str): Target table name
+        schema (list): BigQuery schema
+        stats (dict): Optional dict filled with the staging load job stats,
+            merged rows and MERGE bytes processed
 
     Returns:
         bool: True if successful, False otherwise
     """
-    print("\n" + "="*60)
-    print("📊 LOADING GA4 DATA TO BIGQUERY")
-    print("="*60)
+    try:
+        from google.cloud import bigquery
+
+        if not day01_ensure_partitioned_table(client, table_name, schema):
+            return False
+
+        watermark = day01_read_watermarks().get(table_name)
+        since_date = None
+        if watermark is not None:
+            since_date = (date.fromisoformat(watermark) - timedelta(days=config.day01_BQ_LOOKBACK_DAYS - 1)).isoformat()
+            print(f"📌 Watermark: {watermark} (merging dates >= {since_date})")
+        else:
+            print("📌 No watermark: merging every date in the file")
+
+        rows = day01_read_new_rows(file_path, schema, since_date)
+        if rows.num_rows == 0:
+            print(f"✅ {table_name} is up to date - nothing to load")
+            return True
+
+        dates = rows.column('date').to_pandas()
+        first_date, last_date = dates.min(), dates.max()
+
+        dataset = f"{client.project}.{config.day01_BQ_DATASET}"
+        table_id = f"{dataset}.{table_name}"
+        staging_id = f"{table_id}{config.day01_BQ_STAGING_SUFFIX}"
 
-    # Check if processed file exists
-    if not os.path.exists(config.day01_GA4_PROCESSED_FILE):
-        print(f"❌ GA4 data file not found: {config.day01_GA4_PROCESSED_FILE}")
-        print("   Run: python day01_DATA_extract_ga4.py")
+        # 1. Load the new rows into a staging table (small: only new dates)
+        print(f"🔄 Staging {rows.num_rows:,} rows ({first_date} to {last_date}) in {staging_id}...")
+        load_job = day01_upload_parquet(
+            client, rows, staging_id, schema, bigquery.WriteDisposition.WRITE_TRUNCATE
+        )
+
+        staging = client.get_table(staging_id)
+        staging.expires = pd.Timestamp.now(tz='UTC') + pd.Timedelta(hours=config.day01_BQ_STAGING_EXPIRATION_HOURS)
+        client.update_table(staging, ['expires'])
+
+        # 2. MERGE into the target; the date range predicate prunes partitions
+        key = config.day01_BQ_CLUSTER_FIELDS[table_name]
+        columns = [field['name'] for field in schema]
+        updates = ', '.join(f"{c} = S.{c}" for c in columns if c not in ('date', key))
+
+        merge_sql = f"""
+            MERGE `{table_id}` T
+            USING `{staging_id}` S
+            ON T.date = S.date AND T.{key} = S.{key}
+               AND T.date BETWEEN DATE '{first_date}' AND DATE '{last_date}'
+            WHEN MATCHED THEN UPDATE SET {updates}
+            WHEN NOT MATCHED THEN INSERT ({', '.join(columns)}) VALUES ({', '.join('S.' + c for c in columns)})
+        """
+        merge_job = client.query(merge_sql)
+        merge_job.result()
+
+        client.delete_table(staging_id, not_found_ok=True)
+
+        # 3. Advance the watermark only after the MERGE committed
+        day01_save_watermark(table_name, max(str(last_date), watermark or ''))
+
+        if stats is not None:
+            stats.update(day01_job_stats(load_job))
+            stats['merged_rows'] = merge_job.num_dml_affected_rows
+            stats['merge_bytes_processed'] = merge_job.total_bytes_processed
+
+        print(f"✅ Merged {merge_job.num_dml_affected_rows:,} rows into {table_id}")
+        print(f"   Uploaded: {(load_job.output_bytes or 0) / 1024:,.1f} KB, "
+              f"MERGE processed: {(merge_job.total_bytes_processed or 0) / 1024:,.1f} KB")
+        return True
+
+    except Exception as e:
+        print(f"❌ Failed to merge data into BigQuery: {str(e)}")
         return False
 
+
+# Tables the loader knows about, keyed by the --table choice
+day01_LOAD_TABLES = {
+    'ga4': {
+        'title': 'GA4 DATA',
+        'label': 'GA4 Sessions',
+        'file': config.day01_GA4_PROCESSED_FILE,
+        'table': config.day01_GA4_TABLE,
+        'schema': config.day01_GA4_SCHEMA,
+        'script': 'day01_DATA_extract_ga4.py',
+    },
+    'ads': {
+        'title': 'GOOGLE ADS DATA',
+        'label': 'Google Ads Campaigns',
+        'file': config.day01_ADS_PROCESSED_FILE,
+        'table': config.day01_ADS_TABLE,
+        'schema': config.day01_ADS_SCHEMA,
+        'script': 'day01_DATA_extract_ads.py',
+    },
+}
+
+
+def day01_read_load_source(kind):
+    """
+    Find the processed file of a table and prepare it for a full load.
+
+    Args:
+        kind (str): 'ga4' or 'ads'
+
+    Returns:
+        str, pd.DataFrame or None: Parquet path (uploaded as-is), parsed CSV
+            rows, or None if no processed file exists
+    """
+    spec = day01_LOAD_TABLES[kind]
+
+    # Find the processed file (Parquet or CSV, whichever was written last)
+    file_path = day01_find_processed_file(spec['file'])
+    if file_path is None:
+        print(f"❌ {spec['label']} data file not found: {spec['file']} (.parquet/.csv)")
+        print(f"   Run: python {spec['script']}")
+        return None
+
+    if file_path.endswith('.parquet'):
+        # Typed Parquet is uploaded without parsing it locally
+        return file_path
+
     # Read CSV
-    df = pd.read_csv(config.day01_GA4_PROCESSED_FILE)
-    print(f"📂 Loaded {len(df)} rows from {config.day01_GA4_PROCESSED_FILE}")
+    df = pd.read_csv(file_path)
+    print(f"📂 Loaded {len(df)} rows from {file_path}")
 
     # Convert date column to proper format
     df['date'] = pd.to_datetime(df['date']).dt.date
+    return df
 
-    # Load to BigQuery
-    success = day01_load_to_bigquery(
-        client,
-        df,
-        config.day01_GA4_TABLE,
-        config.day01_GA4_SCHEMA
-    )
-
-    return success
 
-
-def day01_load_ads_to_bigquery(client):
+def day01_load_tables(client, kinds, mode='full'):
     """
-    Load Google Ads data to BigQuery.
+    Load several tables at once.
+
+    Full mode submits every load job first and then waits on all of them,
+    so BigQuery runs them concurrently. Incremental mode runs each table's
+    staging load + MERGE in its own thread.
 
     Args:
         client: BigQuery client
+        kinds (list): Keys of day01_LOAD_TABLES
+        mode (str): 'full' (WRITE_TRUNCATE) or 'incremental' (new dates via MERGE)
 
     Returns:
-        bool: True if successful, False otherwise
+        dict: kind -> job stats (empty if nothing was loaded), or None if the load failed
     """
     print("\n" + "="*60)
-    print("📊 LOADING GOOGLE ADS DATA TO BIGQUERY")
+    print(f"📊 LOADING {' + '.join(day01_LOAD_TABLES[kind]['title'] for kind in kinds)} TO BIGQUERY")
     print("="*60)
 
-    # Check if processed file exists
-    if not os.path.exists(config.day01_ADS_PROCESSED_FILE):
-        print(f"❌ Ads data file not found: {config.day01_ADS_PROCESSED_FILE}")
-        print("   Run: python day01_DATA_extract_ads.py")
-        return False
+    started = time.perf_counter()
+    results = {}
+
+    if mode == 'incremental':
+        def merge_table(kind):
+            spec = day01_LOAD_TABLES[kind]
+            file_path = day01_find_processed_file(spec['file'])
+            if file_path is None:
+                print(f"❌ {spec['label']} data file not found: {spec['file']} (.parquet/.csv)")
+                print(f"   Run: python {spec['script']}")
+                return None
+
+            stats = {}
+            merge_started = time.perf_counter()
+            if not day01_incremental_load_to_bigquery(client, file_path, spec['table'], spec['schema'], stats):
+                return None
+            stats['total_seconds'] = time.perf_counter() - merge_started
+            return stats
+
+        with ThreadPoolExecutor(max_workers=len(kinds)) as executor:
+            results = dict(zip(kinds, executor.map(merge_table, kinds)))
+    else:
+        jobs = {}
+        for kind in kinds:
+            source = day01_read_load_source(kind)
+            if source is None:
+                results[kind] = None
+                continue
+            try:
+                jobs[kind] = day01_submit_load_job(
+                    client, source, day01_LOAD_TABLES[kind]['table'], day01_LOAD_TABLES[kind]['schema']
+                )
+            except Exception as e:
+                print(f"❌ Failed to submit {day01_LOAD_TABLES[kind]['label']} load job: {str(e)}")
+                results[kind] = None
+
+        if jobs:
+            print(f"⏳ Waiting for {len(jobs)} load job(s)...")
+        results.update(day01_wait_for_load_jobs(client, jobs))
+
+    day01_print_load_report(results, time.perf_counter() - started)
+    day01_append_load_log(results, mode)
+    return results
+
+
+def day01_print_load_report(results, wall_seconds):
+    """
+    Print rows, bytes and elapsed time of each load job.
 
-    # Read CSV
-    df = pd.read_csv(config.day01_ADS_PROCESSED_FILE)
-    print(f"📂 Loaded {len(df)} rows from {config.day01_ADS_PROCESSED_FILE}")
+    Args:
+        results (dict): kind -> job stats or None (from day01_load_tables)
+        wall_seconds (float): Wall-clock time of the whole load
+    """
+    print("\n⏱️  Load jobs:")
+    print(f"   {'Table':<22} {'Rows':>12} {'Output KB':>12} {'Job time':>9}")
 
-    # Convert date column to proper format
-    df['date'] = pd.to_datetime(df['date']).dt.date
+    for kind, stats in results.items():
+        label = day01_LOAD_TABLES[kind]['label']
+        if stats is None:
+            print(f"   {label:<22} {'failed':>12}")
+            continue
+        if not stats:
+            print(f"   {label:<22} {'up to date':>12}")
+            continue
 
-    # Load to BigQuery
-    success = day01_load_to_bigquery(
-        client,
-        df,
-        config.day01_ADS_TABLE,
-        config.day01_ADS_SCHEMA
-    )
+        elapsed = stats.get('elapsed_seconds')
+        print(f"   {label:<22} {stats.get('output_rows') or 0:>12,} "
+              f"{(stats.get('output_bytes') or 0) / 1024:>12,.1f} "
+              f"{'n/a' if elapsed is None else f'{elapsed:.1f}s':>9}")
+
+    job_seconds = sum(stats.get('elapsed_seconds') or 0 for stats in results.values() if stats)
+    print(f"   Wall clock: {wall_seconds:.1f}s (sum of job times: {job_seconds:.1f}s)")
+
+
+def day01_append_load_log(results, mode):
+    """
+    Append one JSON line per successful load job to the load log.
+
+    Args:
+        results (dict): kind -> job stats or None (from day01_load_tables)
+        mode (str): 'full' or 'incremental'
+    """
+    loaded_at = pd.Timestamp.now(tz='UTC').isoformat()
+    records = [
+        {'loaded_at': loaded_at, 'mode': mode, 'table': day01_LOAD_TABLES[kind]['table'], **stats}
+        for kind, stats in results.items() if stats
+    ]
+    if not records:
+        return
+
+    os.makedirs(os.path.dirname(config.day01_BQ_LOAD_LOG_FILE), exist_ok=True)
+    with open(config.day01_BQ_LOAD_LOG_FILE, 'a') as f:
+        for record in records:
+            f.write(json.dumps(record) + '\n')
+
+
+def day01_load_ga4_to_bigquery(client, mode='full'):
+    """
+    Load GA4 data to BigQuery.
+
+    Args:
+        client: BigQuery client
+        mode (str): 'full' (WRITE_TRUNCATE) or 'incremental' (new dates via MERGE)
 
-    return success
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    return day01_load_tables(client, ['ga4'], mode)['ga4'] is not None
 
 
-def day01_verify_data_in_bigquery(client):
+def day01_load_ads_to_bigquery(client, mode='full'):
     """
-    Verify data was loaded successfully by running COUNT queries.
+    Load Google Ads data to BigQuery.
 
     Args:
         client: BigQuery client
+        mode (str): 'full' (WRITE_TRUNCATE) or 'incremental' (new dates via MERGE)
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    return day01_load_tables(client, ['ads'], mode)['ads'] is not None
+
+
+def day01_verify_data_in_bigquery(client, results=None):
+    """
+    Verify data was loaded successfully from table metadata.
+
+    Row counts come from tables.get (table.num_rows), which is free,
+    instead of billed COUNT(*) queries. After a full load they are checked
+    against the rows each load job wrote.
+
+    Args:
+        client: BigQuery client
+        results (dict): Optional kind -> job stats from day01_load_tables
     """
     print("\n" + "="*60)
     print("🔍 VERIFYING DATA IN BIGQUERY")
     print("="*60)
 
     try:
-        # Query GA4 table
-        ga4_query = f"""
-            SELECT COUNT(*) as row_count
-            FROM `{client.project}.{config.day01_BQ_DATASET}.{config.day01_GA4_TABLE}`
-        """
-        ga4_result = client.query(ga4_query).result()
-        ga4_count = list(ga4_result)[0].row_count
-        print(f"✅ GA4 Sessions table: {ga4_count} rows")
-
-        # Query Ads table
-        ads_query = f"""
-            SELECT COUNT(*) as row_count
-            FROM `{client.project}.{config.day01_BQ_DATASET}.{config.day01_ADS_TABLE}`
-        """
-        ads_result = client.query(ads_query).result()
-        ads_count = list(ads_result)[0].row_count
-        print(f"✅ Google Ads Campaigns table: {ads_count} rows")
+        for kind, spec in day01_LOAD_TABLES.items():
+            stats = (results or {}).get(kind) or {}
+            num_rows = stats.get('num_rows')
+            if num_rows is None:
+                table = client.get_table(f"{client.project}.{config.day01_BQ_DATASET}.{spec['table']}")
+                num_rows = table.num_rows
+
+            expected = stats.get('output_rows') if 'merged_rows' not in stats else None
+            if expected is not None and expected != num_rows:
+                print(f"⚠️  {spec['label']} table: {num_rows} rows (load job wrote {expected})")
+            else:
+                print(f"✅ {spec['label']} table: {num_rows} rows")
 
         # Show sample join query
         print("\n💡 Sample query to join both tables:")
@@ -273,6 +716,9 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Load data to BigQuery')
     parser.add_argument('--table', choices=['ga4', 'ads', 'both'], default='both',
                        help='Which table to load (default: both)')
+    parser.add_argument('--mode', choices=['full', 'incremental'], default='full',
+                       help='full: overwrite tables (WRITE_TRUNCATE); '
+                            'incremental: merge dates after the watermark into partitioned tables')
     args = parser.parse_args()
 
     try:
@@ -298,23 +744,18 @@ if __name__ == '__main__':
         if not day01_ensure_dataset_exists(client, config.day01_BQ_DATASET):
             sys.exit(1)
 
-        # Load data based on argument
-        success_ga4 = True
-        success_ads = True
-
-        if args.table in ['ga4', 'both']:
-            success_ga4 = day01_load_ga4_to_bigquery(client)
-
-        if args.table in ['ads', 'both']:
-            success_ads = day01_load_ads_to_bigquery(client)
+        # Load data based on argument (both tables are loaded concurrently)
+        kinds = list(day01_LOAD_TABLES) if args.table == 'both' else [args.table]
+        results = day01_load_tables(client, kinds, mode=args.mode)
+        success = all(stats is not None for stats in results.values())
 
         # Verify if both loads were requested and successful
-        if args.table == 'both' and success_ga4 and success_ads:
-            day01_verify_data_in_bigquery(client)
+        if args.table == 'both' and success:
+            day01_verify_data_in_bigquery(client, results)
 
         # Final message
         print("\n" + "="*60)
-        if success_ga4 and success_ads:
+        if success:
             print("✅ DATA LOAD COMPLETE!")
         else:
             print("⚠️  PARTIAL SUCCESS - Check errors above")
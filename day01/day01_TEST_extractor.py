@@ -0,0 +1,191 @@
+"""
+Day 01 - Extractor Test
+Runs the chunked, paginated, concurrent extractor against a local fake of
+the GA4 Data API client. No credentials, network or google libraries needed.
+
+Usage:
+    python day01_TEST_extractor.py
+"""
+
+import random
+import sys
+import threading
+import time
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import day01_CONFIG_settings as config
+from day01_DATA_extractor import (
+    Day01QuotaBackoff,
+    day01_date_chunks,
+    day01_extract_concurrently,
+    day01_run_report_paged,
+)
+
+
+class Day01QuotaError(Exception):
+    """Stands in for google.api_core.exceptions.ResourceExhausted."""
+    code = 429
+
+
+class Day01FakeGA4Client:
+    """
+    In-memory GA4 property honoring date_ranges, order_bys, limit and offset.
+
+    Like GA4, it only returns a stable row order when order_bys is given:
+    without it every request sees the rows in a different random order.
+
+    Fails the first `quota_errors` calls with a 429 and reports a low token
+    balance on every response when `low_quota` is set.
+    """
+
+    def __init__(self, start_date, days, sources, latency=0.0, quota_errors=0, low_quota=False):
+        self.rows = [
+            (start_date + timedelta(days=d), source)
+            for d in range(days) for source in sources
+        ]
+        self.latency = latency
+        self.quota_errors = quota_errors
+        self.low_quota = low_quota
+
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self.max_limit = 0
+        self.order_bys = None
+
+    def run_report(self, request):
+        with self.lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.max_limit = max(self.max_limit, request['limit'])
+            self.order_bys = request.get('order_bys')
+            call = self.calls
+            fail = self.quota_errors > 0
+            if fail:
+                self.quota_errors -= 1
+
+        try:
+            time.sleep(self.latency)
+            if fail:
+                raise Day01QuotaError("Exhausted property tokens per hour")
+
+            date_range = request['date_ranges'][0]
+            first = date.fromisoformat(date_range['start_date'])
+            last = date.fromisoformat(date_range['end_date'])
+            matching = [row for row in self.rows if first <= row[0] <= last]
+            if self.order_bys:
+                dimensions = [order['dimension']['dimension_name'] for order in self.order_bys]
+                key_index = {'date': 0, 'sessionSource': 1}
+                matching.sort(key=lambda row: tuple(row[key_index[name]] for name in dimensions))
+            else:
+                random.Random(call).shuffle(matching)
+            page = matching[request['offset']:request['offset'] + request['limit']]
+
+            return SimpleNamespace(
+                row_count=len(matching),
+                rows=[self._row(day, source) for day, source in page],
+                property_quota=SimpleNamespace(
+                    tokens_per_hour=SimpleNamespace(remaining=10 if self.low_quota else 39000)
+                ),
+            )
+        finally:
+            with self.lock:
+                self.active -= 1
+
+    @staticmethod
+    def _row(day, source):
+        value = lambda v: SimpleNamespace(value=str(v))
+        return SimpleNamespace(
+            dimension_values=[value(day.strftime('%Y%m%d')), value(source)],
+            metric_values=[value(100 + day.day), value(3), value(0.42)],
+        )
+
+
+def day01_check(condition, message):
+    """Print a check result."""
+    print(f"   {'✓' if condition else '❌'} {message}")
+    return condition
+
+
+def day01_no_sleep_backoff(**kwargs):
+    """Backoff that records waits instead of sleeping (keeps the test fast)."""
+    return Day01QuotaBackoff(sleep=lambda seconds: None, **kwargs)
+
+
+def day01_test_extractor():
+    sources = config.day01_TRAFFIC_SOURCES
+    start_date = date(2024, 1, 1)
+    days = 95
+    all_passed = True
+
+    print("\n" + "="*60)
+    print("🧪 DAY 01 - EXTRACTOR TEST (FAKE GA4 CLIENT)")
+    print("="*60)
+
+    print("\n▶ Date chunking")
+    chunks = day01_date_chunks(start_date, start_date + timedelta(days=days - 1), 30)
+    all_passed &= day01_check(len(chunks) == 4 and chunks[-1][1] - chunks[-1][0] == timedelta(days=4),
+                              "95 days -> 3 x 30 + 5 days")
+    all_passed &= day01_check(all(chunks[i][1] + timedelta(days=1) == chunks[i + 1][0] for i in range(3)),
+                              "Chunks are contiguous")
+
+    print("\n▶ Pagination")
+    client = Day01FakeGA4Client(start_date, days, sources)
+    df, calls = day01_run_report_paged(client, start_date, start_date + timedelta(days=days - 1),
+                                       day01_no_sleep_backoff(), page_size=100)
+    all_passed &= day01_check(len(df) == days * len(sources), f"All {days * len(sources)} rows read (not just the first page)")
+    all_passed &= day01_check(calls == 5 and client.max_limit == 100, f"{calls} pages of 100 rows")
+    all_passed &= day01_check(not df.duplicated(['date', 'source']).any(), "No duplicate rows across pages")
+    all_passed &= day01_check(
+        [order['dimension']['dimension_name'] for order in client.order_bys or []] == ['date', 'sessionSource'],
+        "Pages requested in a stable order (order_bys date, sessionSource)"
+    )
+    all_passed &= day01_check(df['date'].iloc[0] == '2024-01-01', "GA4 dates (YYYYMMDD) converted to YYYY-MM-DD")
+
+    print("\n▶ Concurrent GA4 + Ads chunks")
+    client = Day01FakeGA4Client(start_date, days, sources, latency=0.05)
+    ga4_df, ads_df, stats = day01_extract_concurrently(
+        client, start_date, start_date + timedelta(days=days - 1),
+        chunk_days=10, max_workers=4, backoff=day01_no_sleep_backoff(), page_size=20
+    )
+    all_passed &= day01_check(len(ga4_df) == days * len(sources), "GA4 rows complete")
+    all_passed &= day01_check(ga4_df['date'].is_monotonic_increasing, "Chunks reassembled in date order")
+    all_passed &= day01_check(len(ads_df) == days * config.day01_NUM_CAMPAIGNS and
+                              ads_df['date'].min() == '2024-01-01' and ads_df['date'].max() == '2024-04-04',
+                              "Ads chunks cover the same date range")
+    all_passed &= day01_check(1 < client.max_active <= 4, f"GA4 requests overlapped (max {client.max_active} in flight, cap 4)")
+    all_passed &= day01_check(stats['wall_seconds'] < stats['chunk_seconds'],
+                              f"Wall {stats['wall_seconds']:.2f}s < sequential {stats['chunk_seconds']:.2f}s")
+
+    print("\n▶ Quota-aware backoff")
+    client = Day01FakeGA4Client(start_date, 10, sources, quota_errors=2)
+    backoff = day01_no_sleep_backoff()
+    df, calls = day01_run_report_paged(client, start_date, start_date + timedelta(days=9), backoff)
+    all_passed &= day01_check(len(df) == 10 * len(sources) and backoff.stats['retries'] == 2,
+                              "429 responses retried with backoff")
+
+    client = Day01FakeGA4Client(start_date, 10, sources, quota_errors=10)
+    try:
+        day01_run_report_paged(client, start_date, start_date + timedelta(days=9),
+                               day01_no_sleep_backoff(max_retries=3))
+        gave_up = False
+    except Day01QuotaError:
+        gave_up = True
+    all_passed &= day01_check(gave_up and client.calls == 4, "Gives up after max_retries")
+
+    client = Day01FakeGA4Client(start_date, 10, sources, low_quota=True)
+    backoff = day01_no_sleep_backoff()
+    day01_run_report_paged(client, start_date, start_date + timedelta(days=9), backoff)
+    all_passed &= day01_check(backoff.stats['quota_pauses'] == 1, "Low property token balance slows requests down")
+
+    print("\n" + "="*60)
+    print("✅ All checks passed" if all_passed else "❌ Some checks failed")
+    print("="*60 + "\n")
+    return all_passed
+
+
+if __name__ == '__main__':
+    sys.exit(0 if day01_test_extractor() else 1)
@@ -12,6 +12,7 @@ from src.data_manager import DataManager
 from src.audience_segmentation import AudienceAnalyzer
 from src.ltv_calculator_day02 import LTVCalculator
 from src.openai_analyzer_day02 import OpenAIContentAnalyzer
+from src.task_graph import TaskGraph
 from src import config
 
 
@@ -90,6 +91,29 @@ def print_growth_scenarios(scenarios: dict):
         print()
 
 
+def print_growth_simulation(simulation: dict):
+    """Print Monte-Carlo follower and account value bands"""
+    if not simulation:
+        print("\n⚠️  Not enough follower history for a Monte-Carlo projection")
+        return
+
+    print(f"🎲 MONTE-CARLO PROJECTION ({simulation['n_paths']:,} paths × {simulation['weeks']} weeks, "
+          f"{simulation['method']}, {simulation['elapsed_ms']:.1f} ms)")
+    observed = simulation['observed_weekly_growth']
+    print(f"   Observed weekly growth: {observed['mean_pct']:.2f}% ± {observed['std_pct']:.2f}% "
+          f"({observed['samples']} samples)")
+    print(f"   {'Month':<7} {'Followers P5':>14} {'P50':>12} {'P95':>12} {'Value P50':>16}")
+
+    followers = simulation['followers']
+    value = simulation['account_value']
+    for i, month in enumerate(simulation['months']):
+        print(f"   {month:<7} {followers['p5'][i]:>14,.0f} {followers['p50'][i]:>12,.0f} "
+              f"{followers['p95'][i]:>12,.0f} {'$' + format(value['p50'][i], ',.0f'):>16}")
+
+    print(f"   Probability of reaching 200K: {simulation['probability_200k']:.1%}")
+    print()
+
+
 def print_ai_insights(ai_insights: dict):
     """Print AI-generated insights"""
     print("\n" + "=" * 60)
@@ -171,6 +195,7 @@ def main():
         print_ltv_summary(ltv_summary)
         print_content_roi(content_roi)
         print_growth_scenarios(growth_scenarios)
+        print_growth_simulation(ltv_summary.get('growth_simulation', {}))
 
         # Phase 2: AI-Powered Insights
         print("\n" + "=" * 60)
@@ -182,35 +207,60 @@ def main():
             openai_analyzer = OpenAIContentAnalyzer(data_manager)
             print("   ✓ OpenAI client initialized")
 
-            # Gather current performance data
-            growth_metrics = data_manager.get_growth_metrics()
-            engagement_stats = data_manager.get_engagement_stats()
-            insights = analyzer.generate_insights_summary()
-
-            current_performance = {
-                'avg_engagement': engagement_stats.get('avg_engagement_rate', 0),
-                'weekly_growth': growth_metrics.get('weekly_growth_rate', 0),
-                'target_growth': config.TARGET_WEEKLY_GROWTH_RATE,
-                'best_content_type': 'VIDEO',  # From Hour 1 results
-                'followers': growth_metrics.get('current_followers', 0),
-                'growth_gap': config.TARGET_WEEKLY_GROWTH_RATE - growth_metrics.get('weekly_growth_rate', 0)
-            }
+            def build_current_performance() -> dict:
+                """Gather current performance data for the recommendations prompt"""
+                growth_metrics = data_manager.get_growth_metrics()
+                engagement_stats = data_manager.get_engagement_stats()
+
+                return {
+                    'avg_engagement': engagement_stats.get('avg_engagement_rate', 0),
+                    'weekly_growth': growth_metrics.get('weekly_growth_rate', 0),
+                    'target_growth': config.TARGET_WEEKLY_GROWTH_RATE,
+                    'best_content_type': 'VIDEO',  # From Hour 1 results
+                    'followers': growth_metrics.get('current_followers', 0),
+                    'growth_gap': config.TARGET_WEEKLY_GROWTH_RATE - growth_metrics.get('weekly_growth_rate', 0)
+                }
+
+            # Dependency graph: the posts-based calls share one snapshot load,
+            # recommendations wait for the performance metrics, and the
+            # strategy only needs the LTV results computed above
+            print(f"\n1-5. Running AI analyses (up to {config.LLM_MAX_CONCURRENCY} in parallel)...")
+            graph = TaskGraph(
+                max_concurrency=config.LLM_MAX_CONCURRENCY,
+                usage_fn=openai_analyzer.consume_usage
+            )
+            graph.add('posts_snapshot', data_manager.get_posts_snapshot)
+            graph.add('current_performance', build_current_performance)
+            graph.add('viral_patterns',
+                      lambda _: openai_analyzer.analyze_viral_content_patterns(),
+                      depends_on=['posts_snapshot'])
+            graph.add('recommendations',
+                      openai_analyzer.generate_content_recommendations,
+                      depends_on=['current_performance'])
+            graph.add('caption_analysis',
+                      lambda _: openai_analyzer.analyze_caption_effectiveness(),
+                      depends_on=['posts_snapshot'])
+            graph.add('content_calendar',
+                      lambda _: openai_analyzer.generate_content_calendar_suggestions(weeks=4),
+                      depends_on=['posts_snapshot'])
+            graph.add('growth_strategy',
+                      lambda: openai_analyzer.generate_comprehensive_strategy(
+                          ltv_summary.get('follower_ltv', {}),
+                          growth_scenarios
+                      ))
+            graph_results = graph.run()
+
+            viral_patterns = graph_results.get('viral_patterns', {})
+            recommendations = graph_results.get('recommendations', [])
+            caption_analysis = graph_results.get('caption_analysis', {})
+            content_calendar = graph_results.get('content_calendar', {})
+            strategy = graph_results.get('growth_strategy', {})
 
-            print("\n1. Analyzing viral content patterns...")
-            viral_patterns = openai_analyzer.analyze_viral_content_patterns()
             print(f"   ✓ Analyzed {viral_patterns.get('analyzed_posts_count', 0)} viral posts")
-
-            print("\n2. Generating strategic recommendations...")
-            recommendations = openai_analyzer.generate_content_recommendations(current_performance)
             print(f"   ✓ Generated {len(recommendations)} recommendations")
-
-            print("\n3. Analyzing caption effectiveness...")
-            caption_analysis = openai_analyzer.analyze_caption_effectiveness()
             print("   ✓ Caption analysis complete")
-
-            print("\n4. Creating content calendar suggestions...")
-            content_calendar = openai_analyzer.generate_content_calendar_suggestions(weeks=4)
             print("   ✓ 4-week content calendar generated")
+            print("   ✓ Growth strategy generated")
 
             # Compile AI insights
             ai_insights = {
@@ -223,13 +273,13 @@ def main():
             # Print AI insights
             print_ai_insights(ai_insights)
 
-            # Generate comprehensive strategy
-            print("\n5. Generating comprehensive growth strategy...")
-            strategy = openai_analyzer.generate_comprehensive_strategy(
-                ltv_summary.get('follower_ltv', {}),
-                growth_scenarios
-            )
-            print("   ✓ Growth strategy generated")
+            graph.print_report()
+
+            cache_stats = openai_analyzer.get_cache_stats()
+            if cache_stats:
+                print(f"\n🗄️  LLM cache: {cache_stats['hits']} hits / {cache_stats['misses']} misses "
+                      f"(hit rate {cache_stats['hit_rate']:.0%}, {cache_stats['tokens_saved']:,} tokens saved, "
+                      f"{cache_stats['entries']} entries stored)")
 
             # Save results to JSON
             results = {
@@ -12,6 +12,8 @@ import json
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from src.ltv_calculator_day02 import simulate_growth_paths
+
 # Page config
 st.set_page_config(
     page_title="Creator Intelligence Dashboard",
@@ -60,7 +62,7 @@ def load_data():
 
     # Load database data
     account_metrics = dm.get_account_metrics()
-    posts = dm.get_posts()
+    posts = dm.get_posts_snapshot()
 
     # Load Hour 2 analysis results
     results_path = Path(__file__).parent / 'data' / 'day02_DATA_ltv_analysis.json'
@@ -447,6 +449,59 @@ elif page == "📈 Growth Analysis":
 
         st.plotly_chart(fig, use_container_width=True)
 
+    # Monte-Carlo projection (recomputed on every widget change)
+    st.markdown("---")
+    st.subheader("Monte-Carlo Growth Projection")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        sim_paths = st.select_slider("Simulated paths", options=[1000, 5000, 10000, 25000, 50000], value=10000)
+    with col2:
+        sim_weeks = st.slider("Weeks ahead", min_value=4, max_value=52, value=26, step=1)
+    with col3:
+        sim_method = st.selectbox("Weekly growth model", ["bootstrap", "normal"])
+
+    simulation = simulate_growth_paths(
+        account_metrics[['date', 'followers']],
+        ltv_per_follower=analysis_results['ltv_analysis']['follower_ltv']['ltv_per_follower'],
+        weeks=sim_weeks,
+        n_paths=sim_paths,
+        method=sim_method
+    )
+
+    if simulation:
+        months = simulation['months']
+        bands = simulation['followers']
+
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(x=months, y=bands['p95'], mode='lines', name='P95',
+                                 line=dict(width=0), showlegend=False))
+        fig.add_trace(go.Scatter(x=months, y=bands['p5'], mode='lines', name='P5–P95',
+                                 line=dict(width=0), fill='tonexty', fillcolor='rgba(31, 119, 180, 0.2)'))
+        fig.add_trace(go.Scatter(x=months, y=bands['p50'], mode='lines+markers', name='P50',
+                                 line=dict(color='#1f77b4', width=3)))
+        fig.add_hline(y=200000, line_dash="dash", line_color="red", annotation_text="200K Target")
+
+        fig.update_layout(
+            title=f"Followers by Month ({simulation['n_paths']:,} paths, {simulation['elapsed_ms']:.0f} ms)",
+            xaxis_title="Month",
+            yaxis_title="Followers",
+            height=400,
+            hovermode='x unified'
+        )
+
+        st.plotly_chart(fig, use_container_width=True)
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("P50 Followers (end)", f"{bands['p50'][-1]:,.0f}")
+        with col2:
+            st.metric("P50 Account Value (end)", f"${simulation['account_value']['p50'][-1]:,.0f}")
+        with col3:
+            st.metric("Probability of 200K", f"{simulation['probability_200k']:.1%}")
+    else:
+        st.info("Not enough follower history for a Monte-Carlo projection")
+
     # Reach and Impressions
     st.markdown("---")
     st.subheader("Reach & Impressions Trends")
@@ -107,8 +107,13 @@ def print_summary(
     print("=" * 50 + "\n")
 
 
-def main():
-    """Main pipeline execution"""
+def main(full_refresh: bool = False):
+    """
+    Main pipeline execution
+
+    Args:
+        full_refresh: Re-pull the full lookback window instead of syncing since the last run
+    """
     try:
         print_banner()
 
@@ -129,25 +134,38 @@ def main():
             print("   See README.md for setup instructions.")
             sys.exit(1)
 
-        # Step 1: Extract account insights
-        print("\n1. Extracting account insights (90 days)...")
-        account_metrics = extractor.extract_account_insights(
-            days=config.LOOKBACK_DAYS
-        )
-
-        if not account_metrics.empty:
-            data_manager.save_account_metrics(account_metrics)
-        else:
-            print("   ⚠️ No account metrics extracted")
-
-        # Step 2: Extract posts data
-        print("\n2. Extracting posts data (100 most recent)...")
-        posts = extractor.extract_recent_posts(limit=config.MAX_POSTS)
-
-        if not posts.empty:
-            data_manager.save_posts(posts)
+        if full_refresh:
+            # Step 1: Extract account insights
+            print("\n1. Extracting account insights (90 days)...")
+            account_metrics = extractor.extract_account_insights(
+                days=config.LOOKBACK_DAYS
+            )
+
+            if not account_metrics.empty:
+                data_manager.save_account_metrics(account_metrics)
+            else:
+                print("   ⚠️ No account metrics extracted")
+
+            # Step 2: Extract posts data
+            print("\n2. Extracting posts data (100 most recent)...")
+            posts = extractor.extract_recent_posts(limit=config.MAX_POSTS)
+
+            if not posts.empty:
+                data_manager.save_posts(posts)
+            else:
+                print("   ⚠️ No posts extracted")
+
+            # Later incremental runs continue from here
+            data_manager.save_sync_state(
+                extractor.account_id,
+                last_post_timestamp=posts['timestamp'].max() if not posts.empty else None,
+                last_metrics_date=account_metrics['date'].max() if not account_metrics.empty else None
+            )
         else:
-            print("   ⚠️ No posts extracted")
+            # Steps 1-2: Only new data and posts still inside the maturity window
+            print(f"\n1-2. Syncing account insights and posts since last run "
+                  f"(maturity window: {config.POST_MATURITY_DAYS} days)...")
+            extractor.sync(data_manager)
 
         # Step 3: Calculate growth metrics
         print("\n3. Calculating growth metrics...")
@@ -191,5 +209,5 @@ def main():
 
 
 if __name__ == "__main__":
-    exit_code = main()
+    exit_code = main(full_refresh='--full-refresh' in sys.argv[1:])
     sys.exit(exit_code)
@@ -0,0 +1,300 @@
+"""
+Meta Extractor Stub Server Test
+Runs MetaAPIExtractor against a local Graph API stub that replays recorded responses
+No API credentials or network access required
+
+Usage (from day02/):
+    python -m experimental.day02_test_meta_stub_server --latency 0.05
+"""
+
+import argparse
+import json
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+from src.data_manager import DataManager
+from src.meta_extractor import MetaAPIExtractor
+from src.rate_limiter import GraphRateLimiter, parse_usage_headers
+
+RECORDINGS_PATH = Path(__file__).parent / 'day02_meta_graph_recorded.json'
+
+
+class GraphStub:
+    """Replays recorded Graph API responses, including batch calls"""
+
+    def __init__(self, recordings: Dict[str, Any], latency: float):
+        self.responses = recordings['responses']
+        self.latency = latency
+        self.base_url = ''
+
+        self.lock = threading.Lock()
+        self.http_requests = 0
+        self.graph_calls = 0
+
+    def lookup(self, method: str, url: str) -> Tuple[int, Any]:
+        """Find the most specific recording matching method, path and recorded query subset"""
+        parts = urlsplit(url)
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+
+        matches = [
+            recording for recording in self.responses
+            if recording['method'] == method
+            and recording['path'] == parts.path
+            and all(query.get(key) == value for key, value in recording['query'].items())
+        ]
+
+        if not matches:
+            return 404, {'error': {'message': f'No recording for {method} {parts.path}', 'code': 803}}
+
+        recording = max(matches, key=lambda r: len(r['query']))
+        body = json.dumps(recording['body']).replace('{base_url}', self.base_url)
+        return recording['status'], json.loads(body)
+
+    def usage_header(self) -> str:
+        """Report call volume the way X-App-Usage does (percent of hourly quota)"""
+        return json.dumps({
+            'call_count': min(100, self.graph_calls // 10),
+            'total_cputime': 1,
+            'total_time': 1
+        })
+
+
+def make_handler(stub: GraphStub):
+    """Build a request handler bound to the stub"""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            time.sleep(stub.latency)
+            status, body = stub.lookup('GET', self.path)
+            self._reply(status, body, calls=1)
+
+        def do_POST(self):
+            time.sleep(stub.latency)
+            length = int(self.headers.get('Content-Length', 0))
+            form = parse_qs(self.rfile.read(length).decode())
+
+            if 'batch' not in form:
+                self._reply(400, {'error': {'message': 'Missing batch parameter', 'code': 100}}, calls=1)
+                return
+
+            batch = json.loads(form['batch'][0])
+            if len(batch) > 50:
+                self._reply(400, {'error': {'message': 'Too many requests in batch', 'code': 1}}, calls=1)
+                return
+
+            results = []
+            for sub_request in batch:
+                status, body = stub.lookup(sub_request['method'], '/' + sub_request['relative_url'])
+                results.append({'code': status, 'body': json.dumps(body)})
+
+            self._reply(200, results, calls=len(batch))
+
+        def _reply(self, status: int, body: Any, calls: int):
+            with stub.lock:
+                stub.http_requests += 1
+                stub.graph_calls += calls
+                usage = stub.usage_header()
+
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.send_header('X-App-Usage', usage)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def run_extraction(base_url: str, account_id: str, max_workers: int) -> Dict[str, Any]:
+    """Run a full extraction and return the frames, timing and counters"""
+    extractor = MetaAPIExtractor(
+        access_token='stub-token',
+        account_id=account_id,
+        base_url=base_url,
+        max_workers=max_workers,
+        rate_limiter=GraphRateLimiter(rate_per_second=1000, burst=200)
+    )
+
+    start = time.perf_counter()
+    connected = extractor.test_connection()
+    account_metrics = extractor.extract_account_insights(days=90)
+    posts = extractor.extract_recent_posts(limit=100)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'connected': connected,
+        'account_metrics': account_metrics,
+        'posts': posts,
+        'elapsed': elapsed,
+        'stats': extractor.get_stats()
+    }
+
+
+def check(condition: bool, message: str) -> bool:
+    """Print a check result"""
+    print(f"   {'✓' if condition else '❌'} {message}")
+    return condition
+
+
+def main():
+    parser = argparse.ArgumentParser(description='MetaAPIExtractor stub server test')
+    parser.add_argument('--latency', type=float, default=0.05, help='Stub latency per HTTP request (s)')
+    parser.add_argument('--workers', type=int, default=8, help='Extractor max_workers')
+    args = parser.parse_args()
+
+    print("\n" + "=" * 60)
+    print("META EXTRACTOR - STUB SERVER TEST")
+    print("=" * 60)
+
+    recordings = json.loads(RECORDINGS_PATH.read_text())
+    stub = GraphStub(recordings, latency=args.latency)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(stub))
+    stub.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    base_url = f"{stub.base_url}/{recordings['api_version']}"
+    account_id = recordings['account_id']
+
+    recorded_posts = sum(
+        len(r['body'].get('data', []))
+        for r in recordings['responses'] if r['path'].endswith('/media')
+    )
+
+    all_passed = True
+    results = {}
+
+    for workers in (1, args.workers):
+        print(f"\n▶ Extraction with max_workers={workers}")
+        stub.http_requests = stub.graph_calls = 0
+        result = run_extraction(base_url, account_id, workers)
+        results[workers] = result
+
+        posts = result['posts']
+        stats = result['stats']
+
+        all_passed &= check(result['connected'], "Connection test replayed")
+        all_passed &= check(len(result['account_metrics']) == 30, "30 days of account metrics merged across windows")
+        all_passed &= check(len(posts) == recorded_posts, f"{recorded_posts} posts collected across paging.next cursors")
+        all_passed &= check(posts['post_id'].is_unique, "No duplicate posts")
+        all_passed &= check((posts['reach'] > 0).sum() == recorded_posts - 1, "Insights parsed (one recorded error -> zeros)")
+        all_passed &= check(stats['batch_requests'] == 3, "Insights fetched in batch calls (3 account windows -> 1, 60 posts -> 2)")
+        all_passed &= check(stats['http_requests'] == stub.http_requests, "Extractor and stub agree on round-trips")
+
+        print(f"   HTTP round-trips: {stats['http_requests']} (Graph calls: {stats['graph_calls']})")
+        print(f"   Elapsed: {result['elapsed']:.2f}s")
+        print(f"   Rate limiter: {stats['rate_limiter']}")
+
+    serial, parallel = results[1], results[args.workers]
+    all_passed &= check(
+        serial['posts'].drop(columns='updated_at').equals(parallel['posts'].drop(columns='updated_at')),
+        "Serial and concurrent runs return identical posts"
+    )
+
+    print("\n▶ Incremental sync (high-water marks in SQLite)")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_manager = DataManager(db_path=f"{tmp_dir}/sync_test.db")
+        extractor = MetaAPIExtractor(
+            access_token='stub-token',
+            account_id=account_id,
+            base_url=base_url,
+            rate_limiter=GraphRateLimiter(rate_per_second=1000, burst=200)
+        )
+
+        first = extractor.sync(data_manager, maturity_days=14)
+        second = extractor.sync(data_manager, maturity_days=14)
+        state = data_manager.get_sync_state(account_id)
+        data_manager.close()
+
+    all_passed &= check(first['mode'] == 'full' and first['new_posts'] == recorded_posts, "First sync is a full extraction")
+    all_passed &= check(second['mode'] == 'incremental', "Second sync reads the high-water mark")
+    # Recorded posts are all past the maturity window: only the newest (at the mark) is re-listed
+    all_passed &= check(second['new_posts'] == 0 and second['refreshed_posts'] == 1, "Mature posts are not re-fetched")
+    all_passed &= check(second['graph_calls'] < first['graph_calls'] / 5, f"Graph calls {first['graph_calls']} -> {second['graph_calls']}")
+    all_passed &= check(state['last_post_timestamp'] is not None, "Post high-water mark stored")
+
+    print("\n▶ Sync with a failed insights window (batch sub-response None)")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_manager = DataManager(db_path=f"{tmp_dir}/gap_test.db")
+        extractor = MetaAPIExtractor(
+            access_token='stub-token',
+            account_id=account_id,
+            base_url=base_url,
+            rate_limiter=GraphRateLimiter(rate_per_second=1000, burst=200)
+        )
+
+        insights_since = []
+        batch_get = extractor._batch_get
+
+        def failing_batch_get(relative_urls):
+            responses = batch_get(relative_urls)
+            if f"/{account_id}/insights?" in relative_urls[0]:
+                insights_since.append(min(
+                    int(parse_qs(urlsplit(url).query)['since'][0]) for url in relative_urls
+                ))
+                if len(insights_since) == 1:
+                    responses[0] = None  # Oldest window of the first sync fails
+            return responses
+
+        extractor._batch_get = failing_batch_get
+        gap_sync = extractor.sync(data_manager, maturity_days=14)
+        gap_state = data_manager.get_sync_state(account_id)
+        extractor.sync(data_manager, maturity_days=14)
+        data_manager.close()
+
+    failed = gap_sync['failed_metrics_windows']
+    all_passed &= check(len(failed) == 1, "Failed window reported by sync()")
+    all_passed &= check(
+        failed and gap_state['last_metrics_date'] < pd.Timestamp(failed[0][0]),
+        "Metrics mark not moved past the failed window"
+    )
+    all_passed &= check(
+        failed and len(insights_since) == 2
+        and datetime.fromtimestamp(insights_since[1]).date() <= failed[0][0],
+        "Next sync fetches the failed window again"
+    )
+
+    print("\n▶ Usage header parsing")
+    all_passed &= check(
+        parse_usage_headers({'X-App-Usage': '{"call_count": 80, "total_cputime": 10, "total_time": 12}'}) == (80.0, 0),
+        "X-App-Usage -> highest percentage"
+    )
+    buc = json.dumps({'123': [{'type': 'instagram', 'call_count': 50, 'total_cputime': 96,
+                               'total_time': 20, 'estimated_time_to_regain_access': 3}]})
+    all_passed &= check(
+        parse_usage_headers({'X-Business-Use-Case-Usage': buc}) == (96.0, 3),
+        "X-Business-Use-Case-Usage -> usage and regain time"
+    )
+
+    limiter = GraphRateLimiter(rate_per_second=100, burst=10, throttle_pct=75, pause_pct=95)
+    limiter.update_from_headers({'X-App-Usage': '{"call_count": 85}'})
+    all_passed &= check(limiter.get_stats()['rate_per_second'] == 50.0, "Refill rate halves at 85% usage")
+
+    server.shutdown()
+
+    print("\n" + "=" * 60)
+    print("✅ All checks passed" if all_passed else "❌ Some checks failed")
+    print(f"   Per-post requests would need {2 + recorded_posts + 3} round-trips; "
+          f"batched: {parallel['stats']['http_requests']}")
+    print(f"   Elapsed serial: {serial['elapsed']:.2f}s, concurrent: {parallel['elapsed']:.2f}s")
+    print("=" * 60 + "\n")
+
+    return 0 if all_passed else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
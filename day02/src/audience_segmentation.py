@@ -31,7 +31,7 @@ class AudienceAnalyzer:
         Returns:
             Dictionary with segments: 'vip', 'high', 'medium', 'low'
         """
-        posts = self.dm.get_posts()
+        posts = self.dm.get_posts_snapshot()
 
         if posts.empty:
             print("   ⚠️  No posts to segment")
@@ -76,16 +76,12 @@ class AudienceAnalyzer:
         Returns:
             Dictionary with 'hours' and 'days' lists
         """
-        posts = self.dm.get_posts()
+        posts = self.dm.get_posts_snapshot()
 
         if posts.empty:
             print("   ⚠️  No posts to analyze for timing")
             return {'hours': [], 'days': []}
 
-        # Extract hour and day of week
-        posts['hour'] = pd.to_datetime(posts['timestamp']).dt.hour
-        posts['day_of_week'] = pd.to_datetime(posts['timestamp']).dt.day_name()
-
         # Calculate average engagement by hour
         hour_engagement = posts.groupby('hour')['engagement_rate'].mean()
         best_hours = hour_engagement.nlargest(3).index.tolist()
@@ -109,7 +105,7 @@ class AudienceAnalyzer:
         Returns:
             DataFrame with viral posts
         """
-        posts = self.dm.get_posts()
+        posts = self.dm.get_posts_snapshot()
 
         if posts.empty:
             print("   ⚠️  No posts to analyze for viral content")
@@ -134,7 +130,7 @@ class AudienceAnalyzer:
         Returns:
             Dictionary with stats for each media type
         """
-        posts = self.dm.get_posts()
+        posts = self.dm.get_posts_snapshot()
 
         if posts.empty:
             print("   ⚠️  No posts to analyze by content type")
@@ -171,7 +167,7 @@ class AudienceAnalyzer:
         Returns:
             DataFrame with top posts
         """
-        posts = self.dm.get_posts()
+        posts = self.dm.get_posts_snapshot()
 
         if posts.empty:
             return pd.DataFrame()
@@ -193,7 +189,7 @@ class AudienceAnalyzer:
         Returns:
             Dictionary with trend analysis
         """
-        posts = self.dm.get_posts()
+        posts = self.dm.get_posts_snapshot()
 
         if posts.empty or len(posts) < 2:
             return {
@@ -208,9 +204,8 @@ class AudienceAnalyzer:
 
         # Split into recent (last 30 days) and older
         cutoff_date = pd.Timestamp.now(tz='UTC') - pd.Timedelta(days=30)
-        posts['timestamp_dt'] = pd.to_datetime(posts['timestamp'])
-        recent_posts = posts[posts['timestamp_dt'] >= cutoff_date]
-        older_posts = posts[posts['timestamp_dt'] < cutoff_date]
+        recent_posts = posts[posts['timestamp'] >= cutoff_date]
+        older_posts = posts[posts['timestamp'] < cutoff_date]
 
         if recent_posts.empty or older_posts.empty:
             return {
@@ -274,7 +269,7 @@ class AudienceAnalyzer:
         Returns:
             List of recommendation strings
         """
-        posts = self.dm.get_posts()
+        posts = self.dm.get_posts_snapshot()
 
         if posts.empty:
             return ["Insufficient data for recommendations"]
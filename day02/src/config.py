@@ -42,7 +42,8 @@ def validate_credentials():
 
 # Meta API Settings
 META_API_VERSION = 'v24.0'  # Updated to latest version
-META_BASE_URL = f'https://graph.facebook.com/{META_API_VERSION}'
+META_GRAPH_URL = 'https://graph.facebook.com'
+META_BASE_URL = f'{META_GRAPH_URL}/{META_API_VERSION}'
 
 # Metrics Configuration
 ACCOUNT_METRICS = [
@@ -69,16 +70,49 @@ DB_PATH = project_dir / 'data' / 'creator_intel.db'
 # Ensure data directory exists
 DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
+# SQLite Connection Pool Configuration
+SQLITE_POOL_SIZE = 4  # Persistent connections shared per database file
+SQLITE_CACHE_SIZE_KB = 65536  # 64 MB page cache per connection
+SQLITE_MMAP_SIZE_BYTES = 268435456  # 256 MB memory-mapped I/O
+SQLITE_CACHED_STATEMENTS = 256  # Prepared statements kept per connection
+SQLITE_BUSY_TIMEOUT_MS = 5000
+
+# LLM Response Cache Configuration (stored in DB_PATH)
+LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED_DAY02', 'true').lower() != 'false'
+LLM_CACHE_TTL_HOURS = 168  # Cached responses older than 7 days are re-generated
+LLM_CACHE_MAX_ENTRIES = 500  # Least recently used responses are evicted above this
+LLM_MAX_CONCURRENCY = 3  # Independent OpenAI calls run in parallel in the LTV pipeline
+
 # Rate Limiting Configuration
 MAX_RETRIES = 3
 RETRY_DELAY = 2  # seconds
 REQUEST_TIMEOUT = 30  # seconds
 
+# Concurrent Extraction Configuration
+META_MAX_WORKERS = 8  # Parallel Graph API calls per extractor
+META_BATCH_SIZE = 50  # Sub-requests per Graph batch call (Meta maximum is 50)
+META_MEDIA_PAGE_SIZE = 50  # Posts per page when following paging.next cursors
+META_INSIGHTS_WINDOW_DAYS = 30  # Maximum since/until span for daily account insights
+META_RATE_LIMIT_PER_SECOND = 20.0  # Token bucket refill rate (calls per second)
+META_RATE_LIMIT_BURST = 50  # Token bucket capacity
+META_USAGE_THROTTLE_PCT = 75  # Start slowing down above this X-App-Usage percentage
+META_USAGE_PAUSE_PCT = 95  # Pause until usage recovers above this percentage
+META_USAGE_PAUSE_SECONDS = 60  # Pause length when no regain time is reported
+
+# Incremental Sync Configuration
+POST_MATURITY_DAYS = 14  # Posts older than this are not re-fetched (metrics have settled)
+SYNC_METRICS_OVERLAP_DAYS = 2  # Re-fetch the last N synced days (Meta revises recent values)
+
 # Analysis Configuration
 LOOKBACK_DAYS = 90  # Account metrics lookback period
 MAX_POSTS = 100  # Number of recent posts to analyze
 VIRAL_THRESHOLD_MULTIPLIER = 2.0  # Posts with engagement > 2x average are "viral"
 
+# Monte-Carlo Growth Simulation Configuration
+GROWTH_SIM_PATHS = 10000  # Simulated weekly-growth paths
+GROWTH_SIM_WEEKS = 26  # Projection horizon (6 months)
+GROWTH_SIM_PERCENTILES = (5, 50, 95)  # Reported percentile bands
+
 # Engagement Weight Configuration (for calculating engagement rate)
 ENGAGEMENT_WEIGHTS = {
     'likes': 1,
@@ -4,11 +4,88 @@ Handles all SQLite database operations
 """
 
 import sqlite3
+import threading
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 import pandas as pd
 
 from . import config
+from .sqlite_pool import get_pool
+
+
+ACCOUNT_METRICS_DDL = """
+    CREATE TABLE IF NOT EXISTS account_metrics (
+        date DATE PRIMARY KEY,
+        followers INTEGER,
+        impressions INTEGER,
+        reach INTEGER,
+        profile_views INTEGER,
+        website_clicks INTEGER,
+        updated_at TIMESTAMP
+    )
+"""
+
+POSTS_DDL = """
+    CREATE TABLE IF NOT EXISTS posts (
+        post_id TEXT PRIMARY KEY,
+        caption TEXT,
+        media_type TEXT,
+        timestamp TIMESTAMP,
+        likes INTEGER,
+        comments INTEGER,
+        shares INTEGER,
+        saves INTEGER,
+        impressions INTEGER,
+        reach INTEGER,
+        engagement_rate REAL,
+        updated_at TIMESTAMP
+    )
+"""
+
+SYNC_STATE_DDL = """
+    CREATE TABLE IF NOT EXISTS sync_state (
+        account_id TEXT PRIMARY KEY,
+        last_post_timestamp TIMESTAMP,
+        last_metrics_date DATE,
+        synced_at TIMESTAMP
+    )
+"""
+
+
+DAILY_ROLLUP_DDL = """
+    CREATE TABLE IF NOT EXISTS daily_rollup (
+        date DATE PRIMARY KEY,
+        followers INTEGER,
+        followers_delta INTEGER,
+        reach INTEGER,
+        posts_count INTEGER NOT NULL DEFAULT 0,
+        engagement_sum REAL NOT NULL DEFAULT 0,
+        engagement_count INTEGER NOT NULL DEFAULT 0,
+        engagement_max REAL,
+        engagement_min REAL
+    )
+"""
+
+DAILY_ROLLUP_SEGMENTS_DDL = """
+    CREATE TABLE IF NOT EXISTS daily_rollup_segments (
+        date DATE NOT NULL,
+        media_type TEXT NOT NULL,
+        hour INTEGER NOT NULL,
+        posts_count INTEGER NOT NULL,
+        engagement_sum REAL NOT NULL,
+        engagement_count INTEGER NOT NULL,
+        engagement_max REAL,
+        engagement_min REAL,
+        PRIMARY KEY (date, media_type, hour)
+    )
+"""
+
+# Post timestamps are stored as UTC text ('YYYY-MM-DD HH:MM:SS+00:00')
+POST_DAY_SQL = "substr(timestamp, 1, 10)"
+POST_HOUR_SQL = "CAST(substr(timestamp, 12, 2) AS INTEGER)"
+
+# SQLite's default limit on bound parameters per statement
+SQLITE_MAX_PARAMS = 900
 
 
 class DataManager:
@@ -22,77 +99,164 @@ class DataManager:
             db_path: Path to SQLite database file (defaults to config.DB_PATH)
         """
         self.db_path = db_path or config.DB_PATH
+        self.pool = get_pool(self.db_path)
+
+        # Versioned in-memory snapshot of the posts table (see get_posts_snapshot)
+        self._data_version = 0
+        self._posts_snapshot: Optional[pd.DataFrame] = None
+        self._posts_snapshot_version = -1
+        self._snapshot_lock = threading.Lock()
+
         self._init_database()
 
     def _init_database(self):
         """Create database tables if they don't exist"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Create account_metrics table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS account_metrics (
-                date DATE PRIMARY KEY,
-                followers INTEGER,
-                impressions INTEGER,
-                reach INTEGER,
-                profile_views INTEGER,
-                website_clicks INTEGER,
-                updated_at TIMESTAMP
-            )
-        """)
-
-        # Create posts table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS posts (
-                post_id TEXT PRIMARY KEY,
-                caption TEXT,
-                media_type TEXT,
-                timestamp TIMESTAMP,
-                likes INTEGER,
-                comments INTEGER,
-                shares INTEGER,
-                saves INTEGER,
-                impressions INTEGER,
-                reach INTEGER,
-                engagement_rate REAL,
-                updated_at TIMESTAMP
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+
+            # Create account_metrics and posts tables (rebuilding legacy
+            # tables that were written without their primary keys)
+            self._ensure_table(cursor, 'account_metrics', ACCOUNT_METRICS_DDL, 'date')
+            self._ensure_table(cursor, 'posts', POSTS_DDL, 'post_id')
+            cursor.execute(SYNC_STATE_DDL)
+            cursor.execute(DAILY_ROLLUP_DDL)
+            cursor.execute(DAILY_ROLLUP_SEGMENTS_DDL)
+
+            self._create_indexes(cursor)
+
+            conn.commit()
+
+            # Databases written before the rollup existed are backfilled once
+            rollup_empty = cursor.execute("SELECT 1 FROM daily_rollup LIMIT 1").fetchone() is None
+            has_data = (
+                cursor.execute("SELECT 1 FROM posts LIMIT 1").fetchone() is not None or
+                cursor.execute("SELECT 1 FROM account_metrics LIMIT 1").fetchone() is not None
             )
-        """)
 
-        conn.commit()
-        conn.close()
+        if rollup_empty and has_data:
+            self.rebuild_rollup()
 
         print(f"✅ Database initialized: {self.db_path}")
 
+    def _ensure_table(self, cursor: sqlite3.Cursor, table: str, ddl: str, key: str):
+        """
+        Create a table, or rebuild it if an older version lost its primary key
+
+        Earlier versions saved with DataFrame.to_sql(if_exists='replace'),
+        which recreated the tables without PRIMARY KEY constraints. Those
+        tables are copied into the proper schema once (last row wins per key).
+
+        Args:
+            cursor: Open cursor
+            table: Table name
+            ddl: CREATE TABLE statement with the canonical schema
+            key: Primary key column
+        """
+        existing = {row[1]: row[5] for row in cursor.execute(f"PRAGMA table_info({table})")}
+
+        if not existing:
+            cursor.execute(ddl)
+            return
+
+        if existing.get(key):
+            return
+
+        print(f"   → Migrating legacy '{table}' table to keyed schema...")
+        cursor.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+        cursor.execute(ddl)
+
+        target_columns = [row[1] for row in cursor.execute(f"PRAGMA table_info({table})")]
+        # Synthetic data was once saved with 'id' instead of 'post_id'
+        source_key = key if key in existing else ('id' if 'id' in existing else None)
+
+        if source_key is not None:
+            copy_columns = [c for c in target_columns if c in existing and c != key]
+            cursor.execute(f"""
+                INSERT OR REPLACE INTO {table} ({', '.join([key] + copy_columns)})
+                SELECT {', '.join([source_key] + copy_columns)}
+                FROM {table}_legacy
+                WHERE {source_key} IS NOT NULL
+                ORDER BY rowid
+            """)
+
+        cursor.execute(f"DROP TABLE {table}_legacy")
+
+    def _create_indexes(self, cursor: sqlite3.Cursor):
+        """Create indexes used by the analyzers' filters and sorts"""
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_posts_timestamp ON posts(timestamp)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_posts_media_type ON posts(media_type)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_posts_engagement_rate ON posts(engagement_rate)")
+        # Lets the rollup refresh re-aggregate a handful of days without a scan
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_posts_day ON posts({POST_DAY_SQL})")
+
+    def close(self):
+        """Close all pooled connections for this database"""
+        self.pool.close_all()
+
+    @property
+    def data_version(self) -> int:
+        """Counter bumped by every successful save; snapshots built for an older version are stale"""
+        return self._data_version
+
+    def invalidate_snapshot(self):
+        """Drop cached snapshots so the next read reloads from SQLite"""
+        with self._snapshot_lock:
+            self._data_version += 1
+            self._posts_snapshot = None
+
+    def get_posts_snapshot(self) -> pd.DataFrame:
+        """
+        Get all posts as a typed, cached DataFrame shared by the analyzers
+
+        The table is read and parsed once per data version: timestamps are
+        parsed to UTC datetimes and 'hour' / 'day_of_week' are precomputed.
+        save_posts and save_account_metrics invalidate the snapshot.
+
+        Returns:
+            Shallow copy of the snapshot (callers may add columns freely,
+            but must not modify values in place)
+        """
+        with self._snapshot_lock:
+            if self._posts_snapshot is None or self._posts_snapshot_version != self._data_version:
+                version = self._data_version
+                posts = self.get_posts()
+
+                if not posts.empty and 'timestamp' in posts.columns:
+                    posts['timestamp'] = pd.to_datetime(posts['timestamp'], utc=True)
+                    posts['hour'] = posts['timestamp'].dt.hour
+                    posts['day_of_week'] = posts['timestamp'].dt.day_name()
+
+                self._posts_snapshot = posts
+                self._posts_snapshot_version = version
+
+            return self._posts_snapshot.copy(deep=False)
+
     def save_account_metrics(self, df: pd.DataFrame) -> int:
         """
-        Save account metrics to database (upsert)
+        Save account metrics to database (incremental upsert on date)
 
         Args:
             df: DataFrame with account metrics
 
         Returns:
-            Number of rows inserted/updated
+            Number of rows inserted or changed (unchanged rows are not rewritten)
         """
         if df.empty:
             print("   ⚠️  No account metrics to save")
             return 0
 
-        conn = sqlite3.connect(self.db_path)
+        df = df.copy()
+        df['date'] = pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d')
 
         try:
-            # Use replace to upsert (insert or update if exists)
-            df.to_sql(
-                'account_metrics',
-                conn,
-                if_exists='replace',
-                index=False,
-                method='multi'
+            rows = self._upsert(
+                'account_metrics', df, 'date',
+                rollup_days=lambda conn: set(df['date'].dropna())
             )
 
-            rows = len(df)
-            print(f"   ✓ Saved {rows} days of account metrics")
+            if rows:
+                self.invalidate_snapshot()
+            print(f"   ✓ Saved {rows} days of account metrics ({len(df) - rows} unchanged)")
 
             return rows
 
@@ -100,37 +264,37 @@ class DataManager:
             print(f"   ❌ Failed to save account metrics: {e}")
             return 0
 
-        finally:
-            conn.close()
-
     def save_posts(self, df: pd.DataFrame) -> int:
         """
-        Save posts data to database (upsert)
+        Save posts data to database (incremental upsert on post_id)
 
         Args:
             df: DataFrame with posts data
 
         Returns:
-            Number of rows inserted/updated
+            Number of rows inserted or changed (unchanged rows are not rewritten)
         """
         if df.empty:
             print("   ⚠️  No posts to save")
             return 0
 
-        conn = sqlite3.connect(self.db_path)
+        df = df.copy()
+        if 'post_id' not in df.columns and 'id' in df.columns:
+            df = df.rename(columns={'id': 'post_id'})
+        df['post_id'] = df['post_id'].astype(str)
+        if 'timestamp' in df.columns:
+            timestamps = pd.to_datetime(df['timestamp'], utc=True)
+            df['timestamp'] = timestamps.astype(str).where(timestamps.notna(), None)
 
         try:
-            # Use replace to upsert
-            df.to_sql(
-                'posts',
-                conn,
-                if_exists='replace',
-                index=False,
-                method='multi'
+            rows = self._upsert(
+                'posts', df, 'post_id',
+                rollup_days=lambda conn: self._post_days(conn, df)
             )
 
-            rows = len(df)
-            print(f"   ✓ Saved {rows} posts to database")
+            if rows:
+                self.invalidate_snapshot()
+            print(f"   ✓ Saved {rows} posts to database ({len(df) - rows} unchanged)")
 
             return rows
 
@@ -138,8 +302,280 @@ class DataManager:
             print(f"   ❌ Failed to save posts: {e}")
             return 0
 
-        finally:
-            conn.close()
+    def _upsert(
+        self,
+        table: str,
+        df: pd.DataFrame,
+        key: str,
+        rollup_days: Optional[Callable[[sqlite3.Connection], Set[str]]] = None
+    ) -> int:
+        """
+        Batch upsert rows in a single transaction
+
+        Uses INSERT ... ON CONFLICT(key) DO UPDATE for the columns present in
+        df. The update only fires when a value other than updated_at differs,
+        so unchanged rows are neither rewritten nor counted.
+
+        Args:
+            table: Target table
+            df: Rows to write (columns outside the table schema are ignored)
+            key: Primary key column
+            rollup_days: Returns the days ('YYYY-MM-DD') whose daily_rollup
+                rows the write can affect; called before the write and, if any
+                row changed, those days are refreshed in the same transaction
+
+        Returns:
+            Number of rows inserted or updated
+        """
+        with self.pool.connection() as conn:
+            table_columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+            columns = [c for c in table_columns if c in df.columns]
+            compared = [c for c in columns if c not in (key, 'updated_at')]
+
+            # Last occurrence wins if a batch repeats a key
+            df = df.drop_duplicates(subset=[key], keep='last')
+
+            assignments = ', '.join(f"{c} = excluded.{c}" for c in columns if c != key)
+            changed = ' OR '.join(f"{table}.{c} IS NOT excluded.{c}" for c in compared) or '1'
+            sql = f"""
+                INSERT INTO {table} ({', '.join(columns)})
+                VALUES ({', '.join('?' for _ in columns)})
+                ON CONFLICT({key}) DO UPDATE SET {assignments}
+                WHERE {changed}
+            """
+
+            values = []
+            for column in columns:
+                series = df[column]
+                if pd.api.types.is_datetime64_any_dtype(series):
+                    series = series.astype(str).where(series.notna(), None)
+                values.append(series.astype(object).where(series.notna(), None).tolist())
+
+            changes_before = conn.total_changes
+            with conn:
+                days = rollup_days(conn) if rollup_days is not None else set()
+                conn.executemany(sql, zip(*values))
+                changed = conn.total_changes - changes_before
+
+                if changed and days:
+                    if table == 'posts':
+                        self._refresh_post_rollup(conn, days)
+                    else:
+                        self._refresh_metrics_rollup(conn, min(days))
+
+            return changed
+
+    def _post_days(self, conn: sqlite3.Connection, df: pd.DataFrame) -> Set[str]:
+        """Days of the incoming posts plus the stored days of the same post IDs"""
+        days = set()
+        if 'timestamp' in df.columns:
+            days = {ts[:10] for ts in df['timestamp'].dropna()}
+
+        post_ids = df['post_id'].tolist()
+        for i in range(0, len(post_ids), SQLITE_MAX_PARAMS):
+            chunk = post_ids[i:i + SQLITE_MAX_PARAMS]
+            rows = conn.execute(
+                f"""
+                SELECT DISTINCT {POST_DAY_SQL} FROM posts
+                WHERE post_id IN ({', '.join('?' for _ in chunk)}) AND timestamp IS NOT NULL
+                """,
+                chunk
+            ).fetchall()
+            days.update(row[0] for row in rows)
+
+        return days
+
+    def _refresh_post_rollup(self, conn: sqlite3.Connection, days: Set[str]):
+        """
+        Re-aggregate the posts of the given days into the rollup tables
+
+        Args:
+            conn: Connection with an open transaction
+            days: Days ('YYYY-MM-DD') to recompute
+        """
+        days = sorted(days)
+
+        for i in range(0, len(days), SQLITE_MAX_PARAMS):
+            chunk = days[i:i + SQLITE_MAX_PARAMS]
+            placeholders = ', '.join('?' for _ in chunk)
+
+            conn.execute(f"DELETE FROM daily_rollup_segments WHERE date IN ({placeholders})", chunk)
+            conn.execute(f"""
+                INSERT INTO daily_rollup_segments (
+                    date, media_type, hour, posts_count,
+                    engagement_sum, engagement_count, engagement_max, engagement_min
+                )
+                SELECT
+                    {POST_DAY_SQL}, COALESCE(media_type, ''), {POST_HOUR_SQL}, COUNT(*),
+                    COALESCE(SUM(engagement_rate), 0), COUNT(engagement_rate),
+                    MAX(engagement_rate), MIN(engagement_rate)
+                FROM posts
+                WHERE {POST_DAY_SQL} IN ({placeholders})
+                GROUP BY 1, 2, 3
+            """, chunk)
+
+            # Days that lost all their posts drop back to zero
+            conn.execute(f"""
+                UPDATE daily_rollup
+                SET posts_count = 0, engagement_sum = 0, engagement_count = 0,
+                    engagement_max = NULL, engagement_min = NULL
+                WHERE date IN ({placeholders})
+            """, chunk)
+            conn.execute(f"""
+                INSERT INTO daily_rollup (
+                    date, posts_count, engagement_sum, engagement_count, engagement_max, engagement_min
+                )
+                SELECT
+                    date, SUM(posts_count), SUM(engagement_sum), SUM(engagement_count),
+                    MAX(engagement_max), MIN(engagement_min)
+                FROM daily_rollup_segments
+                WHERE date IN ({placeholders})
+                GROUP BY date
+                ON CONFLICT(date) DO UPDATE SET
+                    posts_count = excluded.posts_count,
+                    engagement_sum = excluded.engagement_sum,
+                    engagement_count = excluded.engagement_count,
+                    engagement_max = excluded.engagement_max,
+                    engagement_min = excluded.engagement_min
+            """, chunk)
+
+    def _refresh_metrics_rollup(self, conn: sqlite3.Connection, from_day: str):
+        """
+        Recompute followers, followers_delta and reach from a day onwards
+
+        The delta of the first recomputed day is taken against the latest
+        stored follower count before it, so only O(new days) rows are read.
+
+        Args:
+            conn: Connection with an open transaction
+            from_day: First day ('YYYY-MM-DD') whose account metrics changed
+        """
+        conn.execute("""
+            INSERT INTO daily_rollup (date, followers, followers_delta, reach)
+            SELECT date, followers, followers_delta, reach
+            FROM (
+                SELECT date, followers, reach,
+                       followers - LAG(followers) OVER (ORDER BY date) as followers_delta
+                FROM (
+                    SELECT date, followers, reach FROM account_metrics
+                    WHERE date >= :from_day AND followers IS NOT NULL
+                    UNION ALL
+                    SELECT date, followers, reach FROM (
+                        SELECT date, followers, reach FROM account_metrics
+                        WHERE date < :from_day AND followers IS NOT NULL
+                        ORDER BY date DESC LIMIT 1
+                    )
+                )
+            )
+            WHERE date >= :from_day
+            ON CONFLICT(date) DO UPDATE SET
+                followers = excluded.followers,
+                followers_delta = excluded.followers_delta,
+                reach = excluded.reach
+        """, {'from_day': from_day})
+
+        # Days without a follower count only carry reach
+        conn.execute("""
+            INSERT INTO daily_rollup (date, reach)
+            SELECT date, reach FROM account_metrics
+            WHERE date >= ? AND followers IS NULL
+            ON CONFLICT(date) DO UPDATE SET
+                followers = NULL, followers_delta = NULL, reach = excluded.reach
+        """, (from_day,))
+
+    def rebuild_rollup(self):
+        """Recompute daily_rollup and daily_rollup_segments from the raw tables"""
+        with self.pool.connection() as conn:
+            with conn:
+                conn.execute("DELETE FROM daily_rollup_segments")
+                conn.execute("DELETE FROM daily_rollup")
+
+                days = {
+                    row[0] for row in conn.execute(
+                        f"SELECT DISTINCT {POST_DAY_SQL} FROM posts WHERE timestamp IS NOT NULL"
+                    )
+                }
+                if days:
+                    self._refresh_post_rollup(conn, days)
+
+                first_day = conn.execute("SELECT MIN(date) FROM account_metrics").fetchone()[0]
+                if first_day is not None:
+                    self._refresh_metrics_rollup(conn, first_day)
+
+        print("   ✓ Rebuilt daily rollup")
+
+    def get_sync_state(self, account_id: str) -> Optional[Dict[str, any]]:
+        """
+        Get the high-water marks of the last sync for an account
+
+        Args:
+            account_id: Instagram Business account ID
+
+        Returns:
+            Dictionary with last_post_timestamp (UTC Timestamp or None),
+            last_metrics_date (Timestamp or None) and synced_at, or None if
+            the account was never synced
+        """
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                """
+                SELECT last_post_timestamp, last_metrics_date, synced_at
+                FROM sync_state WHERE account_id = ?
+                """,
+                (str(account_id),)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return {
+            'last_post_timestamp': pd.to_datetime(row[0], utc=True) if row[0] else None,
+            'last_metrics_date': pd.to_datetime(row[1]) if row[1] else None,
+            'synced_at': row[2]
+        }
+
+    def save_sync_state(
+        self,
+        account_id: str,
+        last_post_timestamp: Optional[datetime] = None,
+        last_metrics_date: Optional[datetime] = None
+    ):
+        """
+        Advance the high-water marks of an account (marks never move backwards)
+
+        Args:
+            account_id: Instagram Business account ID
+            last_post_timestamp: Timestamp of the newest post stored
+            last_metrics_date: Newest account_metrics date stored
+        """
+        post_mark = None
+        if last_post_timestamp is not None:
+            # Same UTC text format save_posts writes, so marks compare as strings
+            post_mark = str(pd.to_datetime(last_post_timestamp, utc=True))
+        metrics_mark = (
+            pd.Timestamp(last_metrics_date).strftime('%Y-%m-%d')
+            if last_metrics_date is not None else None
+        )
+
+        with self.pool.connection() as conn:
+            with conn:
+                conn.execute(
+                    """
+                    INSERT INTO sync_state (account_id, last_post_timestamp, last_metrics_date, synced_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT(account_id) DO UPDATE SET
+                        last_post_timestamp = COALESCE(
+                            MAX(excluded.last_post_timestamp, sync_state.last_post_timestamp),
+                            excluded.last_post_timestamp, sync_state.last_post_timestamp
+                        ),
+                        last_metrics_date = COALESCE(
+                            MAX(excluded.last_metrics_date, sync_state.last_metrics_date),
+                            excluded.last_metrics_date, sync_state.last_metrics_date
+                        ),
+                        synced_at = excluded.synced_at
+                    """,
+                    (str(account_id), post_mark, metrics_mark, datetime.now().isoformat())
+                )
 
     def get_account_metrics(
         self,
@@ -156,39 +592,35 @@ class DataManager:
         Returns:
             DataFrame with account metrics
         """
-        conn = sqlite3.connect(self.db_path)
-
-        try:
-            query = "SELECT * FROM account_metrics"
-            params = []
-
-            if start_date or end_date:
-                conditions = []
-                if start_date:
-                    conditions.append("date >= ?")
-                    params.append(start_date.date())
-                if end_date:
-                    conditions.append("date <= ?")
-                    params.append(end_date.date())
+        with self.pool.connection() as conn:
+            try:
+                query = "SELECT * FROM account_metrics"
+                params = []
 
-                query += " WHERE " + " AND ".join(conditions)
+                if start_date or end_date:
+                    conditions = []
+                    if start_date:
+                        conditions.append("date >= ?")
+                        params.append(start_date.date())
+                    if end_date:
+                        conditions.append("date <= ?")
+                        params.append(end_date.date())
 
-            query += " ORDER BY date"
+                    query += " WHERE " + " AND ".join(conditions)
 
-            df = pd.read_sql_query(query, conn, params=params)
+                query += " ORDER BY date"
 
-            # Convert date column to datetime
-            if not df.empty and 'date' in df.columns:
-                df['date'] = pd.to_datetime(df['date'])
+                df = pd.read_sql_query(query, conn, params=params)
 
-            return df
+                # Convert date column to datetime
+                if not df.empty and 'date' in df.columns:
+                    df['date'] = pd.to_datetime(df['date'])
 
-        except Exception as e:
-            print(f"   ❌ Failed to retrieve account metrics: {e}")
-            return pd.DataFrame()
+                return df
 
-        finally:
-            conn.close()
+            except Exception as e:
+                print(f"   ❌ Failed to retrieve account metrics: {e}")
+                return pd.DataFrame()
 
     def get_posts(
         self,
@@ -207,42 +639,39 @@ class DataManager:
         Returns:
             DataFrame with posts data
         """
-        conn = sqlite3.connect(self.db_path)
-
-        try:
-            query = "SELECT * FROM posts"
-            params = []
+        with self.pool.connection() as conn:
+            try:
+                query = "SELECT * FROM posts"
+                params = []
 
-            if start_date or end_date:
-                conditions = []
-                if start_date:
-                    conditions.append("timestamp >= ?")
-                    params.append(start_date)
-                if end_date:
-                    conditions.append("timestamp <= ?")
-                    params.append(end_date)
+                if start_date or end_date:
+                    conditions = []
+                    if start_date:
+                        conditions.append("timestamp >= ?")
+                        params.append(start_date)
+                    if end_date:
+                        conditions.append("timestamp <= ?")
+                        params.append(end_date)
 
-                query += " WHERE " + " AND ".join(conditions)
+                    query += " WHERE " + " AND ".join(conditions)
 
-            query += " ORDER BY timestamp DESC"
+                query += " ORDER BY timestamp DESC"
 
-            if limit:
-                query += f" LIMIT {limit}"
+                if limit:
+                    query += " LIMIT ?"
+                    params.append(int(limit))
 
-            df = pd.read_sql_query(query, conn, params=params)
+                df = pd.read_sql_query(query, conn, params=params)
 
-            # Convert timestamp column to datetime
-            if not df.empty and 'timestamp' in df.columns:
-                df['timestamp'] = pd.to_datetime(df['timestamp'])
+                # Convert timestamp column to datetime
+                if not df.empty and 'timestamp' in df.columns:
+                    df['timestamp'] = pd.to_datetime(df['timestamp'])
 
-            return df
-
-        except Exception as e:
-            print(f"   ❌ Failed to retrieve posts: {e}")
-            return pd.DataFrame()
+                return df
 
-        finally:
-            conn.close()
+            except Exception as e:
+                print(f"   ❌ Failed to retrieve posts: {e}")
+                return pd.DataFrame()
 
     def get_growth_metrics(self) -> Dict[str, any]:
         """
@@ -251,113 +680,123 @@ class DataManager:
         Returns:
             Dictionary with growth metrics
         """
-        conn = sqlite3.connect(self.db_path)
+        with self.pool.connection() as conn:
+            try:
+                # Get latest and week-ago follower counts
+                query = """
+                    SELECT date, followers
+                    FROM daily_rollup
+                    WHERE followers IS NOT NULL
+                    ORDER BY date DESC
+                    LIMIT 1
+                """
+
+                df_latest = pd.read_sql_query(query, conn)
+
+                if df_latest.empty:
+                    return {
+                        'current_followers': 0,
+                        'weekly_growth_rate': 0.0,
+                        'on_track': False,
+                        'target_rate': config.TARGET_WEEKLY_GROWTH_RATE
+                    }
+
+                current_followers = int(df_latest.iloc[0]['followers'])
+                latest_date = pd.to_datetime(df_latest.iloc[0]['date'])
+
+                # Get follower count from 7 days ago
+                week_ago = latest_date - timedelta(days=7)
+
+                query_week_ago = """
+                    SELECT followers
+                    FROM daily_rollup
+                    WHERE date <= ? AND followers IS NOT NULL
+                    ORDER BY date DESC
+                    LIMIT 1
+                """
+
+                df_week_ago = pd.read_sql_query(
+                    query_week_ago,
+                    conn,
+                    params=[week_ago.date()]
+                )
 
-        try:
-            # Get latest and week-ago follower counts
-            query = """
-                SELECT date, followers
-                FROM account_metrics
-                WHERE followers IS NOT NULL
-                ORDER BY date DESC
-                LIMIT 1
-            """
+                if not df_week_ago.empty:
+                    followers_week_ago = int(df_week_ago.iloc[0]['followers'])
+                    weekly_growth_rate = (
+                        (current_followers - followers_week_ago) / followers_week_ago * 100
+                    )
+                else:
+                    weekly_growth_rate = 0.0
+
+                # Check if on track
+                on_track = weekly_growth_rate >= config.TARGET_WEEKLY_GROWTH_RATE
 
-            df_latest = pd.read_sql_query(query, conn)
+                # Calculate total reach (90 days)
+                query_reach = """
+                    SELECT COALESCE(SUM(reach), 0) as total_reach
+                    FROM daily_rollup
+                """
+
+                df_reach = pd.read_sql_query(query_reach, conn)
+                total_reach = int(df_reach.iloc[0]['total_reach']) if not df_reach.empty else 0
 
-            if df_latest.empty:
+                return {
+                    'current_followers': current_followers,
+                    'weekly_growth_rate': round(weekly_growth_rate, 2),
+                    'on_track': on_track,
+                    'target_rate': config.TARGET_WEEKLY_GROWTH_RATE,
+                    'total_reach_90d': total_reach
+                }
+
+            except Exception as e:
+                print(f"   ❌ Failed to calculate growth metrics: {e}")
                 return {
                     'current_followers': 0,
                     'weekly_growth_rate': 0.0,
                     'on_track': False,
-                    'target_rate': config.TARGET_WEEKLY_GROWTH_RATE
+                    'target_rate': config.TARGET_WEEKLY_GROWTH_RATE,
+                    'total_reach_90d': 0
                 }
 
-            current_followers = int(df_latest.iloc[0]['followers'])
-            latest_date = pd.to_datetime(df_latest.iloc[0]['date'])
-
-            # Get follower count from 7 days ago
-            week_ago = latest_date - timedelta(days=7)
-
-            query_week_ago = """
-                SELECT followers
-                FROM account_metrics
-                WHERE date <= ? AND followers IS NOT NULL
-                ORDER BY date DESC
-                LIMIT 1
-            """
-
-            df_week_ago = pd.read_sql_query(
-                query_week_ago,
-                conn,
-                params=[week_ago.date()]
-            )
-
-            if not df_week_ago.empty:
-                followers_week_ago = int(df_week_ago.iloc[0]['followers'])
-                weekly_growth_rate = (
-                    (current_followers - followers_week_ago) / followers_week_ago * 100
-                )
-            else:
-                weekly_growth_rate = 0.0
-
-            # Check if on track
-            on_track = weekly_growth_rate >= config.TARGET_WEEKLY_GROWTH_RATE
-
-            # Calculate total reach (90 days)
-            query_reach = """
-                SELECT SUM(reach) as total_reach
-                FROM account_metrics
-                WHERE reach IS NOT NULL
-            """
-
-            df_reach = pd.read_sql_query(query_reach, conn)
-            total_reach = int(df_reach.iloc[0]['total_reach']) if not df_reach.empty else 0
-
-            return {
-                'current_followers': current_followers,
-                'weekly_growth_rate': round(weekly_growth_rate, 2),
-                'on_track': on_track,
-                'target_rate': config.TARGET_WEEKLY_GROWTH_RATE,
-                'total_reach_90d': total_reach
-            }
-
-        except Exception as e:
-            print(f"   ❌ Failed to calculate growth metrics: {e}")
-            return {
-                'current_followers': 0,
-                'weekly_growth_rate': 0.0,
-                'on_track': False,
-                'target_rate': config.TARGET_WEEKLY_GROWTH_RATE,
-                'total_reach_90d': 0
-            }
-
-        finally:
-            conn.close()
-
     def get_engagement_stats(self) -> Dict[str, any]:
         """
-        Calculate engagement statistics from posts
+        Calculate engagement statistics from the daily rollup
 
         Returns:
             Dictionary with engagement stats
         """
-        conn = sqlite3.connect(self.db_path)
+        with self.pool.connection() as conn:
+            try:
+                query = """
+                    SELECT
+                        SUM(engagement_sum) / SUM(engagement_count) as avg_engagement_rate,
+                        SUM(engagement_count) as total_posts,
+                        MAX(engagement_max) as max_engagement_rate,
+                        MIN(engagement_min) as min_engagement_rate
+                    FROM daily_rollup
+                    WHERE engagement_count > 0
+                """
+
+                df = pd.read_sql_query(query, conn)
+
+                if df.empty or pd.isna(df.iloc[0]['total_posts']):
+                    return {
+                        'avg_engagement_rate': 0.0,
+                        'total_posts': 0,
+                        'max_engagement_rate': 0.0,
+                        'min_engagement_rate': 0.0
+                    }
 
-        try:
-            query = """
-                SELECT
-                    AVG(engagement_rate) as avg_engagement_rate,
-                    COUNT(*) as total_posts,
-                    MAX(engagement_rate) as max_engagement_rate,
-                    MIN(engagement_rate) as min_engagement_rate
-                FROM posts
-                WHERE engagement_rate IS NOT NULL
-            """
-
-            df = pd.read_sql_query(query, conn)
+                return {
+                    'avg_engagement_rate': round(float(df.iloc[0]['avg_engagement_rate']), 2),
+                    'total_posts': int(df.iloc[0]['total_posts']),
+                    'max_engagement_rate': round(float(df.iloc[0]['max_engagement_rate']), 2),
+                    'min_engagement_rate': round(float(df.iloc[0]['min_engagement_rate']), 2)
+                }
 
-            if df.empty or df.iloc[0]['total_posts'] is None:
+            except Exception as e:
+                print(f"   ❌ Failed to calculate engagement stats: {e}")
                 return {
                     'avg_engagement_rate': 0.0,
                     'total_posts': 0,
@@ -365,24 +804,33 @@ class DataManager:
                     'min_engagement_rate': 0.0
                 }
 
-            return {
-                'avg_engagement_rate': round(float(df.iloc[0]['avg_engagement_rate']), 2),
-                'total_posts': int(df.iloc[0]['total_posts']),
-                'max_engagement_rate': round(float(df.iloc[0]['max_engagement_rate']), 2),
-                'min_engagement_rate': round(float(df.iloc[0]['min_engagement_rate']), 2)
-            }
+    def get_engagement_breakdown(self, by: str = 'media_type') -> pd.DataFrame:
+        """
+        Engagement by media type or posting hour from the rollup segments
 
-        except Exception as e:
-            print(f"   ❌ Failed to calculate engagement stats: {e}")
-            return {
-                'avg_engagement_rate': 0.0,
-                'total_posts': 0,
-                'max_engagement_rate': 0.0,
-                'min_engagement_rate': 0.0
-            }
+        Args:
+            by: 'media_type' or 'hour'
 
-        finally:
-            conn.close()
+        Returns:
+            DataFrame with posts, avg/max/min engagement_rate per group
+        """
+        if by not in ('media_type', 'hour'):
+            raise ValueError(f"Unsupported breakdown '{by}' (use 'media_type' or 'hour')")
+
+        query = f"""
+            SELECT
+                {by},
+                SUM(posts_count) as posts,
+                SUM(engagement_sum) / NULLIF(SUM(engagement_count), 0) as avg_engagement_rate,
+                MAX(engagement_max) as max_engagement_rate,
+                MIN(engagement_min) as min_engagement_rate
+            FROM daily_rollup_segments
+            GROUP BY {by}
+            ORDER BY {by}
+        """
+
+        with self.pool.connection() as conn:
+            return pd.read_sql_query(query, conn)
 
     def get_database_summary(self) -> Dict[str, any]:
         """
@@ -391,40 +839,36 @@ class DataManager:
         Returns:
             Dictionary with database summary
         """
-        conn = sqlite3.connect(self.db_path)
-
-        try:
-            # Count account metrics
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM account_metrics")
-            metrics_count = cursor.fetchone()[0]
+        with self.pool.connection() as conn:
+            try:
+                # Count account metrics
+                cursor = conn.cursor()
+                cursor.execute("SELECT COUNT(*) FROM account_metrics")
+                metrics_count = cursor.fetchone()[0]
+
+                # Count posts
+                cursor.execute("SELECT COUNT(*) FROM posts")
+                posts_count = cursor.fetchone()[0]
+
+                # Get date range
+                cursor.execute("""
+                    SELECT MIN(date) as min_date, MAX(date) as max_date
+                    FROM account_metrics
+                """)
+                date_range = cursor.fetchone()
 
-            # Count posts
-            cursor.execute("SELECT COUNT(*) FROM posts")
-            posts_count = cursor.fetchone()[0]
-
-            # Get date range
-            cursor.execute("""
-                SELECT MIN(date) as min_date, MAX(date) as max_date
-                FROM account_metrics
-            """)
-            date_range = cursor.fetchone()
-
-            return {
-                'account_metrics_count': metrics_count,
-                'posts_count': posts_count,
-                'date_range_start': date_range[0] if date_range[0] else 'N/A',
-                'date_range_end': date_range[1] if date_range[1] else 'N/A'
-            }
+                return {
+                    'account_metrics_count': metrics_count,
+                    'posts_count': posts_count,
+                    'date_range_start': date_range[0] if date_range[0] else 'N/A',
+                    'date_range_end': date_range[1] if date_range[1] else 'N/A'
+                }
 
-        except Exception as e:
-            print(f"   ❌ Failed to get database summary: {e}")
-            return {
-                'account_metrics_count': 0,
-                'posts_count': 0,
-                'date_range_start': 'N/A',
-                'date_range_end': 'N/A'
-            }
-
-        finally:
-            conn.close()
+            except Exception as e:
+                print(f"   ❌ Failed to get database summary: {e}")
+                return {
+                    'account_metrics_count': 0,
+                    'posts_count': 0,
+                    'date_range_start': 'N/A',
+                    'date_range_end': 'N/A'
+                }
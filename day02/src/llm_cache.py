@@ -0,0 +1,244 @@
+"""
+LLM Response Cache for Day 02 - Creator Intelligence System
+Content-addressed cache of chat completion responses stored in the SQLite database
+"""
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from . import config
+from .sqlite_pool import get_pool
+
+
+LLM_CACHE_DDL = """
+    CREATE TABLE IF NOT EXISTS llm_cache (
+        cache_key TEXT PRIMARY KEY,
+        model TEXT NOT NULL,
+        prompt_hash TEXT NOT NULL,
+        temperature REAL,
+        response TEXT NOT NULL,
+        prompt_tokens INTEGER,
+        completion_tokens INTEGER,
+        created_at REAL NOT NULL,
+        last_accessed_at REAL NOT NULL,
+        hit_count INTEGER NOT NULL DEFAULT 0
+    )
+"""
+
+
+class LLMResponseCache:
+    """
+    Persistent cache of LLM responses keyed on (model, prompt hash, temperature)
+
+    Entries expire after ttl_seconds; when more than max_entries are stored
+    the least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Union[str, Path]] = None,
+        ttl_seconds: float = config.LLM_CACHE_TTL_HOURS * 3600,
+        max_entries: int = config.LLM_CACHE_MAX_ENTRIES
+    ):
+        """
+        Initialize cache and create its table if needed
+
+        Args:
+            db_path: SQLite database file (defaults to config.DB_PATH)
+            ttl_seconds: Maximum age of a cached response
+            max_entries: Maximum number of cached responses (LRU eviction above)
+        """
+        self.pool = get_pool(db_path or config.DB_PATH)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'expired': 0,
+            'evicted': 0,
+            'tokens_saved': 0
+        }
+
+        with self.pool.connection() as conn:
+            with conn:
+                conn.execute(LLM_CACHE_DDL)
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_llm_cache_last_accessed "
+                    "ON llm_cache(last_accessed_at)"
+                )
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        **params: Any
+    ) -> Dict[str, Any]:
+        """
+        Build the content address of a request
+
+        Args:
+            model: Model name
+            messages: Chat messages sent to the model
+            temperature: Sampling temperature
+            **params: Other request parameters that change the output (e.g. max_tokens)
+
+        Returns:
+            Dictionary with cache_key, model, prompt_hash and temperature
+        """
+        prompt = json.dumps({'messages': messages, 'params': params}, sort_keys=True)
+        prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        cache_key = hashlib.sha256(
+            f"{model}|{prompt_hash}|{temperature!r}".encode('utf-8')
+        ).hexdigest()
+
+        return {
+            'cache_key': cache_key,
+            'model': model,
+            'prompt_hash': prompt_hash,
+            'temperature': temperature
+        }
+
+    def get(self, key: Dict[str, Any]) -> Optional[str]:
+        """
+        Look up a cached response
+
+        Args:
+            key: Result of make_key
+
+        Returns:
+            Cached response text, or None on a miss or expired entry
+        """
+        now = time.time()
+
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                """
+                SELECT response, created_at, prompt_tokens, completion_tokens
+                FROM llm_cache WHERE cache_key = ?
+                """,
+                (key['cache_key'],)
+            ).fetchone()
+
+            if row is not None and now - row[1] > self.ttl_seconds:
+                with conn:
+                    conn.execute("DELETE FROM llm_cache WHERE cache_key = ?", (key['cache_key'],))
+                self._count('expired')
+                row = None
+
+            if row is None:
+                self._count('misses')
+                return None
+
+            with conn:
+                conn.execute(
+                    """
+                    UPDATE llm_cache
+                    SET last_accessed_at = ?, hit_count = hit_count + 1
+                    WHERE cache_key = ?
+                    """,
+                    (now, key['cache_key'])
+                )
+
+        self._count('hits')
+        self._count('tokens_saved', (row[2] or 0) + (row[3] or 0))
+        return row[0]
+
+    def set(
+        self,
+        key: Dict[str, Any],
+        response: str,
+        prompt_tokens: Optional[int] = None,
+        completion_tokens: Optional[int] = None
+    ):
+        """
+        Store a response and evict least recently used entries above max_entries
+
+        Args:
+            key: Result of make_key
+            response: Response text to cache
+            prompt_tokens: Prompt tokens the call used (for tokens-saved metrics)
+            completion_tokens: Completion tokens the call used
+        """
+        now = time.time()
+
+        with self.pool.connection() as conn:
+            with conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO llm_cache (
+                        cache_key, model, prompt_hash, temperature, response,
+                        prompt_tokens, completion_tokens, created_at, last_accessed_at, hit_count
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+                    """,
+                    (
+                        key['cache_key'], key['model'], key['prompt_hash'], key['temperature'],
+                        response, prompt_tokens, completion_tokens, now, now
+                    )
+                )
+
+                evicted = conn.execute(
+                    """
+                    DELETE FROM llm_cache WHERE cache_key IN (
+                        SELECT cache_key FROM llm_cache
+                        ORDER BY last_accessed_at DESC
+                        LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.max_entries,)
+                ).rowcount
+
+        if evicted > 0:
+            self._count('evicted', evicted)
+
+    def invalidate(self, key: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Remove one cached response, or all of them
+
+        Args:
+            key: Result of make_key (None clears the whole cache)
+
+        Returns:
+            Number of entries removed
+        """
+        with self.pool.connection() as conn:
+            with conn:
+                if key is None:
+                    return conn.execute("DELETE FROM llm_cache").rowcount
+                return conn.execute(
+                    "DELETE FROM llm_cache WHERE cache_key = ?", (key['cache_key'],)
+                ).rowcount
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache hit-rate metrics
+
+        Returns:
+            Dictionary with this session's hits, misses, hit rate and tokens
+            saved, plus stored entries and lifetime hits from the table
+        """
+        with self._stats_lock:
+            stats = dict(self.stats)
+
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = round(stats['hits'] / lookups, 3) if lookups else 0.0
+
+        with self.pool.connection() as conn:
+            entries, lifetime_hits = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(hit_count), 0) FROM llm_cache"
+            ).fetchone()
+
+        stats['entries'] = entries
+        stats['lifetime_hits'] = lifetime_hits
+        return stats
+
+    def _count(self, key: str, amount: int = 1):
+        """Increment a session counter (thread-safe)"""
+        with self._stats_lock:
+            self.stats[key] += amount
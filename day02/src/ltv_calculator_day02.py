@@ -3,8 +3,9 @@ LTV Calculator for Day 02 - Creator Intelligence System
 Calculates Lifetime Value metrics for Instagram followers
 """
 
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 
@@ -40,7 +41,7 @@ class LTVCalculator:
         # Get metrics
         growth_metrics = self.dm.get_growth_metrics()
         engagement_stats = self.dm.get_engagement_stats()
-        posts = self.dm.get_posts()
+        posts = self.dm.get_posts_snapshot()
 
         current_followers = growth_metrics.get('current_followers', 0) or 0
 
@@ -56,7 +57,6 @@ class LTVCalculator:
             }
 
         posts = posts.copy()
-        posts['timestamp'] = pd.to_datetime(posts['timestamp'])
         posts[['impressions', 'reach']] = posts[['impressions', 'reach']].fillna(0)
         days_span = max((posts['timestamp'].max() - posts['timestamp'].min()).days, 0) + 1
         posts_per_day = len(posts) / days_span
@@ -113,7 +113,7 @@ class LTVCalculator:
         Returns:
             List of dictionaries with ROI per content type
         """
-        posts = self.dm.get_posts()
+        posts = self.dm.get_posts_snapshot()
 
         if posts.empty:
             return []
@@ -241,6 +241,42 @@ class LTVCalculator:
 
         return results
 
+    def simulate_growth(
+        self,
+        weeks: int = config.GROWTH_SIM_WEEKS,
+        n_paths: int = config.GROWTH_SIM_PATHS,
+        method: str = 'bootstrap',
+        seed: Optional[int] = None
+    ) -> Dict:
+        """
+        Monte-Carlo follower and account value projection from observed growth
+
+        Args:
+            weeks: Number of weeks to project
+            n_paths: Number of simulated growth paths
+            method: 'bootstrap' (resample observed weekly growth) or 'normal'
+                (lognormal fit of observed weekly growth)
+            seed: Random seed for reproducible results
+
+        Returns:
+            Dictionary with monthly P5/P50/P95 bands (see simulate_growth_paths),
+            or an empty dict if there is not enough follower history
+        """
+        account_metrics = self.dm.get_account_metrics()
+        if account_metrics.empty or 'followers' not in account_metrics.columns:
+            return {}
+
+        ltv_per_follower = self.calculate_follower_ltv().get('ltv_per_follower', 0.0)
+
+        return simulate_growth_paths(
+            account_metrics[['date', 'followers']],
+            ltv_per_follower=ltv_per_follower,
+            weeks=weeks,
+            n_paths=n_paths,
+            method=method,
+            seed=seed
+        )
+
     def calculate_engagement_value(self) -> Dict[str, float]:
         """
         Calculate the monetary value of different engagement actions
@@ -248,7 +284,7 @@ class LTVCalculator:
         Returns:
             Dictionary with value per engagement type
         """
-        posts = self.dm.get_posts()
+        posts = self.dm.get_posts_snapshot()
 
         if posts.empty:
             return {}
@@ -304,5 +340,131 @@ class LTVCalculator:
             'follower_ltv': self.calculate_follower_ltv(),
             'content_roi': self.calculate_content_roi(),
             'growth_scenarios': self.predict_growth_scenarios(months=6),
+            'growth_simulation': self.simulate_growth(weeks=config.GROWTH_SIM_WEEKS),
             'engagement_value': self.calculate_engagement_value()
         }
+
+
+def daily_followers(followers: pd.DataFrame) -> pd.Series:
+    """
+    Daily follower series with missing days interpolated
+
+    Args:
+        followers: DataFrame with 'date' and 'followers' columns
+
+    Returns:
+        Float Series indexed by calendar day (empty if no follower data)
+    """
+    series = (
+        followers.dropna(subset=['followers'])
+        .assign(date=lambda df: pd.to_datetime(df['date']))
+        .drop_duplicates(subset=['date'], keep='last')
+        .set_index('date')['followers']
+        .sort_index()
+        .astype(float)
+    )
+
+    if series.empty:
+        return series
+
+    return series.asfreq('D').interpolate()
+
+
+def weekly_log_growth(daily: pd.Series) -> np.ndarray:
+    """
+    Observed week-over-week follower growth
+
+    Args:
+        daily: Daily follower series (see daily_followers)
+
+    Returns:
+        Array of overlapping 7-day log growth rates
+    """
+    values = daily.to_numpy()
+    if len(values) < 8:
+        return np.array([])
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        growth = np.log(values[7:] / values[:-7])
+
+    return growth[np.isfinite(growth)]
+
+
+def simulate_growth_paths(
+    followers: pd.DataFrame,
+    ltv_per_follower: float = 0.0,
+    weeks: int = config.GROWTH_SIM_WEEKS,
+    n_paths: int = config.GROWTH_SIM_PATHS,
+    method: str = 'bootstrap',
+    seed: Optional[int] = None,
+    percentiles: Tuple[int, ...] = config.GROWTH_SIM_PERCENTILES
+) -> Dict:
+    """
+    Vectorized Monte-Carlo simulation of follower growth
+
+    Draws an (n_paths x weeks) matrix of weekly log growth rates, either by
+    resampling the observed rates or from a normal fit, and compounds them
+    with one cumulative sum. 10,000 paths x 26 weeks take a few milliseconds.
+
+    Args:
+        followers: DataFrame with 'date' and 'followers' columns (account_metrics)
+        ltv_per_follower: Value of one follower, used for the account value bands
+        weeks: Number of weeks to project
+        n_paths: Number of simulated growth paths
+        method: 'bootstrap' or 'normal'
+        seed: Random seed for reproducible results
+        percentiles: Percentiles reported per month
+
+    Returns:
+        Dictionary with months, follower and account value bands per month
+        (keys 'p5', 'p50', 'p95'), probability of reaching 200K followers and
+        the observed weekly growth statistics; empty if fewer than two weekly
+        growth observations exist
+    """
+    start = time.perf_counter()
+
+    if method not in ('bootstrap', 'normal'):
+        raise ValueError(f"Unknown simulation method: {method}")
+
+    daily = daily_followers(followers)
+    observed = weekly_log_growth(daily)
+    if len(observed) < 2:
+        return {}
+
+    current_followers = float(daily.iloc[-1])
+
+    rng = np.random.default_rng(seed)
+    if method == 'bootstrap':
+        weekly = observed[rng.integers(0, len(observed), size=(n_paths, weeks))]
+    else:
+        weekly = rng.normal(observed.mean(), observed.std(ddof=1), size=(n_paths, weeks))
+
+    # Follower count at the end of each week: current * exp(cumulative log growth)
+    paths = current_followers * np.exp(np.cumsum(weekly, axis=1))
+
+    # Week index closing each month (52 weeks / 12 months)
+    months = int(np.ceil(weeks * 12 / 52))
+    month_weeks = np.minimum(np.round(np.arange(1, months + 1) * 52 / 12).astype(int), weeks) - 1
+
+    bands = np.percentile(paths[:, month_weeks], percentiles, axis=0)
+
+    return {
+        'method': method,
+        'n_paths': n_paths,
+        'weeks': weeks,
+        'current_followers': int(current_followers),
+        'months': list(range(1, months + 1)),
+        'followers': {
+            f'p{p}': np.round(band).tolist() for p, band in zip(percentiles, bands)
+        },
+        'account_value': {
+            f'p{p}': np.round(band * ltv_per_follower, 2).tolist() for p, band in zip(percentiles, bands)
+        },
+        'probability_200k': round(float((paths[:, -1] >= 200000).mean()), 3),
+        'observed_weekly_growth': {
+            'mean_pct': round(float(np.expm1(observed.mean()) * 100), 2),
+            'std_pct': round(float(observed.std(ddof=1) * 100), 2),
+            'samples': int(len(observed))
+        },
+        'elapsed_ms': round((time.perf_counter() - start) * 1000, 2)
+    }
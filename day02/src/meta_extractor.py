@@ -3,166 +3,413 @@ Meta Graph API Extractor for Day 02 - Creator Intelligence System
 Handles all API calls to Meta/Instagram Business API
 """
 
+import json
+import sys
+import threading
 import time
 import requests
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Any, Tuple
+from urllib.parse import urlencode
 import pandas as pd
 
 from . import config
+from .rate_limiter import GraphRateLimiter
+
+# Add common modules to path
+sys.path.append(str(Path(__file__).parent.parent.parent / 'common'))
+
+from utils.http_client import RetryingHTTPClient
+
+# Graph error codes Meta returns (with HTTP 400/403) when a rate limit is hit
+RATE_LIMIT_ERROR_CODES = {4, 17, 32, 613, 80002}
+
+# Account insight metric name -> account_metrics column
+ACCOUNT_METRIC_COLUMNS = {
+    'follower_count': 'followers',
+    'impressions': 'impressions',
+    'reach': 'reach',
+    'profile_views': 'profile_views',
+    'website_clicks': 'website_clicks'
+}
+
+# Post insight metric name -> posts column
+POST_INSIGHT_COLUMNS = {
+    'impressions': 'impressions',
+    'reach': 'reach',
+    'engagement': 'engagement',
+    'saved': 'saves'
+}
+
+POST_COLUMNS = [
+    'post_id', 'caption', 'media_type', 'timestamp',
+    'likes', 'comments', 'shares', 'saves',
+    'impressions', 'reach', 'engagement_rate', 'updated_at'
+]
+
+# Marker for batch sub-requests Meta did not complete (retried individually)
+_INCOMPLETE = object()
 
 
 class MetaAPIExtractor:
     """Client for Meta Graph API to extract Instagram Business data"""
 
-    def __init__(self):
-        self.access_token = config.META_ACCESS_TOKEN
-        self.account_id = config.META_ACCOUNT_ID
-        self.base_url = config.META_BASE_URL
-        self.session = requests.Session()
+    def __init__(
+        self,
+        access_token: Optional[str] = None,
+        account_id: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_workers: int = config.META_MAX_WORKERS,
+        rate_limiter: Optional[GraphRateLimiter] = None
+    ):
+        """
+        Initialize extractor
+
+        Args:
+            access_token: Graph API token (default: config.META_ACCESS_TOKEN)
+            account_id: Instagram Business account ID (default: config.META_ACCOUNT_ID)
+            base_url: Versioned Graph API URL (default: config.META_BASE_URL)
+            max_workers: Maximum Graph API calls in flight at once
+            rate_limiter: Limiter shared with other extractors (e.g. one per app token)
+        """
+        self.access_token = access_token or config.META_ACCESS_TOKEN
+        self.account_id = account_id or config.META_ACCOUNT_ID
+        self.base_url = (base_url or config.META_BASE_URL).rstrip('/')
+        self.graph_url, self.api_version = self.base_url.rsplit('/', 1)
+        self.max_workers = max(1, max_workers)
+        self.rate_limiter = rate_limiter or GraphRateLimiter()
+
+        # One keep-alive connection per worker thread; retries back off through
+        # the shared rate limiter so a rate limit pauses every worker
+        self.http = RetryingHTTPClient(
+            max_attempts=config.MAX_RETRIES,
+            backoff_seconds=config.RETRY_DELAY,
+            timeout=config.REQUEST_TIMEOUT,
+            pool_maxsize=self.max_workers
+        )
+
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            'http_requests': 0,
+            'graph_calls': 0,
+            'batch_requests': 0,
+            'rate_limited': 0
+        }
 
     def _make_request(
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
-        method: str = 'GET'
-    ) -> Dict[str, Any]:
+        method: str = 'GET',
+        data: Optional[Dict[str, Any]] = None,
+        cost: int = 1
+    ) -> Any:
         """
         Make API request with retry logic and error handling
 
+        Timeouts, 5xx responses and rate limits (HTTP 429 or a Graph
+        rate-limit error code) are retried by the shared HTTP client with
+        exponential backoff; other errors are raised immediately.
+
         Args:
-            endpoint: API endpoint (e.g., '/insights', '/media')
+            endpoint: API endpoint (e.g., '/insights', '/media') or an absolute
+                URL such as a paging.next cursor
             params: Query parameters
             method: HTTP method (GET, POST)
+            data: Form body for POST requests
+            cost: Graph calls this request counts as (sub-requests of a batch)
 
         Returns:
-            JSON response as dictionary
+            JSON response (dictionary, or list for batch requests)
 
         Raises:
             Exception: If all retries fail
         """
-        if params is None:
-            params = {}
-
-        # Add access token to all requests
-        params['access_token'] = self.access_token
-
-        url = f"{self.base_url}/{endpoint}"
-
-        for attempt in range(config.MAX_RETRIES):
-            try:
-                if method == 'GET':
-                    response = self.session.get(
-                        url,
-                        params=params,
-                        timeout=config.REQUEST_TIMEOUT
-                    )
-                else:
-                    response = self.session.post(
-                        url,
-                        params=params,
-                        timeout=config.REQUEST_TIMEOUT
-                    )
-
-                # Check for rate limiting
-                if response.status_code == 429:
-                    wait_time = config.RETRY_DELAY * (2 ** attempt)
-                    print(f"   ⏳ Rate limited. Waiting {wait_time}s before retry...")
-                    time.sleep(wait_time)
-                    continue
+        params = dict(params or {})
 
-                # Raise for other HTTP errors
-                response.raise_for_status()
+        if endpoint.startswith(('http://', 'https://')):
+            url = endpoint
+        else:
+            url = f"{self.base_url}/{endpoint}"
 
-                return response.json()
+        # Add access token to all requests (paging cursors already carry it)
+        if 'access_token=' not in url:
+            params['access_token'] = self.access_token
 
-            except requests.exceptions.Timeout:
-                print(f"   ⏳ Request timeout (attempt {attempt + 1}/{config.MAX_RETRIES})")
-                if attempt < config.MAX_RETRIES - 1:
-                    time.sleep(config.RETRY_DELAY)
-                else:
-                    raise Exception("Request timeout after all retries")
+        def on_response(response: requests.Response):
+            self._count('http_requests')
+            self._count('graph_calls', cost)
+            self.rate_limiter.update_from_headers(response.headers)
+            if self._is_rate_limited(response):
+                self._count('rate_limited')
 
-            except requests.exceptions.RequestException as e:
-                print(f"   ❌ Request failed (attempt {attempt + 1}/{config.MAX_RETRIES}): {e}")
-                if attempt < config.MAX_RETRIES - 1:
-                    time.sleep(config.RETRY_DELAY)
-                else:
-                    raise Exception(f"Request failed after all retries: {e}")
+        try:
+            response = self.http.request(
+                method,
+                url,
+                params=params,
+                data=data,
+                limiter=self.rate_limiter,
+                cost=cost,
+                retry_if=self._is_rate_limited,
+                on_response=on_response
+            )
+        except requests.exceptions.Timeout:
+            raise Exception("Request timeout after all retries")
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Request failed after all retries: {e}")
+
+        if self._is_rate_limited(response):
+            raise Exception("Rate limited after all retries")
+
+        # Raise for other HTTP errors
+        response.raise_for_status()
+
+        return response.json()
+
+    def _is_rate_limited(self, response: requests.Response) -> bool:
+        """Check for HTTP 429 or a Graph rate-limit error code"""
+        if response.status_code == 429:
+            return True
 
-        raise Exception("Unexpected error in _make_request")
+        if response.status_code not in (400, 403):
+            return False
+
+        try:
+            error = response.json().get('error', {})
+        except ValueError:
+            return False
+
+        return error.get('code') in RATE_LIMIT_ERROR_CODES
 
-    def extract_account_insights(self, days: int = 90) -> pd.DataFrame:
+    def _count(self, key: str, amount: int = 1):
+        """Increment a request counter (thread-safe)"""
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def _get_all_pages(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        max_items: Optional[int] = None,
+        stop_at: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Collect items from an edge by following paging.next cursors
+
+        Args:
+            endpoint: API endpoint of the first page
+            params: Query parameters of the first page
+            max_items: Stop once this many items were collected (None: no limit)
+            stop_at: Predicate for the first item not to collect; paging stops
+                there (edges such as /media are returned newest first)
+
+        Returns:
+            List of items in API order
+        """
+        items = []
+        response = self._make_request(endpoint, params)
+
+        while True:
+            for item in response.get('data', []):
+                if stop_at is not None and stop_at(item):
+                    return items
+                items.append(item)
+                if max_items is not None and len(items) >= max_items:
+                    return items
+
+            next_url = response.get('paging', {}).get('next')
+            if not next_url:
+                return items
+
+            response = self._make_request(next_url)
+
+    def _relative_url(self, endpoint: str, params: Dict[str, Any]) -> str:
+        """Build the relative_url of a batch sub-request"""
+        return f"{self.api_version}/{endpoint}?{urlencode(params)}"
+
+    def _batch_get(self, relative_urls: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Run GET requests as Graph batch calls, several batches in parallel
+
+        Sub-requests are grouped config.META_BATCH_SIZE per HTTP call. Sub-requests
+        Meta did not complete (null entries) are retried as regular requests.
+
+        Args:
+            relative_urls: Versioned relative URLs (see _relative_url)
+
+        Returns:
+            Parsed response body per URL, in input order (None on failure)
+        """
+        chunks = [
+            relative_urls[i:i + config.META_BATCH_SIZE]
+            for i in range(0, len(relative_urls), config.META_BATCH_SIZE)
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = [
+                body
+                for chunk_results in executor.map(self._send_batch, chunks)
+                for body in chunk_results
+            ]
+
+            incomplete = [i for i, body in enumerate(results) if body is _INCOMPLETE]
+            retried = executor.map(self._get_relative, [relative_urls[i] for i in incomplete])
+            for i, body in zip(incomplete, retried):
+                results[i] = body
+
+        return results
+
+    def _send_batch(self, relative_urls: List[str]) -> List[Any]:
+        """Send one batch call and decode each sub-response body"""
+        batch = [{'method': 'GET', 'relative_url': url} for url in relative_urls]
+
+        try:
+            responses = self._make_request(
+                self.graph_url,
+                params={'include_headers': 'false'},
+                method='POST',
+                data={'batch': json.dumps(batch)},
+                cost=len(batch)
+            )
+        except Exception as e:
+            print(f"   ⚠️  Batch request failed ({len(batch)} calls): {e}")
+            return [None] * len(batch)
+
+        self._count('batch_requests')
+
+        results = []
+        for item in responses:
+            if item is None:
+                results.append(_INCOMPLETE)
+            elif item.get('code') == 200:
+                results.append(json.loads(item['body']))
+            else:
+                results.append(None)
+
+        return results
+
+    def _get_relative(self, relative_url: str) -> Optional[Dict[str, Any]]:
+        """Fetch a batch sub-request on its own (None on failure)"""
+        try:
+            return self._make_request(f"{self.graph_url}/{relative_url}")
+        except Exception:
+            return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get request counters
+
+        Returns:
+            Dictionary with HTTP round-trips, Graph calls, limiter statistics
+            and per-endpoint latency
+        """
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats['rate_limiter'] = self.rate_limiter.get_stats()
+        stats['http'] = self.http.get_stats()
+        return stats
+
+    def extract_account_insights(
+        self,
+        days: int = 90,
+        account_id: Optional[str] = None
+    ) -> pd.DataFrame:
         """
         Extract account-level insights for the past N days
 
+        Daily insights accept at most config.META_INSIGHTS_WINDOW_DAYS per
+        request, so the range is split into windows fetched in one batch call.
+        Windows that fail are left out (see sync() for gap-aware extraction).
+
         Args:
             days: Number of days to look back (default: 90)
+            account_id: Account to extract (default: the configured account)
 
         Returns:
             DataFrame with daily account metrics
         """
+        account_metrics, _ = self._fetch_account_insights(days, account_id)
+        return account_metrics
+
+    def _fetch_account_insights(
+        self,
+        days: int,
+        account_id: Optional[str] = None
+    ) -> Tuple[pd.DataFrame, List[Tuple[date, date]]]:
+        """
+        Fetch account insights and report the windows that could not be fetched
+
+        Args:
+            days: Number of days to look back
+            account_id: Account to extract (default: the configured account)
+
+        Returns:
+            Tuple of (daily account metrics, (start, end) date of every failed window)
+        """
         print(f"   📊 Fetching account insights for {days} days...")
 
+        account_id = account_id or self.account_id
+
         # Calculate date range
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
 
-        # Format dates for API (Unix timestamps)
-        since = int(start_date.timestamp())
-        until = int(end_date.timestamp())
-
         # Build metrics string
         metrics = ','.join(config.ACCOUNT_METRICS)
 
-        # Make API request
-        endpoint = f"{self.account_id}/insights"
-        params = {
-            'metric': metrics,
-            'period': 'day',
-            'since': since,
-            'until': until
-        }
+        # One relative URL per window (Unix timestamps)
+        windows = []
+        relative_urls = []
+        window_start = start_date
+        while window_start < end_date:
+            window_end = min(
+                window_start + timedelta(days=config.META_INSIGHTS_WINDOW_DAYS),
+                end_date
+            )
+            windows.append((window_start.date(), window_end.date()))
+            relative_urls.append(self._relative_url(f"{account_id}/insights", {
+                'metric': metrics,
+                'period': 'day',
+                'since': int(window_start.timestamp()),
+                'until': int(window_end.timestamp())
+            }))
+            window_start = window_end
+
+        failed_windows = list(windows)
 
         try:
-            response = self._make_request(endpoint, params)
+            responses = self._batch_get(relative_urls)
+
+            if all(response is None for response in responses):
+                raise Exception("no insights window could be fetched")
+
+            failed_windows = [
+                window for window, response in zip(windows, responses) if response is None
+            ]
 
-            # Parse response into DataFrame
-            records = []
+            # Parse responses into one record per date
+            records: Dict[Any, Dict[str, Any]] = {}
+
+            for window, response in zip(windows, responses):
+                if response is None:
+                    print(f"   ⚠️  Skipping insights window {window[0]} - {window[1]} that failed")
+                    continue
 
-            if 'data' in response:
-                for metric_data in response['data']:
-                    metric_name = metric_data['name']
-                    values = metric_data.get('values', [])
+                for metric_data in response.get('data', []):
+                    column = ACCOUNT_METRIC_COLUMNS.get(metric_data['name'])
+                    if column is None:
+                        continue
 
-                    for value_entry in values:
+                    for value_entry in metric_data.get('values', []):
                         date = datetime.fromisoformat(
                             value_entry['end_time'].replace('Z', '+00:00')
                         ).date()
-                        value = value_entry['value']
-
-                        # Find or create record for this date
-                        record = next(
-                            (r for r in records if r['date'] == date),
-                            None
-                        )
-                        if record is None:
-                            record = {'date': date}
-                            records.append(record)
-
-                        # Map metric name to database column
-                        if metric_name == 'follower_count':
-                            record['followers'] = value
-                        elif metric_name == 'impressions':
-                            record['impressions'] = value
-                        elif metric_name == 'reach':
-                            record['reach'] = value
-                        elif metric_name == 'profile_views':
-                            record['profile_views'] = value
-                        elif metric_name == 'website_clicks':
-                            record['website_clicks'] = value
-
-            df = pd.DataFrame(records)
+                        records.setdefault(date, {'date': date})[column] = value_entry['value']
+
+            df = pd.DataFrame(list(records.values()))
 
             # Add timestamp
             df['updated_at'] = datetime.now()
@@ -172,7 +419,7 @@ class MetaAPIExtractor:
 
             print(f"   ✓ Fetched {len(df)} days of account metrics")
 
-            return df
+            return df, failed_windows
 
         except Exception as e:
             print(f"   ❌ Failed to fetch account insights: {e}")
@@ -180,99 +427,92 @@ class MetaAPIExtractor:
             return pd.DataFrame(columns=[
                 'date', 'followers', 'impressions', 'reach',
                 'profile_views', 'website_clicks', 'updated_at'
-            ])
+            ]), failed_windows
 
-    def extract_recent_posts(self, limit: int = 100) -> pd.DataFrame:
+    def extract_recent_posts(
+        self,
+        limit: Optional[int] = 100,
+        account_id: Optional[str] = None,
+        since: Optional[datetime] = None
+    ) -> pd.DataFrame:
         """
         Extract recent posts with performance metrics
 
+        Media pages are followed through paging.next cursors; per-post
+        insights are fetched as parallel Graph batch calls.
+
         Args:
-            limit: Maximum number of posts to fetch (default: 100)
+            limit: Maximum number of posts to fetch (default: 100, None: no limit)
+            account_id: Account to extract (default: the configured account)
+            since: Only fetch posts published at or after this time (timezone-aware)
 
         Returns:
             DataFrame with post data and metrics
         """
-        print(f"   📸 Fetching {limit} most recent posts...")
+        if since is not None:
+            print(f"   📸 Fetching posts published since {since:%Y-%m-%d %H:%M}...")
+        else:
+            print(f"   📸 Fetching {limit} most recent posts...")
+
+        account_id = account_id or self.account_id
 
         # Step 1: Get media IDs
-        endpoint = f"{self.account_id}/media"
+        endpoint = f"{account_id}/media"
         params = {
             'fields': 'id,caption,media_type,timestamp,like_count,comments_count',
-            'limit': limit
+            'limit': min(limit or config.META_MEDIA_PAGE_SIZE, config.META_MEDIA_PAGE_SIZE)
         }
 
+        stop_at = None
+        if since is not None:
+            stop_at = lambda media: self._parse_timestamp(media['timestamp']) < since
+
         try:
-            media_response = self._make_request(endpoint, params)
+            media_items = self._get_all_pages(endpoint, params, limit, stop_at)
 
-            if 'data' not in media_response or not media_response['data']:
+            if not media_items:
                 print("   ⚠️  No posts found")
-                return pd.DataFrame(columns=[
-                    'post_id', 'caption', 'media_type', 'timestamp',
-                    'likes', 'comments', 'shares', 'saves',
-                    'impressions', 'reach', 'engagement_rate', 'updated_at'
-                ])
+                return pd.DataFrame(columns=POST_COLUMNS)
 
-            posts = []
+            # Step 2: Get insights (impressions, reach, engagement, saves) for all posts
+            insights_params = {'metric': 'impressions,reach,engagement,saved'}
+            insights_responses = self._batch_get([
+                self._relative_url(f"{media['id']}/insights", insights_params)
+                for media in media_items
+            ])
 
-            # Step 2: Get insights for each post
-            for idx, media in enumerate(media_response['data'], 1):
-                post_id = media['id']
+            posts = []
+            failed = 0
 
+            for media, insights_response in zip(media_items, insights_responses):
                 # Basic post data
                 post = {
-                    'post_id': post_id,
+                    'post_id': media['id'],
                     'caption': media.get('caption', ''),
                     'media_type': media.get('media_type', ''),
-                    'timestamp': datetime.fromisoformat(
-                        media['timestamp'].replace('Z', '+00:00')
-                    ),
+                    'timestamp': self._parse_timestamp(media['timestamp']),
                     'likes': media.get('like_count', 0),
-                    'comments': media.get('comments_count', 0)
+                    'comments': media.get('comments_count', 0),
+                    'impressions': 0,
+                    'reach': 0,
+                    'engagement': 0,
+                    'saves': 0,
+                    # Note: Instagram API doesn't directly provide shares count
+                    'shares': 0
                 }
 
-                # Fetch insights (impressions, reach, engagement, saves)
-                try:
-                    insights_endpoint = f"{post_id}/insights"
-                    insights_params = {
-                        'metric': 'impressions,reach,engagement,saved'
-                    }
-
-                    insights_response = self._make_request(
-                        insights_endpoint,
-                        insights_params
-                    )
-
-                    # Parse insights
+                if insights_response is None:
+                    failed += 1
+                else:
                     for metric_data in insights_response.get('data', []):
-                        metric_name = metric_data['name']
-                        value = metric_data.get('values', [{}])[0].get('value', 0)
-
-                        if metric_name == 'impressions':
-                            post['impressions'] = value
-                        elif metric_name == 'reach':
-                            post['reach'] = value
-                        elif metric_name == 'engagement':
-                            post['engagement'] = value
-                        elif metric_name == 'saved':
-                            post['saves'] = value
-
-                    # Note: Instagram API doesn't directly provide shares count
-                    # Set to 0 or calculate from engagement if possible
-                    post['shares'] = 0
-
-                except Exception as e:
-                    print(f"   ⚠️  Could not fetch insights for post {idx}: {e}")
-                    post['impressions'] = 0
-                    post['reach'] = 0
-                    post['engagement'] = 0
-                    post['saves'] = 0
-                    post['shares'] = 0
+                        column = POST_INSIGHT_COLUMNS.get(metric_data['name'])
+                        if column is not None:
+                            post[column] = metric_data.get('values', [{}])[0].get('value', 0)
 
                 posts.append(post)
 
-                # Progress indicator
-                if idx % 20 == 0:
-                    print(f"   ... processed {idx}/{limit} posts")
+            if failed:
+                print(f"   ⚠️  Could not fetch insights for {failed} post(s)")
 
             df = pd.DataFrame(posts)
 
@@ -291,11 +531,140 @@ class MetaAPIExtractor:
 
         except Exception as e:
             print(f"   ❌ Failed to fetch posts: {e}")
-            return pd.DataFrame(columns=[
-                'post_id', 'caption', 'media_type', 'timestamp',
-                'likes', 'comments', 'shares', 'saves',
-                'impressions', 'reach', 'engagement_rate', 'updated_at'
-            ])
+            return pd.DataFrame(columns=POST_COLUMNS)
+
+    def extract_accounts(
+        self,
+        account_ids: List[str],
+        days: int = 90,
+        limit: int = 100
+    ) -> Dict[str, Dict[str, pd.DataFrame]]:
+        """
+        Extract account insights and recent posts for several accounts in parallel
+
+        All accounts share this extractor's session and rate limiter.
+
+        Args:
+            account_ids: Instagram Business account IDs (same access token)
+            days: Number of days of account insights
+            limit: Maximum number of posts per account
+
+        Returns:
+            Dictionary of account_id -> {'account_metrics': DataFrame, 'posts': DataFrame}
+        """
+        def extract_one(account_id: str) -> Dict[str, pd.DataFrame]:
+            return {
+                'account_metrics': self.extract_account_insights(days, account_id),
+                'posts': self.extract_recent_posts(limit, account_id)
+            }
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, max(1, len(account_ids)))) as executor:
+            return dict(zip(account_ids, executor.map(extract_one, account_ids)))
+
+    def sync(
+        self,
+        data_manager,
+        account_id: Optional[str] = None,
+        maturity_days: int = config.POST_MATURITY_DAYS,
+        days: int = config.LOOKBACK_DAYS,
+        limit: int = config.MAX_POSTS
+    ) -> Dict[str, Any]:
+        """
+        Extract only what changed since the last sync and save it
+
+        The account's high-water marks are read from the DataManager
+        sync_state table. The first sync is a full extraction (days / limit);
+        later syncs fetch account insights from the last synced date (minus
+        config.SYNC_METRICS_OVERLAP_DAYS) and only posts that are new or
+        younger than maturity_days, whose metrics may still be changing.
+        If an insights window fails, the metrics mark stops the day before
+        the first failed window, so the next sync fetches that range again.
+
+        Args:
+            data_manager: DataManager the results are saved to
+            account_id: Account to sync (default: the configured account)
+            maturity_days: Posts older than this are not re-fetched
+            days: Lookback for the first (full) sync
+            limit: Maximum posts for the first (full) sync
+
+        Returns:
+            Dictionary with sync mode, row counts, API calls and elapsed time
+        """
+        account_id = account_id or self.account_id
+        state = data_manager.get_sync_state(account_id)
+        stats_before = self.get_stats()
+        start = time.perf_counter()
+
+        if state is None:
+            print(f"   🔄 First sync for account {account_id}: full extraction")
+            metrics_days = days
+            since = None
+        else:
+            print(f"   🔄 Incremental sync for account {account_id} "
+                  f"(last synced {state['synced_at']})")
+
+            metrics_days = days
+            if state['last_metrics_date'] is not None:
+                days_since = (pd.Timestamp.now().normalize() - state['last_metrics_date']).days
+                metrics_days = min(days, max(1, days_since + config.SYNC_METRICS_OVERLAP_DAYS))
+
+            # New posts plus posts still inside the maturity window
+            since = pd.Timestamp.now(tz='UTC') - pd.Timedelta(days=maturity_days)
+            if state['last_post_timestamp'] is not None:
+                since = min(since, state['last_post_timestamp'])
+
+        account_metrics, failed_windows = self._fetch_account_insights(metrics_days, account_id)
+        posts = self.extract_recent_posts(
+            limit=limit if since is None else None,
+            account_id=account_id,
+            since=since
+        )
+
+        if not account_metrics.empty:
+            data_manager.save_account_metrics(account_metrics)
+        if not posts.empty:
+            data_manager.save_posts(posts)
+
+        last_metrics_date = account_metrics['date'].max() if not account_metrics.empty else None
+        if failed_windows and last_metrics_date is not None:
+            # Never mark days of a failed window (or after it) as synced
+            gap_start = min(start for start, _ in failed_windows)
+            last_metrics_date = min(last_metrics_date, gap_start - timedelta(days=1))
+            print(f"   ⚠️  {len(failed_windows)} insights window(s) failed; "
+                  f"metrics mark held at {last_metrics_date} for the next sync")
+
+        data_manager.save_sync_state(
+            account_id,
+            last_post_timestamp=posts['timestamp'].max() if not posts.empty else None,
+            last_metrics_date=last_metrics_date
+        )
+
+        new_posts = len(posts)
+        if state is not None and state['last_post_timestamp'] is not None and not posts.empty:
+            new_posts = int((pd.to_datetime(posts['timestamp'], utc=True) > state['last_post_timestamp']).sum())
+
+        stats_after = self.get_stats()
+        summary = {
+            'mode': 'full' if state is None else 'incremental',
+            'metrics_days': len(account_metrics),
+            'failed_metrics_windows': failed_windows,
+            'new_posts': new_posts,
+            'refreshed_posts': len(posts) - new_posts,
+            'http_requests': stats_after['http_requests'] - stats_before['http_requests'],
+            'graph_calls': stats_after['graph_calls'] - stats_before['graph_calls'],
+            'elapsed_seconds': round(time.perf_counter() - start, 2)
+        }
+
+        print(f"   ✓ Sync complete: {summary['new_posts']} new posts, "
+              f"{summary['refreshed_posts']} refreshed, {summary['metrics_days']} days of metrics "
+              f"({summary['http_requests']} requests, {summary['elapsed_seconds']}s)")
+
+        return summary
+
+    @staticmethod
+    def _parse_timestamp(value: str) -> datetime:
+        """Parse a Graph API timestamp (e.g. 2025-01-31T18:00:00+0000)"""
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
 
     def _calculate_engagement_rate(self, post: pd.Series) -> float:
         """
@@ -4,11 +4,13 @@ Uses OpenAI GPT-4 to analyze Instagram content and generate insights
 """
 
 import json
+import threading
 from typing import Dict, List, Optional
 import pandas as pd
 from openai import OpenAI
 
 from .data_manager import DataManager
+from .llm_cache import LLMResponseCache
 from . import config
 
 
@@ -31,6 +33,116 @@ class OpenAIContentAnalyzer:
         self.client = OpenAI(api_key=config.OPENAI_API_KEY)
         self.model = "gpt-4o-mini"  # Using cost-effective model for analysis
 
+        # Responses for unchanged prompts are served from the same SQLite DB
+        self.cache = LLMResponseCache(self.dm.db_path) if config.LLM_CACHE_ENABLED else None
+
+        # Token usage per thread, so concurrent callers can attribute their own calls
+        self._usage = threading.local()
+
+    def _complete_json(
+        self,
+        system_prompt: str,
+        prompt: str,
+        temperature: float,
+        max_tokens: int
+    ) -> any:
+        """
+        Run a chat completion and parse its JSON answer, using the response cache
+
+        Only responses that parse as JSON are cached, so a malformed answer
+        is retried on the next run.
+
+        Args:
+            system_prompt: System message
+            prompt: User message
+            temperature: Sampling temperature
+            max_tokens: Completion token limit
+
+        Returns:
+            Parsed JSON (dict or list)
+        """
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": prompt}
+        ]
+
+        key = None
+        if self.cache is not None:
+            key = self.cache.make_key(self.model, messages, temperature, max_tokens=max_tokens)
+            cached = self.cache.get(key)
+            if cached is not None:
+                self._record_usage(cached=True)
+                return json.loads(self._extract_json(cached))
+
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+
+        usage = getattr(response, 'usage', None)
+        prompt_tokens = getattr(usage, 'prompt_tokens', None)
+        completion_tokens = getattr(usage, 'completion_tokens', None)
+        self._record_usage(prompt_tokens=prompt_tokens or 0, completion_tokens=completion_tokens or 0)
+
+        content = response.choices[0].message.content.strip()
+        result = json.loads(self._extract_json(content))
+
+        if key is not None:
+            self.cache.set(
+                key,
+                content,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens
+            )
+
+        return result
+
+    def _record_usage(self, prompt_tokens: int = 0, completion_tokens: int = 0, cached: bool = False):
+        """Add one completion to the calling thread's usage counters"""
+        usage = getattr(self._usage, 'totals', None)
+        if usage is None:
+            usage = self._usage.totals = {
+                'calls': 0, 'cached_calls': 0, 'prompt_tokens': 0, 'completion_tokens': 0
+            }
+
+        usage['calls'] += 1
+        usage['cached_calls'] += int(cached)
+        usage['prompt_tokens'] += prompt_tokens
+        usage['completion_tokens'] += completion_tokens
+
+    def consume_usage(self) -> Dict[str, int]:
+        """
+        Get and reset the token usage of completions made in the calling thread
+
+        Returns:
+            Dictionary with calls, cached_calls, prompt_tokens and completion_tokens
+        """
+        usage = getattr(self._usage, 'totals', None) or {
+            'calls': 0, 'cached_calls': 0, 'prompt_tokens': 0, 'completion_tokens': 0
+        }
+        self._usage.totals = None
+        return usage
+
+    @staticmethod
+    def _extract_json(content: str) -> str:
+        """Strip Markdown code fences around a JSON answer"""
+        if "```json" in content:
+            return content.split("```json")[1].split("```")[0].strip()
+        elif "```" in content:
+            return content.split("```")[1].split("```")[0].strip()
+        return content
+
+    def get_cache_stats(self) -> Dict[str, any]:
+        """
+        Get LLM response cache metrics
+
+        Returns:
+            Dictionary with hits, misses, hit rate and tokens saved (empty if caching is disabled)
+        """
+        return self.cache.get_stats() if self.cache is not None else {}
+
     def analyze_viral_content_patterns(self) -> Dict[str, any]:
         """
         Analyze viral posts to identify common patterns and themes
@@ -38,7 +150,7 @@ class OpenAIContentAnalyzer:
         Returns:
             Dictionary with viral content analysis
         """
-        posts = self.dm.get_posts()
+        posts = self.dm.get_posts_snapshot()
 
         if posts.empty:
             return {'error': 'No posts available for analysis'}
@@ -72,26 +184,12 @@ Please provide:
 Format your response as JSON with these keys: themes, writing_style, hashtag_strategy, emotional_triggers, cta_patterns, success_factors"""
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert Instagram content strategist analyzing viral posts. Provide insights in JSON format."},
-                    {"role": "user", "content": prompt}
-                ],
+            analysis = self._complete_json(
+                "You are an expert Instagram content strategist analyzing viral posts. Provide insights in JSON format.",
+                prompt,
                 temperature=0.7,
                 max_tokens=1500
             )
-
-            # Parse response
-            content = response.choices[0].message.content.strip()
-
-            # Try to extract JSON from response
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-
-            analysis = json.loads(content)
             analysis['analyzed_posts_count'] = len(viral_posts)
 
             return analysis
@@ -139,26 +237,13 @@ Focus on:
 Provide recommendations as a JSON array of strings, each being a concise, actionable recommendation."""
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an expert Instagram growth strategist. Provide specific, actionable recommendations."},
-                    {"role": "user", "content": prompt}
-                ],
+            recommendations = self._complete_json(
+                "You are an expert Instagram growth strategist. Provide specific, actionable recommendations.",
+                prompt,
                 temperature=0.8,
                 max_tokens=1200
             )
 
-            content = response.choices[0].message.content.strip()
-
-            # Try to extract JSON array
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-
-            recommendations = json.loads(content)
-
             # Ensure it's a list
             if isinstance(recommendations, dict):
                 recommendations = recommendations.get('recommendations', [])
@@ -180,7 +265,7 @@ Provide recommendations as a JSON array of strings, each being a concise, action
         Returns:
             Dictionary with caption analysis insights
         """
-        posts = self.dm.get_posts()
+        posts = self.dm.get_posts_snapshot()
 
         if posts.empty:
             return {'error': 'No posts available'}
@@ -212,26 +297,13 @@ Provide analysis as JSON:
 }}"""
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an Instagram content expert analyzing caption effectiveness."},
-                    {"role": "user", "content": prompt}
-                ],
+            return self._complete_json(
+                "You are an Instagram content expert analyzing caption effectiveness.",
+                prompt,
                 temperature=0.7,
                 max_tokens=1000
             )
 
-            content = response.choices[0].message.content.strip()
-
-            # Extract JSON
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-
-            return json.loads(content)
-
         except Exception as e:
             return {
                 'error': f'Caption analysis failed: {str(e)}',
@@ -248,7 +320,7 @@ Provide analysis as JSON:
         Returns:
             Dictionary with content themes per day/week
         """
-        posts = self.dm.get_posts()
+        posts = self.dm.get_posts_snapshot()
 
         if posts.empty:
             return {'error': 'No historical data available'}
@@ -277,26 +349,13 @@ Provide as JSON:
 }}"""
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a content strategist creating Instagram content calendars."},
-                    {"role": "user", "content": prompt}
-                ],
+            return self._complete_json(
+                "You are a content strategist creating Instagram content calendars.",
+                prompt,
                 temperature=0.9,  # More creative for content ideas
                 max_tokens=1500
             )
 
-            content = response.choices[0].message.content.strip()
-
-            # Extract JSON
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-
-            return json.loads(content)
-
         except Exception as e:
             return {
                 'error': f'Content calendar generation failed: {str(e)}',
@@ -342,26 +401,13 @@ As a senior Instagram strategist, create a comprehensive 6-month growth plan:
 Provide as detailed JSON with these sections."""
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a senior Instagram growth strategist creating comprehensive growth plans."},
-                    {"role": "user", "content": prompt}
-                ],
+            return self._complete_json(
+                "You are a senior Instagram growth strategist creating comprehensive growth plans.",
+                prompt,
                 temperature=0.8,
                 max_tokens=2000
             )
 
-            content = response.choices[0].message.content.strip()
-
-            # Extract JSON
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0].strip()
-
-            return json.loads(content)
-
         except Exception as e:
             return {
                 'error': f'Strategy generation failed: {str(e)}',
@@ -0,0 +1,201 @@
+"""
+Graph API Rate Limiter for Day 02 - Creator Intelligence System
+Token bucket shared by concurrent Meta API calls, tuned from Meta's usage headers
+"""
+
+import json
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+from . import config
+
+
+class GraphRateLimiter:
+    """
+    Thread-safe token bucket for Meta Graph API calls
+
+    Every call (and every sub-request of a batch call) takes one token.
+    Meta reports how much of the app / business use case quota is used in
+    the X-App-Usage and X-Business-Use-Case-Usage headers; the refill rate
+    is scaled down as usage approaches 100% and calls are paused when Meta
+    reports a time to regain access.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float = config.META_RATE_LIMIT_PER_SECOND,
+        burst: int = config.META_RATE_LIMIT_BURST,
+        throttle_pct: float = config.META_USAGE_THROTTLE_PCT,
+        pause_pct: float = config.META_USAGE_PAUSE_PCT
+    ):
+        """
+        Initialize rate limiter
+
+        Args:
+            rate_per_second: Token refill rate while usage is low
+            burst: Bucket capacity (maximum calls sent back-to-back)
+            throttle_pct: Usage percentage where the refill rate starts dropping
+            pause_pct: Usage percentage where calls are paused
+        """
+        self.base_rate = rate_per_second
+        self.capacity = max(1, burst)
+        self.throttle_pct = throttle_pct
+        self.pause_pct = pause_pct
+
+        self._rate = rate_per_second
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+        self.usage_pct = 0.0
+        self.stats = {
+            'acquired': 0,
+            'waited_seconds': 0.0,
+            'pauses': 0
+        }
+
+    def acquire(self, tokens: int = 1):
+        """
+        Block until `tokens` calls may be sent
+
+        Args:
+            tokens: Number of Graph calls about to be made (batch size for batch calls)
+        """
+        tokens = min(max(1, tokens), self.capacity)
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self._tokens >= tokens:
+                        self._tokens -= tokens
+                        self.stats['acquired'] += tokens
+                        self.stats['waited_seconds'] += waited
+                        return
+                    wait = (tokens - self._tokens) / self._rate
+
+            time.sleep(wait)
+            waited += wait
+
+    def update_from_headers(self, headers: Mapping[str, str]):
+        """
+        Adjust the refill rate from Meta's usage headers
+
+        Args:
+            headers: Response headers of a Graph API call
+        """
+        usage_pct, regain_minutes = parse_usage_headers(headers)
+        if usage_pct is None:
+            return
+
+        with self._lock:
+            self.usage_pct = usage_pct
+
+            if usage_pct >= self.pause_pct or regain_minutes:
+                pause = regain_minutes * 60 if regain_minutes else config.META_USAGE_PAUSE_SECONDS
+                self._pause(pause)
+            elif usage_pct > self.throttle_pct:
+                # Scale linearly from the full rate down to 10% at the pause threshold
+                headroom = (self.pause_pct - usage_pct) / (self.pause_pct - self.throttle_pct)
+                self._rate = self.base_rate * max(0.1, headroom)
+            else:
+                self._rate = self.base_rate
+
+    def penalize(self, seconds: float):
+        """
+        Pause all callers after Meta rejected a call for rate limiting
+
+        Args:
+            seconds: How long to stop sending calls
+        """
+        with self._lock:
+            self._pause(seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get limiter counters
+
+        Returns:
+            Dictionary with tokens acquired, time spent waiting and current rate
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats['waited_seconds'] = round(stats['waited_seconds'], 3)
+            stats['rate_per_second'] = round(self._rate, 2)
+            stats['usage_pct'] = self.usage_pct
+        return stats
+
+    def _refill(self, now: float):
+        """Add tokens for the time elapsed since the last refill (lock held)"""
+        elapsed = now - self._updated_at
+        if elapsed <= 0:
+            return
+        self._tokens = min(self.capacity, self._tokens + elapsed * self._rate)
+        self._updated_at = now
+
+    def _pause(self, seconds: float):
+        """Stop handing out tokens for `seconds` and drain the bucket (lock held)"""
+        now = time.monotonic()
+        if now + seconds > self._paused_until:
+            self._paused_until = now + seconds
+            self._tokens = 0.0
+            self._updated_at = self._paused_until
+            self.stats['pauses'] += 1
+
+
+def parse_usage_headers(headers: Mapping[str, str]) -> tuple:
+    """
+    Read the highest quota usage reported by Meta
+
+    Args:
+        headers: Response headers of a Graph API call
+
+    Returns:
+        Tuple of (usage percentage or None if no usage header, minutes until access is regained)
+    """
+    usage: Optional[float] = None
+    regain_minutes = 0
+
+    app_usage = _load_header(headers, 'X-App-Usage')
+    if isinstance(app_usage, dict):
+        usage = max(_usage_values(app_usage), default=usage)
+
+    buc_usage = _load_header(headers, 'X-Business-Use-Case-Usage')
+    if isinstance(buc_usage, dict):
+        for entries in buc_usage.values():
+            for entry in entries if isinstance(entries, list) else [entries]:
+                if not isinstance(entry, dict):
+                    continue
+                usage = max([usage or 0, *_usage_values(entry)])
+                regain_minutes = max(
+                    regain_minutes,
+                    int(entry.get('estimated_time_to_regain_access') or 0)
+                )
+
+    return usage, regain_minutes
+
+
+def _load_header(headers: Mapping[str, str], name: str) -> Any:
+    """Decode a JSON usage header, returning None when absent or malformed"""
+    value = headers.get(name)
+    if not value:
+        return None
+    try:
+        return json.loads(value)
+    except ValueError:
+        return None
+
+
+def _usage_values(entry: Dict[str, Any]) -> list:
+    """Extract the percentage counters from one usage entry"""
+    return [
+        float(entry[key])
+        for key in ('call_count', 'total_cputime', 'total_time')
+        if isinstance(entry.get(key), (int, float))
+    ]
@@ -0,0 +1,147 @@
+"""
+SQLite Connection Pool for Day 02 - Creator Intelligence System
+Shares a small set of persistent, tuned connections per database file
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Set, Union
+
+from . import config
+
+
+# In-memory databases exist per connection, so they cannot be shared
+SQLITE_MEMORY_PATHS = {':memory:', ''}
+
+
+class SQLiteConnectionPool:
+    """Thread-safe pool of persistent SQLite connections with tuned pragmas"""
+
+    def __init__(self, db_path: Union[str, Path], size: int = config.SQLITE_POOL_SIZE):
+        """
+        Initialize connection pool
+
+        Args:
+            db_path: Path to SQLite database file (':memory:' uses a single connection)
+            size: Maximum number of open connections
+        """
+        self.db_path = str(db_path)
+        # Every connection to ':memory:' opens its own empty database
+        self.size = 1 if self.db_path in SQLITE_MEMORY_PATHS else max(1, size)
+
+        self._idle: List[sqlite3.Connection] = []  # LIFO: reuse the warmest connection
+        self._all: Set[sqlite3.Connection] = set()
+        # Connections that were borrowed when close_all ran; closed when returned
+        self._retired: Set[sqlite3.Connection] = set()
+        self._available = threading.Condition()
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a new connection and apply performance pragmas"""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=config.SQLITE_CACHED_STATEMENTS
+        )
+
+        # WAL lets the Streamlit readers run while a pipeline writes
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA cache_size=-{config.SQLITE_CACHE_SIZE_KB}")
+        conn.execute(f"PRAGMA mmap_size={config.SQLITE_MMAP_SIZE_BYTES}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute(f"PRAGMA busy_timeout={config.SQLITE_BUSY_TIMEOUT_MS}")
+
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a connection from the pool
+
+        Blocks when all connections are in use. Any transaction left open
+        by the caller is rolled back before the connection is returned.
+
+        Yields:
+            sqlite3.Connection
+        """
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+
+    def _acquire(self) -> sqlite3.Connection:
+        """Take an idle connection, opening a new one while below pool size"""
+        with self._available:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+
+                if len(self._all) < self.size:
+                    conn = self._open_connection()
+                    self._all.add(conn)
+                    return conn
+
+                self._available.wait()
+
+    def _release(self, conn: sqlite3.Connection):
+        """Return a borrowed connection (closing it if close_all ran meanwhile)"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        finally:
+            with self._available:
+                if conn in self._retired:
+                    self._retired.discard(conn)
+                    conn.close()
+                else:
+                    self._idle.append(conn)
+                self._available.notify()
+
+    def close_all(self):
+        """
+        Close every connection owned by the pool
+
+        Idle connections are closed now; borrowed ones are closed when they
+        are returned instead of going back to the pool. The pool stays
+        usable and opens fresh connections on demand.
+        """
+        with self._available:
+            for conn in self._idle:
+                conn.close()
+                self._all.discard(conn)
+            self._idle = []
+
+            self._retired.update(self._all)
+            self._all = set()
+            self._available.notify_all()
+
+
+_pools: Dict[str, SQLiteConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path: Union[str, Path]) -> SQLiteConnectionPool:
+    """
+    Get the shared pool for a database file (created on first use)
+
+    ':memory:' is never shared: each call gets a private single-connection
+    pool, so a DataManager keeps one in-memory database for its lifetime.
+
+    Args:
+        db_path: Path to SQLite database file
+
+    Returns:
+        SQLiteConnectionPool shared by every DataManager using this file
+    """
+    if str(db_path) in SQLITE_MEMORY_PATHS:
+        return SQLiteConnectionPool(db_path, size=1)
+
+    key = str(Path(db_path).resolve())
+
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = SQLiteConnectionPool(db_path)
+        return _pools[key]
@@ -1,14 +1,28 @@
 """
 Synthetic Instagram Data Generator
 Creates 90 days of account metrics and 100 posts aligned with Instagram Graph API fields.
+
+The vectorized generator (generate_dataset) produces multi-account, multi-year
+fixtures chunk by chunk and writes them to the DataManager SQLite schema or Parquet.
+
+Usage (from day02/):
+    python -m src.synthetic_instagram_generator
+    python -m src.synthetic_instagram_generator --format sqlite --accounts 3 \
+        --start 2022-01-01 --end 2024-12-31 --posts-per-day 50 --output data/load_test.db
 """
 
+import argparse
 import json
 import random
 import string
 import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from . import config
 
 
 def random_post_id() -> str:
@@ -63,39 +77,54 @@ def generate_account_metrics() -> List[Dict[str, Any]]:
     return account_metrics
 
 
+CAPTION_STARTS = [
+    "Hoje foi intenso! ",
+    "Refletindo sobre a jornada... ",
+    "Vocês pediram e eu entreguei! ",
+    "Confesso que esse post foi especial 💛 ",
+    "Nem acredito que isso aconteceu 😭 ",
+    "Pequenos momentos, grandes histórias ✨ ",
+    "Que dia! ",
+    "Minha versão favorita de mim mesma 🖤 ",
+]
+
+CAPTION_MIDDLES = [
+    "Cada passo importa.",
+    "Estou vivendo meu sonho e sendo muito grata.",
+    "Nada supera essa sensação.",
+    "A estética de hoje está forte.",
+    "Eu precisava compartilhar isso.",
+    "Essa luz estava simplesmente perfeita.",
+    "Quem aí se identifica?",
+    "Esse momento merece ficar registrado.",
+]
+
+CAPTION_HASHTAGS = [
+    "#rotinanomade", "#viagens", "#nomadlife", "#digitalnomad",
+    "#buenosaires", "#paris", "#italytrip", "#europeansummer",
+    "#travelgirl", "#creatorlife", "#conteudo",
+    "#marketingdigital", "#mulheresviajantes"
+]
+
+CAPTION_EMOJIS = ["✨", "💛", "🔥", "🌍", "📸"]
+
+POSTING_TIMES = ["18:12", "19:03", "19:44", "20:15", "20:55", "21:07"]
+
+# Media type mix: 60% images, 30% carousels, 10% videos
+MEDIA_TYPES = ["IMAGE", "CAROUSEL_ALBUM", "VIDEO"]
+MEDIA_TYPE_WEIGHTS = [0.6, 0.3, 0.1]
+
+VIRAL_SHARE = 0.12
+
+# Posts are drawn in fixed blocks of days, each from its own random stream,
+# so the generated rows do not depend on how the output is chunked
+POST_BLOCK_DAYS = 30
+
+
 def random_caption() -> str:
     """Generate realistic Portuguese captions with emojis and hashtags."""
-    starts = [
-        "Hoje foi intenso! ",
-        "Refletindo sobre a jornada... ",
-        "Vocês pediram e eu entreguei! ",
-        "Confesso que esse post foi especial 💛 ",
-        "Nem acredito que isso aconteceu 😭 ",
-        "Pequenos momentos, grandes histórias ✨ ",
-        "Que dia! ",
-        "Minha versão favorita de mim mesma 🖤 ",
-    ]
-
-    middles = [
-        "Cada passo importa.",
-        "Estou vivendo meu sonho e sendo muito grata.",
-        "Nada supera essa sensação.",
-        "A estética de hoje está forte.",
-        "Eu precisava compartilhar isso.",
-        "Essa luz estava simplesmente perfeita.",
-        "Quem aí se identifica?",
-        "Esse momento merece ficar registrado.",
-    ]
-
-    hashtags = [
-        "#rotinanomade", "#viagens", "#nomadlife", "#digitalnomad",
-        "#buenosaires", "#paris", "#italytrip", "#europeansummer",
-        "#travelgirl", "#creatorlife", "#conteudo",
-        "#marketingdigital", "#mulheresviajantes"
-    ]
-
-    cap = random.choice(starts) + random.choice(middles) + " " + \
-        " ".join(random.sample(hashtags, k=4)) + " " + random.choice(["✨", "💛", "🔥", "🌍", "📸"])
+    cap = random.choice(CAPTION_STARTS) + random.choice(CAPTION_MIDDLES) + " " + \
+        " ".join(random.sample(CAPTION_HASHTAGS, k=4)) + " " + random.choice(CAPTION_EMOJIS)
     return cap
 
 
@@ -106,7 +135,6 @@ def generate_posts() -> List[Dict[str, Any]]:
     posts = []
 
     dates = generate_dates(90)
-    possible_times = ["18:12", "19:03", "19:44", "20:15", "20:55", "21:07"]
 
     media_types = (
         ["IMAGE"] * 60 +
@@ -118,7 +146,7 @@ def generate_posts() -> List[Dict[str, Any]]:
 
     for i in range(100):
         date = random.choice(dates)
-        time = random.choice(possible_times)
+        time = random.choice(POSTING_TIMES)
         timestamp = f"{date.isoformat()}T{time}:00+0000"
 
         media_type = random.choice(media_types)
@@ -157,14 +185,293 @@ def generate_posts() -> List[Dict[str, Any]]:
     return posts
 
 
-def main():
+# ----------------------------------------------------------------------------
+# Vectorized generator (load-testing fixtures)
+# ----------------------------------------------------------------------------
+
+def account_rng(seed: int, account: int) -> np.random.Generator:
+    """Independent, reproducible random stream per account."""
+    return np.random.default_rng([seed, account])
+
+
+def post_block_rng(seed: int, account: int, block: int) -> np.random.Generator:
+    """Independent, reproducible random stream per account and block of POST_BLOCK_DAYS days."""
+    return np.random.default_rng([seed, account, 1, block])
+
+
+def vectorized_account_metrics(
+    rng: np.random.Generator,
+    start_date: datetime.date,
+    end_date: datetime.date,
+    followers_start: int = 100_000,
+    daily_growth: float = 31.0
+) -> pd.DataFrame:
+    """
+    Generate daily account metrics for one account with NumPy.
+
+    Same shape as generate_account_metrics: weekday seasonality, soft
+    follower growth and a light upward drift in impressions.
+    """
+    dates = pd.date_range(start_date, end_date, freq='D')
+    n = len(dates)
+    day_index = np.arange(n)
+    weekday = dates.weekday.to_numpy()
+
+    impressions = rng.integers(30_000, 60_001, n).astype(float)
+    strong = np.isin(weekday, [1, 3, 6])  # Tue/Thu/Sun
+    soft = np.isin(weekday, [0, 2])  # Mon/Wed
+    impressions[strong] *= rng.uniform(1.25, 1.5, strong.sum())
+    impressions[soft] *= rng.uniform(0.85, 0.95, soft.sum())
+    impressions = np.maximum(10_000, impressions + day_index * rng.uniform(12, 25, n)).astype(np.int64)
+
+    return pd.DataFrame({
+        'date': dates.strftime('%Y-%m-%d'),
+        'followers': (followers_start + daily_growth * day_index).astype(np.int64),
+        'impressions': impressions,
+        'reach': (impressions * rng.uniform(0.68, 0.74, n)).astype(np.int64),
+        'profile_views': rng.integers(950, 2101, n),
+        'website_clicks': rng.integers(180, 521, n)
+    })
+
+
+def vectorized_captions(rng: np.random.Generator, n: int) -> np.ndarray:
+    """Build n captions from the caption vocabulary without a per-row Python call."""
+    starts = np.array(CAPTION_STARTS, dtype=object)
+    middles = np.array(CAPTION_MIDDLES, dtype=object)
+    hashtags = np.array(CAPTION_HASHTAGS, dtype=object)
+    emojis = np.array(CAPTION_EMOJIS, dtype=object)
+
+    # 4 distinct hashtags per caption: the first 4 columns of a random permutation
+    tags = np.argsort(rng.random((n, len(hashtags))), axis=1)[:, :4]
+
+    captions = starts[rng.integers(0, len(starts), n)] + middles[rng.integers(0, len(middles), n)]
+    for column in range(4):
+        captions = captions + " " + hashtags[tags[:, column]]
+    return captions + " " + emojis[rng.integers(0, len(emojis), n)]
+
+
+def vectorized_posts(
+    rng: np.random.Generator,
+    account: int,
+    first_seq: int,
+    days: pd.DatetimeIndex,
+    posts_per_day: float
+) -> pd.DataFrame:
+    """
+    Generate the posts published on a contiguous block of days.
+
+    Args:
+        rng: Account random stream
+        account: Account index (part of the post ID)
+        first_seq: Sequence number of the first post (keeps post IDs unique per account)
+        days: Days to publish on (times drawn from POSTING_TIMES)
+        posts_per_day: Average posts per day (Poisson)
+
+    Returns:
+        DataFrame in the DataManager posts schema (timestamps in UTC, sorted)
+    """
+    counts = rng.poisson(posts_per_day, len(days))
+    n = int(counts.sum())
+
+    day_values = np.repeat(days.to_numpy(), counts)
+    minutes = np.array([int(t[:2]) * 60 + int(t[3:]) for t in POSTING_TIMES])
+    timestamps = day_values + pd.to_timedelta(minutes[rng.integers(0, len(minutes), n)], unit='m').to_numpy()
+    timestamps.sort()
+
+    impressions = rng.integers(8000, 25_001, n).astype(float)
+    reach = impressions * rng.uniform(0.70, 0.80, n)
+    likes = rng.integers(500, 5001, n).astype(float)
+    comments = rng.integers(20, 201, n).astype(float)
+    shares = rng.integers(0, 51, n).astype(float)
+    saves = rng.integers(30, 301, n).astype(float)
+
+    multiplier = np.where(rng.random(n) < VIRAL_SHARE, rng.uniform(1.8, 3.0, n), 1.0)
+    impressions, reach, likes, comments, shares, saves = (
+        (values * multiplier).astype(np.int64)
+        for values in (impressions, reach, likes, comments, shares, saves)
+    )
+
+    weights = config.ENGAGEMENT_WEIGHTS
+    weighted = (
+        likes * weights['likes'] + comments * weights['comments'] +
+        shares * weights['shares'] + saves * weights['saves']
+    )
+    engagement_rate = np.round(np.divide(weighted * 100, reach, out=np.zeros(n), where=reach > 0), 2)
+
+    # 18-digit numeric IDs like IG media IDs, unique per (account, sequence)
+    post_ids = 170_000_000_000_000_000 + account * 10**12 + first_seq + np.arange(n, dtype=np.int64)
+
+    return pd.DataFrame({
+        'post_id': post_ids.astype(str),
+        'caption': vectorized_captions(rng, n),
+        'media_type': rng.choice(MEDIA_TYPES, n, p=MEDIA_TYPE_WEIGHTS),
+        'timestamp': pd.DatetimeIndex(timestamps).strftime('%Y-%m-%d %H:%M:%S+00:00'),
+        'likes': likes,
+        'comments': comments,
+        'shares': shares,
+        'saves': saves,
+        'impressions': impressions,
+        'reach': reach,
+        'engagement_rate': engagement_rate
+    })
+
+
+def account_posts(
+    seed: int,
+    account: int,
+    days: pd.DatetimeIndex,
+    posts_per_day: float,
+    chunk_days: int
+) -> Iterator[pd.DataFrame]:
+    """
+    Generate one account's posts and yield them chunk_days at a time.
+
+    Posts are drawn per POST_BLOCK_DAYS block and then cut at chunk
+    boundaries, so only the cut (not the draws) depends on chunk_days.
+    At most one block plus one chunk is held in memory.
+    """
+    chunk_days = max(1, chunk_days)
+    pending = None
+    generated_days = 0
+    seq = 0
+
+    for start in range(0, len(days), chunk_days):
+        end = min(start + chunk_days, len(days))
+
+        while generated_days < end:
+            block = generated_days // POST_BLOCK_DAYS
+            posts = vectorized_posts(
+                post_block_rng(seed, account, block),
+                account,
+                seq,
+                days[generated_days:generated_days + POST_BLOCK_DAYS],
+                posts_per_day
+            )
+            seq += len(posts)
+            generated_days += POST_BLOCK_DAYS
+            pending = posts if pending is None else pd.concat([pending, posts], ignore_index=True)
+
+        # Timestamps are sorted 'YYYY-MM-DD HH:MM:SS' strings: cut before the next chunk's first day
+        cut = len(pending) if end == len(days) else \
+            int(pending['timestamp'].searchsorted(days[end].strftime('%Y-%m-%d')))
+        if cut:
+            yield pending.iloc[:cut].reset_index(drop=True)
+            pending = pending.iloc[cut:]
+
+
+def generate_dataset(
+    seed: int = 42,
+    accounts: int = 1,
+    start_date: Optional[datetime.date] = None,
+    end_date: Optional[datetime.date] = None,
+    posts_per_day: float = 1.1,
+    chunk_days: int = 30
+) -> Iterator[Tuple[int, str, pd.DataFrame]]:
+    """
+    Stream a synthetic multi-account dataset in bounded chunks.
+
+    Account metrics use one random stream per account and posts one stream
+    per account and POST_BLOCK_DAYS block, so the rows only depend on the
+    seed and parameters, not on chunk_days or the output format.
+
+    Args:
+        seed: Random seed
+        accounts: Number of accounts
+        start_date: First day (defaults to 90 days ago)
+        end_date: Last day (defaults to today)
+        posts_per_day: Average posts per account per day (Poisson)
+        chunk_days: Days of posts generated per chunk (bounds memory)
+
+    Yields:
+        (account index, 'account_metrics' | 'posts', DataFrame) tuples
+    """
+    end_date = end_date or datetime.date.today()
+    start_date = start_date or end_date - datetime.timedelta(days=89)
+    if start_date > end_date:
+        raise ValueError(f"start_date {start_date} is after end_date {end_date}")
+
+    all_days = pd.date_range(start_date, end_date, freq='D')
+
+    for account in range(accounts):
+        rng = account_rng(seed, account)
+        yield account, 'account_metrics', vectorized_account_metrics(rng, start_date, end_date)
+
+        for posts in account_posts(seed, account, all_days, posts_per_day, chunk_days):
+            yield account, 'posts', posts
+
+
+def write_sqlite(chunks: Iterator[Tuple[int, str, pd.DataFrame]], output_path: Path, accounts: int) -> Dict[str, int]:
+    """
+    Write generated chunks through DataManager (keeps rollups and snapshot in sync).
+
+    The posts / account_metrics schema holds one account, so each account
+    gets its own database file when accounts > 1 (<stem>_<account>.db).
+    """
+    from .data_manager import DataManager
+
+    managers: Dict[int, DataManager] = {}
+    totals = {'account_metrics': 0, 'posts': 0}
+
+    try:
+        for account, table, df in chunks:
+            if account not in managers:
+                path = output_path if accounts == 1 else \
+                    output_path.with_name(f"{output_path.stem}_{account}{output_path.suffix}")
+                managers[account] = DataManager(db_path=str(path))
+
+            manager = managers[account]
+            if table == 'posts':
+                totals['posts'] += manager.save_posts(df)
+            else:
+                totals['account_metrics'] += manager.save_account_metrics(df)
+    finally:
+        for manager in managers.values():
+            manager.close()
+
+    return totals
+
+
+def write_parquet(chunks: Iterator[Tuple[int, str, pd.DataFrame]], output_path: Path) -> Dict[str, int]:
+    """
+    Append generated chunks to <stem>_posts.parquet and <stem>_account_metrics.parquet.
+
+    Each chunk becomes a row group, so memory stays bounded by the chunk size.
+    Rows carry an account_id column.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet output requires pyarrow (pip install pyarrow)") from e
+
+    writers: Dict[str, Any] = {}
+    totals = {'account_metrics': 0, 'posts': 0}
+
+    try:
+        for account, table, df in chunks:
+            df.insert(0, 'account_id', account)
+            batch = pa.Table.from_pandas(df, preserve_index=False)
+
+            if table not in writers:
+                path = output_path.with_name(f"{output_path.stem}_{table}.parquet")
+                writers[table] = pq.ParquetWriter(path, batch.schema, compression='snappy')
+
+            writers[table].write_table(batch)
+            totals[table] += len(df)
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+    return totals
+
+
+def write_legacy_json(output_path: Path):
+    """Write the original 90-day / 100-post JSON dataset."""
     output = {
         "account_metrics": generate_account_metrics(),
         "posts": generate_posts()
     }
 
-    project_dir = Path(__file__).resolve().parent.parent
-    output_path = project_dir / "data" / "synthetic_instagram_data.json"
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     with open(output_path, "w", encoding="utf-8") as f:
@@ -173,5 +480,47 @@ def main():
     print(f"Synthetic Instagram dataset created -> {output_path}")
 
 
+def main():
+    parser = argparse.ArgumentParser(description='Synthetic Instagram data generator')
+    parser.add_argument('--format', choices=['json', 'sqlite', 'parquet'], default='json',
+                        help='json: original 90-day dataset; sqlite/parquet: vectorized chunked generator')
+    parser.add_argument('--output', type=Path, help='Output file (defaults under data/)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--accounts', type=int, default=1)
+    parser.add_argument('--start', type=datetime.date.fromisoformat, help='First day (YYYY-MM-DD)')
+    parser.add_argument('--end', type=datetime.date.fromisoformat, help='Last day (YYYY-MM-DD)')
+    parser.add_argument('--posts-per-day', type=float, default=1.1)
+    parser.add_argument('--chunk-days', type=int, default=30, help='Days of posts per write')
+    args = parser.parse_args()
+
+    data_dir = Path(__file__).resolve().parent.parent / "data"
+
+    if args.format == 'json':
+        write_legacy_json(args.output or data_dir / "synthetic_instagram_data.json")
+        return
+
+    output_path = args.output or data_dir / f"synthetic_load_test.{'db' if args.format == 'sqlite' else 'parquet'}"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    chunks = generate_dataset(
+        seed=args.seed,
+        accounts=args.accounts,
+        start_date=args.start,
+        end_date=args.end,
+        posts_per_day=args.posts_per_day,
+        chunk_days=args.chunk_days
+    )
+
+    start = datetime.datetime.now()
+    if args.format == 'sqlite':
+        totals = write_sqlite(chunks, output_path, args.accounts)
+    else:
+        totals = write_parquet(chunks, output_path)
+    elapsed = (datetime.datetime.now() - start).total_seconds()
+
+    print(f"Synthetic Instagram dataset created -> {output_path} "
+          f"({totals['posts']:,} posts, {totals['account_metrics']:,} metric days, {elapsed:.1f}s)")
+
+
 if __name__ == "__main__":
     main()
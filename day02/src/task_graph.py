@@ -0,0 +1,168 @@
+"""
+Task Graph for Day 02 - Creator Intelligence System
+Runs dependent pipeline steps (e.g. LLM calls) concurrently on a bounded thread pool
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
+
+from . import config
+
+
+class TaskGraph:
+    """
+    Dependency graph of named tasks
+
+    A task starts as soon as all of its dependencies have finished, with at
+    most max_concurrency tasks running at once. Each task function receives
+    the results of its dependencies as positional arguments, in the order
+    they were declared.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = config.LLM_MAX_CONCURRENCY,
+        usage_fn: Optional[Callable[[], Dict[str, Any]]] = None
+    ):
+        """
+        Initialize task graph
+
+        Args:
+            max_concurrency: Maximum number of tasks running at the same time
+            usage_fn: Called in the worker thread after each task to collect
+                its token usage (e.g. OpenAIContentAnalyzer.consume_usage)
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.usage_fn = usage_fn
+
+        self._tasks: Dict[str, Dict[str, Any]] = {}
+        self.results: Dict[str, Any] = {}
+        self.timings: List[Dict[str, Any]] = []
+        self._timings_lock = threading.Lock()
+
+    def add(self, name: str, fn: Callable[..., Any], depends_on: Optional[List[str]] = None):
+        """
+        Register a task
+
+        Args:
+            name: Unique task name
+            fn: Callable receiving the results of depends_on
+            depends_on: Names of tasks that must finish first (registered earlier)
+
+        Raises:
+            ValueError: If the name is taken or a dependency is unknown
+        """
+        depends_on = list(depends_on or [])
+
+        if name in self._tasks:
+            raise ValueError(f"Task '{name}' is already registered")
+
+        # Dependencies must already exist, which also rules out cycles
+        unknown = [dep for dep in depends_on if dep not in self._tasks]
+        if unknown:
+            raise ValueError(f"Task '{name}' depends on unknown task(s): {', '.join(unknown)}")
+
+        self._tasks[name] = {'fn': fn, 'depends_on': depends_on}
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Run every task, independent ones concurrently
+
+        A failing task is recorded with its error; tasks that depend on it
+        are skipped.
+
+        Returns:
+            Dictionary of task name -> result (failed and skipped tasks are missing)
+        """
+        pending = dict(self._tasks)
+        failed = set()
+        running = {}
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            while pending or running:
+                for name, task in list(pending.items()):
+                    if any(dep in failed for dep in task['depends_on']):
+                        failed.add(name)
+                        del pending[name]
+                        self._record(name, task, 0.0, start, error='skipped (dependency failed)')
+                    elif all(dep in self.results for dep in task['depends_on']):
+                        args = [self.results[dep] for dep in task['depends_on']]
+                        running[executor.submit(self._run_task, name, task, args, start)] = name
+                        del pending[name]
+
+                if not running:
+                    continue
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    ok, result = future.result()
+                    if ok:
+                        self.results[name] = result
+                    else:
+                        failed.add(name)
+
+        self.wall_seconds = time.perf_counter() - start
+        return self.results
+
+    def _run_task(self, name: str, task: Dict[str, Any], args: List[Any], start: float) -> tuple:
+        """Run one task in a worker thread and record its latency and usage"""
+        started = time.perf_counter()
+        try:
+            result = task['fn'](*args)
+            ok, error = True, None
+        except Exception as e:
+            result, ok, error = None, False, str(e)
+
+        self._record(name, task, time.perf_counter() - started, start, started=started, error=error)
+        return ok, result
+
+    def _record(
+        self,
+        name: str,
+        task: Dict[str, Any],
+        latency: float,
+        start: float,
+        started: Optional[float] = None,
+        error: Optional[str] = None
+    ):
+        """Store timing, token usage and error of a task"""
+        usage = self.usage_fn() if self.usage_fn is not None and started is not None else {}
+
+        with self._timings_lock:
+            self.timings.append({
+                'task': name,
+                'depends_on': task['depends_on'],
+                'started_at': round((started or time.perf_counter()) - start, 3),
+                'latency_seconds': round(latency, 3),
+                'prompt_tokens': usage.get('prompt_tokens', 0),
+                'completion_tokens': usage.get('completion_tokens', 0),
+                'cached_calls': usage.get('cached_calls', 0),
+                'llm_calls': usage.get('calls', 0),
+                'error': error
+            })
+
+    def print_report(self):
+        """Print per-task latency and token usage"""
+        print("\n⏱️  Task latency and token usage:")
+        print(f"   {'Task':<22} {'Start':>7} {'Latency':>8} {'Prompt':>8} {'Completion':>11}  Notes")
+
+        for timing in sorted(self.timings, key=lambda t: t['started_at']):
+            notes = []
+            if timing['cached_calls']:
+                notes.append(f"{timing['cached_calls']}/{timing['llm_calls']} cached")
+            if timing['error']:
+                notes.append(timing['error'])
+            print(
+                f"   {timing['task']:<22} {timing['started_at']:>6.2f}s {timing['latency_seconds']:>7.2f}s "
+                f"{timing['prompt_tokens']:>8,} {timing['completion_tokens']:>11,}  {', '.join(notes)}"
+            )
+
+        total_latency = sum(t['latency_seconds'] for t in self.timings)
+        print(f"   Wall clock: {self.wall_seconds:.2f}s (sequential would be ~{total_latency:.2f}s, "
+              f"concurrency cap {self.max_concurrency})")
+        print(f"   Tokens: {sum(t['prompt_tokens'] for t in self.timings):,} prompt + "
+              f"{sum(t['completion_tokens'] for t in self.timings):,} completion")
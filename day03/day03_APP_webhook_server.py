@@ -3,13 +3,16 @@ Day 03 - GDPR Lead Ingestion Webhook Server
 Flask application that receives GDPR-compliant lead data via POST requests.
 """
 
+import atexit
+import json
 import logging
 from flask import Flask, request, jsonify
 from datetime import datetime
 
-from day03_CONFIG_settings import DAY03_WEBHOOK_HOST, DAY03_WEBHOOK_PORT
+from day03_CONFIG_settings import DAY03_WEBHOOK_HOST, DAY03_WEBHOOK_PORT, DAY03_BULK_MAX_LEADS
 from day03_PIPELINE_gdpr_validator import day03_GDPRValidator, day03_format_lead_for_bigquery
 from day03_DATA_load_bigquery import day03_BigQueryLoader
+from day03_DATA_ingest_buffer import day03_LeadBuffer
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +28,14 @@ app = Flask(__name__)
 validator = day03_GDPRValidator()
 bq_loader = day03_BigQueryLoader()
 
+# Validated leads are buffered and written to BigQuery in micro-batches.
+# The spool is opened lazily in each worker process, which only replays its own rows.
+lead_buffer = day03_LeadBuffer(
+    flush_fn=bq_loader.day03_insert_leads,
+    probe_fn=bq_loader.day03_ping
+)
+atexit.register(lead_buffer.day03_stop)
+
 
 @app.route('/health', methods=['GET'])
 def health_check():
@@ -32,6 +43,8 @@ def health_check():
     return jsonify({
         "status": "healthy",
         "service": "Day 03 - GDPR Lead Ingestion Webhook",
+        "buffer": lead_buffer.day03_get_stats(),
+        "bigquery_metadata_cache": bq_loader.day03_get_metadata_stats(),
         "timestamp": datetime.utcnow().isoformat()
     }), 200
 
@@ -52,7 +65,8 @@ def day03_receive_lead():
     }
 
     Returns:
-        JSON response with success/error status
+        JSON response with accepted/error status. Leads are acknowledged with
+        202 once buffered and spooled; the BigQuery write happens in a batch.
     """
     try:
         # Get JSON payload
@@ -78,25 +92,25 @@ def day03_receive_lead():
         # Format for BigQuery
         bq_lead = day03_format_lead_for_bigquery(processed_lead)
 
-        # Insert into BigQuery
-        success = bq_loader.day03_insert_lead(bq_lead)
-
-        if not success:
-            logger.error("Failed to insert lead into BigQuery")
+        # Queue for the next BigQuery batch
+        try:
+            lead_buffer.day03_add(bq_lead)
+        except Exception as e:
+            logger.error(f"Failed to buffer lead: {str(e)}")
             return jsonify({
                 "error": "Failed to store lead data",
                 "status": "storage_failed"
             }), 500
 
-        # Success response
-        logger.info(f"Successfully processed lead: {processed_lead['lead_id']}")
+        # Accepted response
+        logger.info(f"Accepted lead: {processed_lead['lead_id']}")
         return jsonify({
-            "status": "success",
-            "message": "Lead processed and stored successfully",
+            "status": "accepted",
+            "message": "Lead validated and queued for storage",
             "lead_id": processed_lead['lead_id'],
             "consent_given": processed_lead['consent_given'],
             "data_retention_date": processed_lead['data_retention_date'].split('T')[0]
-        }), 201
+        }), 202
 
     except Exception as e:
         logger.error(f"Unexpected error processing lead: {str(e)}", exc_info=True)
@@ -106,6 +120,108 @@ def day03_receive_lead():
         }), 500
 
 
+@app.route('/leads/bulk', methods=['POST'])
+def day03_receive_leads_bulk():
+    """
+    Receives a batch of leads (e.g. a CRM backlog replay) and validates it
+    as one columnar frame.
+
+    Accepts either a JSON array (Content-Type: application/json) or NDJSON,
+    one lead object per line (Content-Type: application/x-ndjson).
+
+    Returns:
+        JSON report with one accept/reject entry per input row
+    """
+    try:
+        body = request.get_data(as_text=True)
+
+        if request.is_json:
+            try:
+                payloads = json.loads(body)
+            except ValueError:
+                return jsonify({
+                    "error": "Request body is not valid JSON",
+                    "status": "validation_failed"
+                }), 400
+            if not isinstance(payloads, list):
+                return jsonify({
+                    "error": "Bulk payload must be a JSON array of leads",
+                    "status": "validation_failed"
+                }), 400
+        else:
+            payloads = day03_parse_ndjson(body)
+
+        if len(payloads) > DAY03_BULK_MAX_LEADS:
+            return jsonify({
+                "error": f"Batch too large. Maximum is {DAY03_BULK_MAX_LEADS} leads per request",
+                "status": "payload_too_large"
+            }), 413
+
+        logger.info(f"Received bulk submission with {len(payloads)} lead(s)")
+
+        bq_leads, report = validator.validate_leads_batch(payloads)
+        rejected_count = len(report) - len(bq_leads)
+
+        if not bq_leads:
+            logger.warning(f"Bulk validation rejected all {rejected_count} lead(s)")
+            return jsonify({
+                "status": "validation_failed",
+                "received": len(report),
+                "accepted": 0,
+                "rejected": rejected_count,
+                "results": report
+            }), 400
+
+        try:
+            lead_buffer.day03_add_many(bq_leads)
+        except Exception as e:
+            logger.error(f"Failed to buffer bulk leads: {str(e)}")
+            return jsonify({
+                "error": "Failed to store lead data",
+                "status": "storage_failed"
+            }), 500
+
+        logger.info(f"Accepted {len(bq_leads)} lead(s), rejected {rejected_count}")
+        return jsonify({
+            "status": "accepted",
+            "received": len(report),
+            "accepted": len(bq_leads),
+            "rejected": rejected_count,
+            "results": report
+        }), 202
+
+    except Exception as e:
+        logger.error(f"Unexpected error processing bulk leads: {str(e)}", exc_info=True)
+        return jsonify({
+            "error": "Internal server error",
+            "status": "error"
+        }), 500
+
+
+def day03_parse_ndjson(body: str) -> list:
+    """
+    Parses an NDJSON body into a list of payloads.
+
+    Blank lines are skipped; lines that are not valid JSON become None so the
+    validator reports them as rejected rows instead of failing the whole batch.
+
+    Args:
+        body: Raw request body
+
+    Returns:
+        List of parsed payloads
+    """
+    payloads = []
+    for line in body.splitlines():
+        if not line.strip():
+            continue
+        try:
+            payloads.append(json.loads(line))
+        except ValueError:
+            payloads.append(None)
+    return payloads
+
+
 @app.route('/leads/stats', methods=['GET'])
 def day03_get_stats():
     """
@@ -139,6 +255,7 @@ def not_found(error):
         "available_endpoints": [
             "GET /health",
             "POST /leads",
+            "POST /leads/bulk",
             "GET /leads/stats"
         ]
     }), 404
@@ -162,13 +279,15 @@ def day03_start_webhook_server():
     # Ensure BigQuery setup is ready
     try:
         logger.info("Verifying BigQuery setup...")
-        bq_loader.day03_ensure_dataset_exists()
-        bq_loader.day03_ensure_table_exists()
+        bq_loader.day03_ensure_metadata()
         logger.info("BigQuery setup verified successfully")
     except Exception as e:
         logger.warning(f"BigQuery setup verification failed: {str(e)}")
         logger.warning("Server will start, but BigQuery operations may fail")
 
+    # Start the background flusher (also replays any spooled leads)
+    lead_buffer.day03_start()
+
     # Start Flask server
     app.run(
         host=DAY03_WEBHOOK_HOST,
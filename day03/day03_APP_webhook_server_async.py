@@ -0,0 +1,330 @@
+"""
+Day 03 - GDPR Lead Ingestion Webhook Server (ASGI variant)
+FastAPI application that validates leads on the event loop and hands BigQuery
+writes to a bounded background queue, returning 429 when the queue is full.
+
+Run with:
+    uvicorn day03_APP_webhook_server_async:app --host 0.0.0.0 --port 5000
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from day03_CONFIG_settings import (
+    DAY03_WEBHOOK_HOST,
+    DAY03_WEBHOOK_PORT,
+    DAY03_BUFFER_MAX_SIZE,
+    DAY03_ASYNC_QUEUE_MAX_SIZE,
+    DAY03_ASYNC_WRITE_CONCURRENCY,
+    DAY03_ASYNC_MAX_RETRIES
+)
+from day03_PIPELINE_gdpr_validator import day03_GDPRValidator, day03_format_lead_for_bigquery
+from day03_DATA_ingest_buffer import day03_LeadBuffer
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+class day03_AsyncWriteQueue:
+    """
+    Bounded queue of validated leads drained by a fixed number of writer tasks.
+
+    Each writer takes up to batch_size queued leads and stores them with one
+    loader call in a worker thread, so at most `concurrency` BigQuery load jobs
+    run at the same time and the event loop is never blocked. Batches that
+    still fail after max_retries are handed to a fallback day03_LeadBuffer,
+    whose SQLite spool keeps retrying them, since every lead was already
+    acknowledged with 202.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DAY03_ASYNC_QUEUE_MAX_SIZE,
+        concurrency: int = DAY03_ASYNC_WRITE_CONCURRENCY,
+        batch_size: int = DAY03_BUFFER_MAX_SIZE,
+        max_retries: int = DAY03_ASYNC_MAX_RETRIES
+    ):
+        """
+        Initialize queue limits.
+
+        Args:
+            max_size: Maximum queued leads before new submissions are rejected
+            concurrency: Number of concurrent writer tasks
+            batch_size: Maximum leads per loader call
+            max_retries: Attempts per batch before it is handed to the fallback buffer
+        """
+        self.max_size = max_size
+        self.concurrency = max(1, concurrency)
+        self.batch_size = max(1, batch_size)
+        self.max_retries = max(1, max_retries)
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._write_fn = None
+        self._fallback: Optional[day03_LeadBuffer] = None
+
+        self.stats = {
+            "accepted": 0,
+            "rejected_backpressure": 0,
+            "written_leads": 0,
+            "written_batches": 0,
+            "failed_writes": 0,
+            "spooled_leads": 0,
+            "dropped_leads": 0
+        }
+
+    async def day03_start(self, write_fn, fallback: Optional[day03_LeadBuffer] = None) -> None:
+        """
+        Starts the writer tasks.
+
+        Args:
+            write_fn: Blocking callable that stores a list of leads and returns True on success
+            fallback: Buffer that takes over batches that exhausted their retries
+                (without one such batches are dropped)
+        """
+        self._write_fn = write_fn
+        self._fallback = fallback
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._workers = [
+            asyncio.create_task(self._day03_writer(), name=f"day03-writer-{i}")
+            for i in range(self.concurrency)
+        ]
+        logger.info(
+            f"Write queue started (max_size={self.max_size}, "
+            f"concurrency={self.concurrency}, batch_size={self.batch_size})"
+        )
+
+    async def day03_stop(self) -> None:
+        """Waits for queued leads to be written, then stops the writer tasks."""
+        if self._queue is not None:
+            await self._queue.join()
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def day03_try_put(self, lead: Dict) -> bool:
+        """
+        Queues a lead without waiting.
+
+        Args:
+            lead: BigQuery-formatted lead
+
+        Returns:
+            True if queued, False if the queue is full (caller should return 429)
+        """
+        try:
+            self._queue.put_nowait(lead)
+        except asyncio.QueueFull:
+            self.stats["rejected_backpressure"] += 1
+            return False
+
+        self.stats["accepted"] += 1
+        return True
+
+    def day03_get_stats(self) -> Dict:
+        """
+        Returns queue counters and current depth.
+
+        Returns:
+            Dictionary with queue depth and write statistics
+        """
+        stats = dict(self.stats)
+        stats["queued"] = self._queue.qsize() if self._queue is not None else 0
+        stats["max_size"] = self.max_size
+        return stats
+
+    async def _day03_writer(self) -> None:
+        """Writer loop: drains up to batch_size leads and stores them in a thread."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                await self._day03_write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _day03_write_batch(self, batch: List[Dict]) -> None:
+        """Stores one batch, retrying with exponential backoff on failure."""
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                success = await asyncio.to_thread(self._write_fn, batch)
+            except Exception as e:
+                logger.error(f"Write attempt {attempt} raised: {str(e)}")
+                success = False
+
+            if success:
+                self.stats["written_leads"] += len(batch)
+                self.stats["written_batches"] += 1
+                return
+
+            self.stats["failed_writes"] += 1
+            if attempt < self.max_retries:
+                await asyncio.sleep(2 ** (attempt - 1))
+
+        if self._fallback is not None:
+            try:
+                await asyncio.to_thread(self._fallback.day03_add_many, batch)
+                self.stats["spooled_leads"] += len(batch)
+                logger.warning(
+                    f"Spooled {len(batch)} lead(s) after {self.max_retries} failed attempts"
+                )
+                return
+            except Exception as e:
+                logger.error(f"Fallback buffer rejected batch: {str(e)}")
+
+        self.stats["dropped_leads"] += len(batch)
+        logger.error(f"Dropped {len(batch)} lead(s) after {self.max_retries} failed attempts")
+
+
+def day03_create_app(
+    loader=None,
+    write_queue: Optional[day03_AsyncWriteQueue] = None,
+    fallback_buffer: Optional[day03_LeadBuffer] = None
+) -> FastAPI:
+    """
+    Builds the ASGI application.
+
+    Args:
+        loader: Object exposing day03_insert_leads(leads) -> bool; a
+            day03_BigQueryLoader is created at startup when omitted
+        write_queue: Custom write queue (defaults to config-driven limits)
+        fallback_buffer: Spool-backed buffer for batches that exhausted their
+            retries (defaults to a day03_LeadBuffer on DAY03_BUFFER_SPOOL_PATH)
+
+    Returns:
+        Configured FastAPI application
+    """
+    validator = day03_GDPRValidator()
+    write_queue = write_queue or day03_AsyncWriteQueue()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        nonlocal loader, fallback_buffer
+        if loader is None:
+            from day03_DATA_load_bigquery import day03_BigQueryLoader
+
+            loader = day03_BigQueryLoader()
+            try:
+                logger.info("Verifying BigQuery setup...")
+                await asyncio.to_thread(loader.day03_ensure_metadata)
+                logger.info("BigQuery setup verified successfully")
+            except Exception as e:
+                logger.warning(f"BigQuery setup verification failed: {str(e)}")
+                logger.warning("Server will start, but BigQuery operations may fail")
+
+        if fallback_buffer is None:
+            fallback_buffer = day03_LeadBuffer(
+                flush_fn=loader.day03_insert_leads,
+                probe_fn=getattr(loader, "day03_ping", None)
+            )
+        # Also replays leads spooled by a previous run
+        await asyncio.to_thread(fallback_buffer.day03_start)
+
+        await write_queue.day03_start(loader.day03_insert_leads, fallback=fallback_buffer)
+        yield
+        await write_queue.day03_stop()
+        await asyncio.to_thread(fallback_buffer.day03_stop)
+
+    app = FastAPI(title="Day 03 - GDPR Lead Ingestion Webhook (ASGI)", lifespan=lifespan)
+
+    @app.get("/health")
+    async def health_check():
+        """Health check endpoint."""
+        return {
+            "status": "healthy",
+            "service": "Day 03 - GDPR Lead Ingestion Webhook (ASGI)",
+            "write_queue": write_queue.day03_get_stats(),
+            "fallback_buffer": fallback_buffer.day03_get_stats() if fallback_buffer else None,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+
+    @app.post("/leads")
+    async def day03_receive_lead(request: Request):
+        """
+        Receives a GDPR-compliant lead and queues it for a background BigQuery write.
+
+        Returns:
+            202 when queued, 400 on validation errors, 429 when the write queue is full
+        """
+        if "application/json" not in request.headers.get("content-type", ""):
+            logger.warning("Received non-JSON request")
+            return JSONResponse(
+                {"error": "Content-Type must be application/json"},
+                status_code=400
+            )
+
+        try:
+            payload = await request.json()
+        except ValueError:
+            return JSONResponse(
+                {"error": "Request body is not valid JSON", "status": "validation_failed"},
+                status_code=400
+            )
+
+        if not isinstance(payload, dict):
+            return JSONResponse(
+                {"error": "Lead must be a JSON object", "status": "validation_failed"},
+                status_code=400
+            )
+
+        # Validation is CPU-light, so it runs directly on the event loop
+        is_valid, error_message, processed_lead = validator.validate_lead(payload)
+
+        if not is_valid:
+            logger.warning(f"Validation failed: {error_message}")
+            return JSONResponse(
+                {"error": error_message, "status": "validation_failed"},
+                status_code=400
+            )
+
+        bq_lead = day03_format_lead_for_bigquery(processed_lead)
+
+        if not write_queue.day03_try_put(bq_lead):
+            logger.warning("Write queue full; rejecting lead with 429")
+            return JSONResponse(
+                {
+                    "error": "Server is busy, retry later",
+                    "status": "backpressure"
+                },
+                status_code=429,
+                headers={"Retry-After": "1"}
+            )
+
+        return JSONResponse(
+            {
+                "status": "accepted",
+                "message": "Lead validated and queued for storage",
+                "lead_id": processed_lead["lead_id"],
+                "consent_given": processed_lead["consent_given"],
+                "data_retention_date": processed_lead["data_retention_date"].split("T")[0]
+            },
+            status_code=202
+        )
+
+    return app
+
+
+app = day03_create_app()
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    logger.info(f"Starting GDPR Lead Ingestion Webhook Server (ASGI)...")
+    logger.info(f"POST leads to: http://localhost:{DAY03_WEBHOOK_PORT}/leads")
+    uvicorn.run(app, host=DAY03_WEBHOOK_HOST, port=DAY03_WEBHOOK_PORT)
@@ -20,9 +20,24 @@ DAY03_BQ_LOCATION = os.getenv("DAY03_BQ_LOCATION", "US")
 
 # GDPR Configuration
 DAY03_GDPR_RETENTION_DAYS = int(os.getenv("DAY03_GDPR_RETENTION_DAYS", "30"))
+DAY03_CONSENTED_RETENTION_DAYS = 365
 DAY03_WEBHOOK_PORT = int(os.getenv("DAY03_WEBHOOK_PORT", "5000"))
 DAY03_WEBHOOK_HOST = os.getenv("DAY03_WEBHOOK_HOST", "0.0.0.0")
 
+# Ingest Buffer Configuration (micro-batching of validated leads)
+DAY03_BUFFER_MAX_SIZE = int(os.getenv("DAY03_BUFFER_MAX_SIZE", "500"))
+DAY03_BUFFER_MAX_AGE_SECONDS = float(os.getenv("DAY03_BUFFER_MAX_AGE_SECONDS", "5"))
+DAY03_BUFFER_SPOOL_PATH = os.getenv("DAY03_BUFFER_SPOOL_PATH", "data/day03_lead_spool.db")
+DAY03_BUFFER_MAX_FLUSH_ATTEMPTS = int(os.getenv("DAY03_BUFFER_MAX_FLUSH_ATTEMPTS", "3"))
+
+# Bulk ingestion (/leads/bulk)
+DAY03_BULK_MAX_LEADS = int(os.getenv("DAY03_BULK_MAX_LEADS", "100000"))
+
+# Async (ASGI) server: background write queue and backpressure
+DAY03_ASYNC_QUEUE_MAX_SIZE = int(os.getenv("DAY03_ASYNC_QUEUE_MAX_SIZE", "1000"))
+DAY03_ASYNC_WRITE_CONCURRENCY = int(os.getenv("DAY03_ASYNC_WRITE_CONCURRENCY", "4"))
+DAY03_ASYNC_MAX_RETRIES = int(os.getenv("DAY03_ASYNC_MAX_RETRIES", "3"))
+
 # Required fields for GDPR validation
 DAY03_REQUIRED_FIELDS = [
     "name",
@@ -0,0 +1,574 @@
+"""
+Day 03 - Lead Ingest Buffer
+Micro-batches validated leads and flushes them to BigQuery by size or by age,
+with a local SQLite spool so buffered leads survive a server restart.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from day03_CONFIG_settings import (
+    DAY03_BUFFER_MAX_SIZE,
+    DAY03_BUFFER_MAX_AGE_SECONDS,
+    DAY03_BUFFER_SPOOL_PATH,
+    DAY03_BUFFER_MAX_FLUSH_ATTEMPTS
+)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Pending entries are (spool_row_id, lead, enqueued_at); row id is None without spool
+day03_PendingLead = Tuple[Optional[int], Dict, float]
+
+
+def day03_pid_alive(pid: int) -> bool:
+    """Returns True if a process with this pid is running on this host."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class day03_LeadBuffer:
+    """
+    In-process buffer that accepts BigQuery-formatted leads and writes them
+    in batches through a single flush callable (e.g. day03_insert_leads).
+
+    A batch is flushed when it reaches max_size leads or when its oldest lead
+    has waited max_age_seconds, whichever comes first. Every accepted lead is
+    written to the spool before it is acknowledged and removed only after its
+    batch was stored successfully.
+
+    Several processes (e.g. gunicorn workers) can share one spool file: each
+    spooled row records the pid that owns it, and a starting buffer only
+    replays its own rows and rows whose owner process is gone.
+    """
+
+    def __init__(
+        self,
+        flush_fn: Callable[[List[Dict]], bool],
+        max_size: int = DAY03_BUFFER_MAX_SIZE,
+        max_age_seconds: float = DAY03_BUFFER_MAX_AGE_SECONDS,
+        spool_path: Optional[str] = DAY03_BUFFER_SPOOL_PATH,
+        max_flush_attempts: int = DAY03_BUFFER_MAX_FLUSH_ATTEMPTS,
+        probe_fn: Optional[Callable[[], bool]] = None
+    ):
+        """
+        Initialize the buffer. The spool is opened (and leads left in it are
+        recovered) by day03_start, so a buffer created before the server
+        forks its workers does not claim rows in the parent process.
+
+        Args:
+            flush_fn: Callable that stores a list of leads and returns True on success
+            max_size: Number of leads that triggers an immediate flush (and batch size)
+            max_age_seconds: Maximum time a lead waits before being flushed
+            spool_path: SQLite file used as crash-safe spool (None or "" disables it)
+            max_flush_attempts: Failed flushes of the same batch before its
+                offending leads are isolated and moved to the dead-letter table
+            probe_fn: Cheap check that the target is reachable (e.g.
+                day03_ping). Lets a batch whose every lead fails be
+                dead-lettered; without it such a batch is kept and retried
+        """
+        self.flush_fn = flush_fn
+        self.max_size = max(1, max_size)
+        self.max_age_seconds = max_age_seconds
+        self.spool_path = spool_path or None
+        self.max_flush_attempts = max(1, max_flush_attempts)
+        self.probe_fn = probe_fn
+
+        self._day03_reset_process_state()
+
+        self.stats = {
+            "accepted": 0,
+            "flushed_leads": 0,
+            "flushed_batches": 0,
+            "failed_flushes": 0,
+            "recovered": 0,
+            "dead_lettered": 0,
+            "failed_probes": 0
+        }
+
+    def _day03_reset_process_state(self) -> None:
+        """(Re)creates locks, queue and spool handle for the current process."""
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._pending: List[day03_PendingLead] = []
+        self._head_failures = 0
+        # Dead letters are kept here when the spool is disabled
+        self.dead_letters: List[Dict] = []
+
+        self._spool: Optional[sqlite3.Connection] = None
+
+    def _day03_check_process(self) -> None:
+        """Drops state inherited through fork(); the child starts with an empty queue."""
+        if self._pid != os.getpid():
+            self._day03_reset_process_state()
+
+    def _day03_init_spool(self) -> None:
+        """Opens the SQLite spool and creates its tables if needed."""
+        spool_dir = os.path.dirname(self.spool_path)
+        if spool_dir:
+            os.makedirs(spool_dir, exist_ok=True)
+
+        # Autocommit mode: multi-statement writes use explicit BEGIN IMMEDIATE
+        self._spool = sqlite3.connect(
+            self.spool_path,
+            timeout=30,
+            isolation_level=None,
+            check_same_thread=False
+        )
+        self._spool.execute("PRAGMA journal_mode=WAL")
+        self._spool.execute("PRAGMA synchronous=NORMAL")
+        self._spool.execute("""
+            CREATE TABLE IF NOT EXISTS spooled_leads (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                payload TEXT NOT NULL,
+                spooled_at TEXT NOT NULL,
+                owner TEXT
+            )
+        """)
+        self._spool.execute("""
+            CREATE TABLE IF NOT EXISTS dead_letter_leads (
+                id INTEGER PRIMARY KEY,
+                payload TEXT NOT NULL,
+                spooled_at TEXT NOT NULL,
+                dead_lettered_at TEXT NOT NULL,
+                attempts INTEGER NOT NULL
+            )
+        """)
+
+        # Spools written before rows had an owner: those rows are unclaimed
+        columns = [row[1] for row in self._spool.execute("PRAGMA table_info(spooled_leads)")]
+        if "owner" not in columns:
+            self._spool.execute("ALTER TABLE spooled_leads ADD COLUMN owner TEXT")
+
+    @contextmanager
+    def _day03_spool_transaction(self) -> Iterator[sqlite3.Connection]:
+        """Runs spool statements in one write transaction (locks out other processes)."""
+        self._spool.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._spool
+        except Exception:
+            self._spool.execute("ROLLBACK")
+            raise
+        self._spool.execute("COMMIT")
+
+    def _day03_recover_spool(self) -> None:
+        """
+        Claims and reloads leads that were spooled but never flushed.
+
+        Rows owned by another live process are left alone, so workers sharing
+        the spool never replay (and double-send) each other's leads.
+        """
+        owner = str(self._pid)
+
+        with self._day03_spool_transaction() as spool:
+            owners = [row[0] for row in spool.execute(
+                "SELECT DISTINCT owner FROM spooled_leads"
+            )]
+            orphaned = [
+                o for o in owners
+                if o is not None and o != owner
+                and not (o.isdigit() and day03_pid_alive(int(o)))
+            ]
+            spool.execute(
+                "UPDATE spooled_leads SET owner = ? WHERE owner IS NULL", (owner,)
+            )
+            spool.executemany(
+                "UPDATE spooled_leads SET owner = ? WHERE owner = ?",
+                [(owner, o) for o in orphaned]
+            )
+            rows = spool.execute(
+                "SELECT id, payload FROM spooled_leads WHERE owner = ? ORDER BY id",
+                (owner,)
+            ).fetchall()
+
+        if not rows:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            for row_id, payload in rows:
+                self._pending.append((row_id, json.loads(payload), now))
+            self.stats["recovered"] += len(rows)
+
+        logger.info(f"Recovered {len(rows)} spooled lead(s) from {self.spool_path}")
+
+    def day03_start(self) -> None:
+        """Opens the spool, replays leads left in it and starts the flush thread (idempotent)."""
+        self._day03_check_process()
+
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            open_spool = self.spool_path is not None and self._spool is None
+
+        if open_spool:
+            self._day03_init_spool()
+            self._day03_recover_spool()
+
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._day03_run,
+                name="day03-lead-buffer",
+                daemon=True
+            )
+            self._thread.start()
+
+        logger.info(
+            f"Lead buffer started (pid={self._pid}, max_size={self.max_size}, "
+            f"max_age={self.max_age_seconds}s, spool={self.spool_path or 'disabled'})"
+        )
+
+    def day03_stop(self) -> None:
+        """Stops the background thread and flushes whatever is still pending."""
+        if self._pid != os.getpid():
+            return
+
+        self._stop.set()
+        self._wake.set()
+
+        if self._thread is not None:
+            self._thread.join(timeout=self.max_age_seconds + 30)
+            self._thread = None
+
+        self.day03_flush()
+
+        if self._spool is not None:
+            with self._lock:
+                self._spool.close()
+                self._spool = None
+
+    def day03_add(self, lead: Dict) -> None:
+        """
+        Accepts a BigQuery-formatted lead for a later batched insert.
+
+        The lead is durable in the spool once this method returns.
+
+        Args:
+            lead: Lead dictionary as produced by day03_format_lead_for_bigquery
+        """
+        self._day03_check_process()
+        if self._thread is None:
+            self.day03_start()
+
+        with self._lock:
+            row_id = None
+            if self._spool is not None:
+                cursor = self._spool.execute(
+                    "INSERT INTO spooled_leads (payload, spooled_at, owner) VALUES (?, ?, ?)",
+                    (json.dumps(lead), datetime.utcnow().isoformat(), str(self._pid))
+                )
+                row_id = cursor.lastrowid
+
+            self._pending.append((row_id, lead, time.monotonic()))
+            self.stats["accepted"] += 1
+            pending_count = len(self._pending)
+
+        if pending_count >= self.max_size:
+            self._wake.set()
+
+    def day03_add_many(self, leads: List[Dict]) -> None:
+        """
+        Accepts a batch of BigQuery-formatted leads with a single spool commit.
+
+        Args:
+            leads: List of lead dictionaries as produced by day03_format_lead_for_bigquery
+        """
+        if not leads:
+            return
+
+        self._day03_check_process()
+        if self._thread is None:
+            self.day03_start()
+
+        with self._lock:
+            if self._spool is not None:
+                spooled_at = datetime.utcnow().isoformat()
+                owner = str(self._pid)
+                # Ids are allocated inside a write transaction, so concurrent
+                # processes sharing the spool cannot pick the same range
+                with self._day03_spool_transaction() as spool:
+                    next_id = spool.execute(
+                        "SELECT MAX(COALESCE((SELECT MAX(id) FROM spooled_leads), 0), "
+                        "COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'spooled_leads'), 0)) + 1"
+                    ).fetchone()[0]
+                    row_ids = list(range(next_id, next_id + len(leads)))
+                    spool.executemany(
+                        "INSERT INTO spooled_leads (id, payload, spooled_at, owner) VALUES (?, ?, ?, ?)",
+                        [
+                            (row_id, json.dumps(lead), spooled_at, owner)
+                            for row_id, lead in zip(row_ids, leads)
+                        ]
+                    )
+            else:
+                row_ids = [None] * len(leads)
+
+            now = time.monotonic()
+            self._pending.extend((row_id, lead, now) for row_id, lead in zip(row_ids, leads))
+            self.stats["accepted"] += len(leads)
+            pending_count = len(self._pending)
+
+        if pending_count >= self.max_size:
+            self._wake.set()
+
+    def _day03_store(self, entries: List[day03_PendingLead]) -> bool:
+        """Runs flush_fn on one batch; exceptions count as a failed write."""
+        try:
+            return bool(self.flush_fn([lead for _, lead, _ in entries]))
+        except Exception as e:
+            logger.error(f"Lead buffer flush raised: {str(e)}")
+            return False
+
+    def _day03_isolate(
+        self,
+        batch: List[day03_PendingLead]
+    ) -> Tuple[List[day03_PendingLead], List[day03_PendingLead]]:
+        """
+        Bisects a repeatedly failing batch to find the leads that cannot be stored.
+
+        Both halves of a failing part are tried before descending, depth first.
+        If a single lead fails before anything was stored, the target may be
+        down rather than the lead bad: probe_fn decides. When the probe fails
+        (or there is no probe) the search stops without blaming any lead.
+
+        Args:
+            batch: Batch that failed max_flush_attempts times
+
+        Returns:
+            Tuple of (entries stored during the search, entries that failed on their own)
+        """
+        stored: List[day03_PendingLead] = []
+        poisoned: List[day03_PendingLead] = []
+        failing = [batch]
+        target_up: Optional[bool] = None
+
+        while failing:
+            part = failing.pop()
+            if len(part) == 1:
+                if not stored:
+                    if target_up is None:
+                        target_up = self._day03_probe()
+                    if not target_up:
+                        break
+                poisoned.extend(part)
+                continue
+
+            middle = len(part) // 2
+            for half in (part[middle:], part[:middle]):
+                if self._day03_store(half):
+                    stored.extend(half)
+                    with self._lock:
+                        self.stats["flushed_batches"] += 1
+                else:
+                    failing.append(half)
+
+        return stored, poisoned
+
+    def _day03_probe(self) -> bool:
+        """Returns True if probe_fn reports the target reachable (False without a probe)."""
+        if self.probe_fn is None:
+            return False
+
+        try:
+            reachable = bool(self.probe_fn())
+        except Exception as e:
+            logger.error(f"Lead buffer probe raised: {str(e)}")
+            reachable = False
+
+        if not reachable:
+            with self._lock:
+                self.stats["failed_probes"] += 1
+        return reachable
+
+    def _day03_dead_letter(self, entries: List[day03_PendingLead], attempts: int) -> None:
+        """Moves leads that failed on their own out of the queue (caller holds _lock)."""
+        dead_lettered_at = datetime.utcnow().isoformat()
+        row_ids = [row_id for row_id, _, _ in entries if row_id is not None]
+
+        if row_ids and self._spool is not None:
+            with self._day03_spool_transaction() as spool:
+                spool.executemany(
+                    "INSERT OR REPLACE INTO dead_letter_leads "
+                    "(id, payload, spooled_at, dead_lettered_at, attempts) "
+                    "SELECT id, payload, spooled_at, ?, ? FROM spooled_leads WHERE id = ?",
+                    [(dead_lettered_at, attempts, row_id) for row_id in row_ids]
+                )
+                spool.executemany(
+                    "DELETE FROM spooled_leads WHERE id = ?", [(row_id,) for row_id in row_ids]
+                )
+        else:
+            self.dead_letters.extend(lead for _, lead, _ in entries)
+
+        self.stats["dead_lettered"] += len(entries)
+
+    def _day03_remove(self, entries: List[day03_PendingLead]) -> None:
+        """Drops stored entries from the queue and the spool (caller holds _lock)."""
+        done = {id(entry) for entry in entries}
+        self._pending = [entry for entry in self._pending if id(entry) not in done]
+
+        row_ids = [(row_id,) for row_id, _, _ in entries if row_id is not None]
+        if row_ids and self._spool is not None:
+            with self._day03_spool_transaction() as spool:
+                spool.executemany("DELETE FROM spooled_leads WHERE id = ?", row_ids)
+
+    def day03_flush(self) -> bool:
+        """
+        Flushes pending leads in batches of at most max_size.
+
+        A failed batch stays at the front of the queue and in the spool and is
+        retried on the next flush. Once the same batch has failed
+        max_flush_attempts times it is bisected: the leads that still fail on
+        their own are moved to the dead-letter table so they stop blocking the
+        rest of the queue.
+
+        Returns:
+            True if everything pending was stored (or dead-lettered), False otherwise
+        """
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    # Only flush drains the queue; adds append behind this batch
+                    batch = self._pending[:self.max_size]
+
+                if not batch:
+                    return True
+
+                if self._day03_store(batch):
+                    with self._lock:
+                        self._day03_remove(batch)
+                        self._head_failures = 0
+                        self.stats["flushed_leads"] += len(batch)
+                        self.stats["flushed_batches"] += 1
+                    logger.info(f"Flushed batch of {len(batch)} lead(s)")
+                    continue
+
+                with self._lock:
+                    self._head_failures += 1
+                    self.stats["failed_flushes"] += 1
+                    attempts = self._head_failures
+
+                if attempts < self.max_flush_attempts:
+                    logger.warning(
+                        f"Failed to flush {len(batch)} lead(s) "
+                        f"(attempt {attempts}/{self.max_flush_attempts}); will retry"
+                    )
+                    return False
+
+                stored, poisoned = self._day03_isolate(batch)
+                with self._lock:
+                    self._head_failures = 0
+                    if poisoned:
+                        self._day03_dead_letter(poisoned, attempts + 1)
+                    self._day03_remove(stored + poisoned)
+                    self.stats["flushed_leads"] += len(stored)
+
+                if not stored and not poisoned:
+                    logger.warning(
+                        f"Failed to flush {len(batch)} lead(s) after "
+                        f"{attempts} attempt(s), even in smaller batches; will retry"
+                    )
+                    return False
+
+                logger.error(
+                    f"Stored {len(stored)} lead(s) of a failing batch; "
+                    f"moved {len(poisoned)} lead(s) to the dead-letter table"
+                )
+
+    def day03_requeue_dead_letters(self) -> int:
+        """
+        Moves dead-lettered leads back into the queue (e.g. after a schema fix).
+
+        Returns:
+            Number of leads requeued
+        """
+        self._day03_check_process()
+        if self._thread is None:
+            self.day03_start()
+
+        with self._lock:
+            now = time.monotonic()
+            if self._spool is None:
+                leads = self.dead_letters
+                self.dead_letters = []
+                self._pending.extend((None, lead, now) for lead in leads)
+                return len(leads)
+
+            owner = str(self._pid)
+            with self._day03_spool_transaction() as spool:
+                rows = spool.execute(
+                    "SELECT id, payload FROM dead_letter_leads ORDER BY id"
+                ).fetchall()
+                spool.executemany(
+                    "INSERT INTO spooled_leads (id, payload, spooled_at, owner) "
+                    "SELECT id, payload, spooled_at, ? FROM dead_letter_leads WHERE id = ?",
+                    [(owner, row_id) for row_id, _ in rows]
+                )
+                spool.execute("DELETE FROM dead_letter_leads")
+
+            self._pending.extend((row_id, json.loads(payload), now) for row_id, payload in rows)
+
+        if rows:
+            logger.info(f"Requeued {len(rows)} dead-lettered lead(s)")
+            self._wake.set()
+        return len(rows)
+
+    def day03_get_stats(self) -> Dict:
+        """
+        Returns buffer counters and current queue depth.
+
+        Returns:
+            Dictionary with pending count and flush statistics
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats["pending"] = len(self._pending)
+            stats["oldest_pending_seconds"] = (
+                round(time.monotonic() - self._pending[0][2], 3)
+                if self._pending else 0.0
+            )
+        return stats
+
+    def _day03_seconds_until_due(self) -> float:
+        """Returns how long the worker can sleep before the next flush is due."""
+        with self._lock:
+            if len(self._pending) >= self.max_size:
+                return 0.0
+            if not self._pending:
+                return self.max_age_seconds
+            elapsed = time.monotonic() - self._pending[0][2]
+            return max(0.0, self.max_age_seconds - elapsed)
+
+    def _day03_run(self) -> None:
+        """Background loop: flushes when the batch is full or its oldest lead is due."""
+        while not self._stop.is_set():
+            self._wake.wait(timeout=self._day03_seconds_until_due())
+            self._wake.clear()
+
+            if self._stop.is_set():
+                break
+
+            if self._day03_seconds_until_due() == 0.0:
+                if not self.day03_flush():
+                    # Back off for one age window before retrying a failed batch
+                    self._stop.wait(timeout=self.max_age_seconds)
@@ -6,7 +6,7 @@ Handles BigQuery table creation and data insertion for GDPR leads.
 import logging
 from typing import List, Dict
 from google.cloud import bigquery
-from google.cloud.exceptions import NotFound
+from google.cloud.exceptions import BadRequest, NotFound
 
 from day03_CONFIG_settings import (
     DAY03_GCP_PROJECT_ID,
@@ -20,6 +20,9 @@ from day03_CONFIG_settings import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Metadata round-trips avoided per cache hit (get_dataset + get_table x2)
+DAY03_METADATA_CALLS_PER_CHECK = 3
+
 
 class day03_BigQueryLoader:
     """Handles BigQuery operations for GDPR leads."""
@@ -31,6 +34,47 @@ class day03_BigQueryLoader:
         self.table_id = f"{self.dataset_id}.{DAY03_BQ_TABLE}"
         self.location = DAY03_BQ_LOCATION
 
+        # Metadata cache: dataset/table existence is checked once and the
+        # table schema is kept in memory until a schema mismatch forces a refresh
+        self._schema = day03_build_schema()
+        self._metadata_ready = False
+        self.metadata_stats = {"hits": 0, "misses": 0, "refreshes": 0}
+
+    def day03_ensure_metadata(self, force_refresh: bool = False) -> None:
+        """
+        Ensures dataset and table exist, using the cached result when possible.
+
+        Args:
+            force_refresh: Re-check BigQuery even if metadata is already cached
+        """
+        if force_refresh:
+            self.day03_invalidate_metadata()
+
+        if self._metadata_ready:
+            self.metadata_stats["hits"] += 1
+            return
+
+        self.metadata_stats["misses"] += 1
+        self.day03_ensure_dataset_exists()
+        self.day03_ensure_table_exists()
+        self._metadata_ready = True
+
+    def day03_invalidate_metadata(self) -> None:
+        """Drops cached metadata so the next insert re-checks BigQuery."""
+        self._metadata_ready = False
+        self.metadata_stats["refreshes"] += 1
+
+    def day03_get_metadata_stats(self) -> Dict:
+        """
+        Returns metadata cache counters.
+
+        Returns:
+            Dictionary with hits, misses, refreshes and round-trips saved
+        """
+        stats = dict(self.metadata_stats)
+        stats["round_trips_saved"] = stats["hits"] * DAY03_METADATA_CALLS_PER_CHECK
+        return stats
+
     def day03_ensure_dataset_exists(self) -> None:
         """Creates dataset if it doesn't exist."""
         try:
@@ -46,23 +90,16 @@ class day03_BigQueryLoader:
     def day03_ensure_table_exists(self) -> None:
         """Creates table with GDPR schema if it doesn't exist."""
         try:
-            self.client.get_table(self.table_id)
+            table = self.client.get_table(self.table_id)
+            self._schema = list(table.schema)
             logger.info(f"Table {self.table_id} already exists")
         except NotFound:
             logger.info(f"Creating table {self.table_id}")
 
-            # Convert schema list to BigQuery SchemaField objects
-            schema = [
-                bigquery.SchemaField(
-                    field["name"],
-                    field["type"],
-                    mode=field.get("mode", "NULLABLE")
-                )
-                for field in DAY03_BQ_SCHEMA
-            ]
-
+            schema = day03_build_schema()
             table = bigquery.Table(self.table_id, schema=schema)
             table = self.client.create_table(table)
+            self._schema = schema
             logger.info(f"Table {self.table_id} created successfully")
 
     def day03_insert_lead(self, lead: Dict) -> bool:
@@ -88,33 +125,56 @@ class day03_BigQueryLoader:
             True if successful, False otherwise
         """
         try:
-            # Ensure dataset and table exist
-            self.day03_ensure_dataset_exists()
-            self.day03_ensure_table_exists()
+            # Ensure dataset and table exist (cached after the first check)
+            self.day03_ensure_metadata()
+
+            try:
+                self._day03_run_load_job(leads)
+            except (BadRequest, NotFound) as e:
+                if not day03_is_metadata_error(e):
+                    raise
+                # Table was dropped or its schema changed: refresh once and retry
+                logger.warning(f"Cached table metadata is stale ({str(e)}); refreshing")
+                self.day03_invalidate_metadata()
+                self.day03_ensure_metadata()
+                self._day03_run_load_job(leads)
 
-            # Get table reference
-            table_ref = self.client.get_table(self.table_id)
+            logger.info(f"Successfully inserted {len(leads)} lead(s) into {self.table_id}")
+            return True
 
-            # Use load_table_from_json (free tier compatible)
-            job_config = bigquery.LoadJobConfig(
-                schema=table_ref.schema,
-                write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
-            )
+        except Exception as e:
+            logger.error(f"Failed to insert leads into BigQuery: {str(e)}")
+            return False
 
-            load_job = self.client.load_table_from_json(
-                leads,
-                table_ref,
-                job_config=job_config
-            )
+    def _day03_run_load_job(self, leads: List[Dict]) -> None:
+        """Submits a load job with the cached schema and waits for it."""
+        # Use load_table_from_json (free tier compatible)
+        job_config = bigquery.LoadJobConfig(
+            schema=self._schema,
+            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+        )
 
-            # Wait for the job to complete
-            load_job.result()
+        load_job = self.client.load_table_from_json(
+            leads,
+            self.table_id,
+            job_config=job_config
+        )
 
-            logger.info(f"Successfully inserted {len(leads)} lead(s) into {self.table_id}")
-            return True
+        # Wait for the job to complete
+        load_job.result()
 
+    def day03_ping(self) -> bool:
+        """
+        Cheap reachability check (one table metadata read, no load job).
+
+        Returns:
+            True if the table can be read, False otherwise
+        """
+        try:
+            self.client.get_table(self.table_id)
+            return True
         except Exception as e:
-            logger.error(f"Failed to insert leads into BigQuery: {str(e)}")
+            logger.warning(f"BigQuery ping failed: {str(e)}")
             return False
 
     def day03_query_leads(self, limit: int = 10) -> List[Dict]:
@@ -177,6 +237,40 @@ class day03_BigQueryLoader:
             return 0
 
 
+def day03_build_schema() -> List[bigquery.SchemaField]:
+    """
+    Converts DAY03_BQ_SCHEMA into BigQuery SchemaField objects.
+
+    Returns:
+        List of SchemaField objects
+    """
+    return [
+        bigquery.SchemaField(
+            field["name"],
+            field["type"],
+            mode=field.get("mode", "NULLABLE")
+        )
+        for field in DAY03_BQ_SCHEMA
+    ]
+
+
+def day03_is_metadata_error(error: Exception) -> bool:
+    """
+    Checks whether a load error means the cached dataset/table metadata is stale.
+
+    Args:
+        error: Exception raised by a load job
+
+    Returns:
+        True if the table is missing or its schema no longer matches
+    """
+    if isinstance(error, NotFound):
+        return True
+
+    message = str(error).lower()
+    return any(marker in message for marker in ("schema", "no such field"))
+
+
 def day03_load_lead_to_bigquery(lead: Dict) -> bool:
     """
     Convenience function to load a single lead to BigQuery.
@@ -198,8 +292,7 @@ if __name__ == "__main__":
     loader = day03_BigQueryLoader()
 
     try:
-        loader.day03_ensure_dataset_exists()
-        loader.day03_ensure_table_exists()
+        loader.day03_ensure_metadata()
 
         count = loader.day03_count_leads()
         logger.info(f"Current number of leads in table: {count}")
@@ -3,17 +3,40 @@ Day 03 - GDPR Lead Validation Pipeline
 Validates lead data and calculates retention dates based on GDPR requirements.
 """
 
+import math
+import os
 import uuid
-from datetime import datetime, timedelta
-from typing import Dict, Tuple, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Tuple, Optional
 import re
 
+import numpy as np
+import pandas as pd
+
 from day03_CONFIG_settings import (
     DAY03_REQUIRED_FIELDS,
     DAY03_VALID_CONSENT_PURPOSES,
-    DAY03_GDPR_RETENTION_DAYS
+    DAY03_GDPR_RETENTION_DAYS,
+    DAY03_CONSENTED_RETENTION_DAYS
 )
 
+# Compiled once and shared by the single-lead and batch validators
+DAY03_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+DAY03_TIMESTAMP_ERROR = "Invalid timestamp format. Use ISO 8601 format (e.g., 2024-11-26T10:30:00Z)"
+
+DAY03_CONSENT_GIVEN_ERROR = "Invalid consent_given. Use true/false (or 1/0, \"yes\"/\"no\")"
+
+# Explicit boolean conversion shared by both validation paths ("false" must not become True)
+DAY03_CONSENT_GIVEN_VALUES = {
+    "true": True, "1": True, "yes": True,
+    "false": False, "0": False, "no": False
+}
+
+# Consent timestamps are stored in UTC (naive values are taken as UTC) and the
+# retention date is the UTC calendar date, in both the single and batch paths
+DAY03_UTC_SUFFIX = "+00:00"
+
 
 class day03_GDPRValidator:
     """Validates lead data for GDPR compliance."""
@@ -33,8 +56,10 @@ class day03_GDPRValidator:
         Returns:
             Tuple of (is_valid, error_message, processed_lead)
         """
-        # Check required fields
-        missing_fields = [field for field in self.required_fields if field not in payload]
+        # Check required fields (null values count as missing)
+        missing_fields = [
+            field for field in self.required_fields if day03_is_missing(payload.get(field))
+        ]
         if missing_fields:
             return False, f"Missing required fields: {', '.join(missing_fields)}", None
 
@@ -51,31 +76,40 @@ class day03_GDPRValidator:
         try:
             consent_timestamp = datetime.fromisoformat(payload["timestamp"].replace("Z", "+00:00"))
         except (ValueError, AttributeError):
-            return False, "Invalid timestamp format. Use ISO 8601 format (e.g., 2024-11-26T10:30:00Z)", None
+            return False, DAY03_TIMESTAMP_ERROR, None
+
+        # Normalize to UTC so retention dates match validate_leads_batch
+        if consent_timestamp.tzinfo is None:
+            consent_timestamp = consent_timestamp.replace(tzinfo=timezone.utc)
+        consent_timestamp = consent_timestamp.astimezone(timezone.utc)
+
+        # Validate consent flag
+        consent_given = day03_parse_consent_given(payload["consent_given"])
+        if consent_given is None:
+            return False, DAY03_CONSENT_GIVEN_ERROR, None
 
         # Process the lead
-        processed_lead = self._process_lead(payload, consent_timestamp)
+        processed_lead = self._process_lead(payload, consent_timestamp, consent_given)
 
         return True, None, processed_lead
 
     def _is_valid_email(self, email: str) -> bool:
-        """Validates email format using regex."""
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(email_pattern, email))
+        """Validates email format using regex (non-string values are invalid)."""
+        return isinstance(email, str) and bool(DAY03_EMAIL_PATTERN.match(email))
 
-    def _process_lead(self, payload: Dict, consent_timestamp: datetime) -> Dict:
+    def _process_lead(self, payload: Dict, consent_timestamp: datetime, consent_given: bool) -> Dict:
         """
         Processes a valid lead and adds metadata.
 
         Args:
             payload: Original payload
             consent_timestamp: Parsed timestamp
+            consent_given: Parsed consent flag
 
         Returns:
             Processed lead with metadata
         """
         lead_id = str(uuid.uuid4())
-        consent_given = payload.get("consent_given", False)
 
         # Calculate retention date
         retention_date = day03_calculate_retention_date(
@@ -88,9 +122,9 @@ class day03_GDPRValidator:
             "lead_id": lead_id,
             "name": payload["name"],
             "email": payload["email"],
-            "consent_timestamp": consent_timestamp.isoformat(),
+            "consent_timestamp": consent_timestamp.isoformat(timespec="microseconds"),
             "consent_purpose": payload["consent_purpose"],
-            "ip_address": payload.get("ip_address", "unknown"),
+            "ip_address": "unknown" if day03_is_missing(payload.get("ip_address")) else payload["ip_address"],
             "data_retention_date": retention_date.isoformat(),
             "consent_given": consent_given,
             "created_at": datetime.utcnow().isoformat()
@@ -98,6 +132,159 @@ class day03_GDPRValidator:
 
         return processed_lead
 
+    def validate_leads_batch(self, payloads: List) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Validates a batch of lead payloads as one columnar frame.
+
+        Applies the same rules, in the same order, as validate_lead, but with
+        vectorized email matching, timestamp parsing and retention dates.
+
+        Args:
+            payloads: List of lead dictionaries (non-dict entries are rejected)
+
+        Returns:
+            Tuple of (bigquery_leads, report) where bigquery_leads are the accepted
+            leads already formatted for BigQuery and report has one entry per input row
+        """
+        total = len(payloads)
+        is_object = np.fromiter((isinstance(p, dict) for p in payloads), dtype=bool, count=total)
+        object_rows = np.flatnonzero(is_object)
+        objects = [payloads[i] for i in object_rows]
+
+        # One object column per field; keeps raw values untouched by dtype inference
+        columns = list(dict.fromkeys(self.required_fields + ["ip_address"]))
+        df = pd.DataFrame(
+            {field: np.array([p.get(field) for p in objects], dtype=object) for field in columns},
+            dtype=object
+        )
+
+        # Required fields (null values count as missing)
+        null_matrix = df[self.required_fields].isna().to_numpy()
+        has_missing = null_matrix.any(axis=1)
+        missing_message = np.full(len(df), "", dtype=object)
+        missing_message[has_missing] = [
+            "Missing required fields: " + ", ".join(np.array(self.required_fields)[row])
+            for row in null_matrix[has_missing]
+        ]
+
+        # Email format (non-string values do not match)
+        emails = df["email"].where(df["email"].map(type).eq(str))
+        valid_email = emails.str.fullmatch(DAY03_EMAIL_PATTERN).fillna(False).to_numpy(dtype=bool)
+
+        # Consent purpose
+        valid_purpose = df["consent_purpose"].isin(self.valid_purposes).to_numpy(dtype=bool)
+
+        # Timestamp format (ISO 8601, "Z" suffix accepted, naive values taken as UTC)
+        timestamps = df["timestamp"].where(df["timestamp"].map(type).eq(str))
+        consent_timestamps = pd.to_datetime(timestamps, errors="coerce", utc=True, format="ISO8601")
+        valid_timestamp = consent_timestamps.notna().to_numpy(dtype=bool)
+
+        # Consent flag (same explicit conversion as validate_lead)
+        consent_flags = df["consent_given"].map(day03_parse_consent_given)
+        valid_consent = consent_flags.notna().to_numpy(dtype=bool)
+
+        # First failing rule wins, mirroring validate_lead
+        errors = np.select(
+            [has_missing, ~valid_email, ~valid_purpose, ~valid_timestamp, ~valid_consent],
+            [
+                missing_message,
+                "Invalid email format",
+                f"Invalid consent purpose. Must be one of: {', '.join(self.valid_purposes)}",
+                DAY03_TIMESTAMP_ERROR,
+                DAY03_CONSENT_GIVEN_ERROR
+            ],
+            default=""
+        )
+        accepted = errors == ""
+
+        # Build accepted leads, already formatted for BigQuery
+        ok = df[accepted]
+        consent_given = consent_flags[accepted].to_numpy(dtype=bool)
+        consent_utc = consent_timestamps[accepted].dt.tz_localize(None).to_numpy().astype("datetime64[us]")
+        retention_dates = day03_calculate_retention_dates(consent_utc, consent_given, self.retention_days)
+        lead_ids = day03_generate_lead_ids(len(ok))
+        created_at = datetime.utcnow().isoformat()
+
+        output_columns = {
+            "lead_id": lead_ids.tolist(),
+            "name": ok["name"].tolist(),
+            "email": ok["email"].tolist(),
+            "consent_timestamp": np.char.add(
+                np.datetime_as_string(consent_utc, unit="us"), DAY03_UTC_SUFFIX
+            ).tolist(),
+            "consent_purpose": ok["consent_purpose"].tolist(),
+            "ip_address": ok["ip_address"].where(ok["ip_address"].notna(), "unknown").tolist(),
+            "data_retention_date": np.datetime_as_string(retention_dates.astype("datetime64[D]")).tolist(),
+            "consent_given": consent_given.tolist(),
+            "created_at": [created_at] * len(ok)
+        }
+        keys = list(output_columns)
+        bigquery_leads = [dict(zip(keys, row)) for row in zip(*output_columns.values())]
+
+        # Per-row report in input order
+        status = np.full(total, "rejected", dtype=object)
+        error_column = np.full(total, "Lead must be a JSON object", dtype=object)
+        lead_id_column = np.full(total, None, dtype=object)
+
+        status[object_rows[accepted]] = "accepted"
+        error_column[object_rows] = np.where(accepted, None, errors)
+        lead_id_column[object_rows[accepted]] = lead_ids
+
+        report = [
+            {"index": index, "status": row_status, "lead_id": lead_id, "error": error}
+            for index, row_status, lead_id, error in zip(
+                range(total), status.tolist(), lead_id_column.tolist(), error_column.tolist()
+            )
+        ]
+
+        return bigquery_leads, report
+
+
+def day03_is_missing(value) -> bool:
+    """Returns True for values treated as an absent field (None or NaN)."""
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def day03_parse_consent_given(value) -> Optional[bool]:
+    """
+    Converts a consent_given payload value to a boolean.
+
+    Accepts JSON booleans, 1/0 and the strings in DAY03_CONSENT_GIVEN_VALUES
+    (case-insensitive). Anything else is invalid.
+
+    Args:
+        value: Raw consent_given value
+
+    Returns:
+        True or False, or None if the value is not a recognised boolean
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        return DAY03_CONSENT_GIVEN_VALUES.get(value.strip().lower())
+    return None
+
+
+def day03_generate_lead_ids(count: int) -> np.ndarray:
+    """
+    Generates random UUID4 strings in one pass instead of one uuid4() call per lead.
+
+    Args:
+        count: Number of IDs to generate
+
+    Returns:
+        Array of UUID4 strings
+    """
+    raw = np.frombuffer(os.urandom(16 * count), dtype=np.uint8).reshape(count, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+
+    hex_chars = np.frombuffer(raw.tobytes().hex().encode("ascii"), dtype="S1").reshape(count, 32)
+    dashed = np.insert(hex_chars, [8, 12, 16, 20], b"-", axis=1)
+    return np.ascontiguousarray(dashed).view("S36").ravel().astype(str)
+
 
 def day03_calculate_retention_date(
     consent_timestamp: datetime,
@@ -120,12 +307,32 @@ def day03_calculate_retention_date(
     """
     if consent_given:
         # With consent, keep data for 1 year
-        return consent_timestamp + timedelta(days=365)
+        return consent_timestamp + timedelta(days=DAY03_CONSENTED_RETENTION_DAYS)
     else:
         # Without consent, keep data for retention_days only
         return consent_timestamp + timedelta(days=retention_days)
 
 
+def day03_calculate_retention_dates(
+    consent_timestamps: np.ndarray,
+    consent_given: np.ndarray,
+    retention_days: int = DAY03_GDPR_RETENTION_DAYS
+) -> np.ndarray:
+    """
+    Vectorized version of day03_calculate_retention_date for a batch of leads.
+
+    Args:
+        consent_timestamps: datetime64 array of consent timestamps
+        consent_given: Boolean array aligned with consent_timestamps
+        retention_days: Number of days for non-consented data (default: 30)
+
+    Returns:
+        datetime64 array of retention dates
+    """
+    days = np.where(consent_given, DAY03_CONSENTED_RETENTION_DAYS, retention_days)
+    return consent_timestamps + days.astype("timedelta64[D]")
+
+
 def day03_format_lead_for_bigquery(lead: Dict) -> Dict:
     """
     Formats a processed lead for BigQuery insertion.
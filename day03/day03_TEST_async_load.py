@@ -0,0 +1,136 @@
+"""
+Day 03 - Local load test for the ASGI webhook server
+Runs the async app with a stubbed BigQuery loader and reports p50/p99 latency.
+No GCP credentials are required.
+
+Usage:
+    python day03_TEST_async_load.py --requests 5000 --concurrency 100
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import threading
+import time
+from collections import Counter
+from typing import Dict, List
+
+import httpx
+import uvicorn
+
+from day03_APP_webhook_server_async import day03_create_app, day03_AsyncWriteQueue
+from day03_DATA_ingest_buffer import day03_LeadBuffer
+
+
+class day03_StubLoader:
+    """Stands in for day03_BigQueryLoader; sleeps to simulate a load job."""
+
+    def __init__(self, job_latency: float):
+        self.job_latency = job_latency
+        self.leads_written = 0
+        self.jobs = 0
+
+    def day03_insert_leads(self, leads: List[Dict]) -> bool:
+        time.sleep(self.job_latency)
+        self.leads_written += len(leads)
+        self.jobs += 1
+        return True
+
+
+def day03_percentile(values: List[float], percentile: float) -> float:
+    """Returns the given percentile (0-100) of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(percentile / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def day03_run_load(url: str, payload: Dict, total: int, concurrency: int) -> Dict:
+    """Sends `total` POST /leads requests with at most `concurrency` in flight."""
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+
+        async def send_one():
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.post(f"{url}/leads", json=payload)
+                latencies.append((time.perf_counter() - start) * 1000)
+                statuses[response.status_code] += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(send_one() for _ in range(total)))
+        elapsed = time.perf_counter() - start
+
+    return {"latencies": latencies, "statuses": statuses, "elapsed": elapsed}
+
+
+def day03_test_async_load():
+    """Starts the app on a local port and reports latency percentiles."""
+    parser = argparse.ArgumentParser(description="Day 03 ASGI webhook load test")
+    parser.add_argument("--requests", type=int, default=2000, help="Total requests to send")
+    parser.add_argument("--concurrency", type=int, default=50, help="Requests in flight")
+    parser.add_argument("--job-latency", type=float, default=0.5, help="Stub load job latency (s)")
+    parser.add_argument("--queue-size", type=int, default=1000, help="Write queue limit (429 above)")
+    parser.add_argument("--write-concurrency", type=int, default=4, help="Concurrent stub load jobs")
+    parser.add_argument("--port", type=int, default=5055, help="Local port for the test server")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Day 03 - ASGI Webhook Load Test (stubbed loader)")
+    print("=" * 60)
+
+    loader = day03_StubLoader(job_latency=args.job_latency)
+    write_queue = day03_AsyncWriteQueue(
+        max_size=args.queue_size,
+        concurrency=args.write_concurrency
+    )
+    # No spool: the stub must not replay (and delete) leads spooled by a real server
+    fallback_buffer = day03_LeadBuffer(flush_fn=loader.day03_insert_leads, spool_path=None)
+    app = day03_create_app(loader=loader, write_queue=write_queue, fallback_buffer=fallback_buffer)
+
+    # Per-request 429 warnings would drown the report
+    logging.getLogger("day03_APP_webhook_server_async").setLevel(logging.ERROR)
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=args.port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+
+    with open("data/sample_payloads/lead_with_consent.json", "r") as f:
+        payload = json.load(f)
+
+    result = asyncio.run(day03_run_load(
+        f"http://127.0.0.1:{args.port}",
+        payload,
+        args.requests,
+        args.concurrency
+    ))
+
+    server.should_exit = True
+    thread.join()
+
+    latencies = result["latencies"]
+    print(f"\nRequests:     {args.requests} (concurrency {args.concurrency})")
+    print(f"Elapsed:      {result['elapsed']:.2f}s ({args.requests / result['elapsed']:.0f} req/s)")
+    print(f"Status codes: {dict(result['statuses'])}")
+    print(f"Latency p50:  {day03_percentile(latencies, 50):.1f} ms")
+    print(f"Latency p99:  {day03_percentile(latencies, 99):.1f} ms")
+    print(f"Latency mean: {statistics.mean(latencies):.1f} ms")
+    print(f"\nStub load jobs: {loader.jobs} ({loader.leads_written} leads written)")
+    print(f"Write queue:    {write_queue.day03_get_stats()}")
+
+    print("\n" + "=" * 60)
+    print("Test Complete!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    day03_test_async_load()
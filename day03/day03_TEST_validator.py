@@ -4,7 +4,11 @@ Tests the validator without requiring BigQuery or Flask server
 """
 
 import json
-from day03_PIPELINE_gdpr_validator import day03_GDPRValidator, day03_calculate_retention_date
+from day03_PIPELINE_gdpr_validator import (
+    day03_GDPRValidator,
+    day03_calculate_retention_date,
+    day03_format_lead_for_bigquery
+)
 from datetime import datetime
 
 def day03_test_validation():
@@ -99,6 +103,85 @@ def day03_test_validation():
     else:
         print(f"❌ FAILED - Expected {expected_without.date()}, got {retention_without.date()}")
 
+    # Test 7: Batch validation matches single-lead rules
+    print("\n[Test 7] Batch validation (columnar):")
+    batch = [payload1, payload2, payload3, payload4, payload5, "not-an-object"]
+    bq_leads, report = validator.validate_leads_batch(batch)
+    statuses = [row["status"] for row in report]
+    expected_statuses = ["accepted", "accepted", "rejected", "rejected", "rejected", "rejected"]
+
+    if statuses == expected_statuses and len(bq_leads) == 2:
+        print(f"✅ PASSED - {len(bq_leads)} accepted, {len(report) - len(bq_leads)} rejected")
+        print(f"   Retention Dates: {[lead['data_retention_date'] for lead in bq_leads]}")
+    else:
+        print(f"❌ FAILED - Unexpected statuses: {statuses}")
+
+    # Test 8: Single and batch paths agree on offset timestamps
+    print("\n[Test 8] Offset timestamp, single vs batch:")
+    payload8 = payload1.copy()
+    payload8["timestamp"] = "2024-11-26T23:30:00-05:00"
+
+    _, _, processed = validator.validate_lead(payload8)
+    single_lead = day03_format_lead_for_bigquery(processed)
+    bq_leads, _ = validator.validate_leads_batch([payload8])
+    fields = ["consent_timestamp", "data_retention_date"]
+    single_values = {field: single_lead[field] for field in fields}
+    batch_values = {field: bq_leads[0][field] for field in fields}
+
+    if single_values == batch_values:
+        print(f"✅ PASSED - Both paths: {single_values}")
+    else:
+        print(f"❌ FAILED - Single {single_values} != batch {batch_values}")
+
+    # Test 9: Non-string email is a per-row rejection, not an exception
+    print("\n[Test 9] Bulk batch with non-string email:")
+    payload9 = payload1.copy()
+    payload9["email"] = 123
+
+    try:
+        bq_leads, report = validator.validate_leads_batch([payload9])
+        is_valid, error, _ = validator.validate_lead(payload9)
+        if not bq_leads and report[0]["error"] == "Invalid email format" and error == report[0]["error"]:
+            print(f"✅ PASSED - Correctly rejected on both paths: {error}")
+        else:
+            print(f"❌ FAILED - Unexpected report: {report}, single: {error}")
+    except Exception as e:
+        print(f"❌ FAILED - Raised {type(e).__name__}: {e}")
+
+    # Test 10: Both paths agree on tricky payloads
+    print("\n[Test 10] Tricky payloads, single vs batch:")
+    tricky = [
+        dict(payload1, consent_given="false"),
+        dict(payload1, consent_given="TRUE"),
+        dict(payload1, consent_given=0),
+        dict(payload1, consent_given="maybe"),
+        dict(payload1, consent_given=None),
+        dict(payload1, name=None),
+        dict(payload1, ip_address=None),
+    ]
+    fields = ["consent_given", "data_retention_date", "ip_address"]
+    bq_leads, report = validator.validate_leads_batch(tricky)
+    batch_leads = iter(bq_leads)
+    mismatches = []
+
+    for payload, row in zip(tricky, report):
+        is_valid, error, processed = validator.validate_lead(payload)
+        single = {"accepted": is_valid, "error": error}
+        batch = {"accepted": row["status"] == "accepted", "error": row["error"]}
+        if is_valid:
+            single_lead = day03_format_lead_for_bigquery(processed)
+            batch_lead = next(batch_leads)
+            single.update({field: single_lead[field] for field in fields})
+            batch.update({field: batch_lead[field] for field in fields})
+        if single != batch:
+            mismatches.append((single, batch))
+
+    consent_false = validator.validate_lead(tricky[0])[2]
+    if not mismatches and consent_false["consent_given"] is False:
+        print(f"✅ PASSED - {len(tricky)} payloads identical on both paths (\"false\" -> False)")
+    else:
+        print(f"❌ FAILED - Mismatches: {mismatches}")
+
     print("\n" + "=" * 60)
     print("Test Complete!")
     print("=" * 60)
@@ -44,6 +44,11 @@ day04_BQ_LOCATION = os.getenv('DAY04_BQ_LOCATION', 'US')
 # Full table reference
 day04_BQ_TABLE_FULL = f"{day04_GCP_PROJECT_ID}.{day04_BQ_DATASET}.{day04_BQ_TABLE}"
 
+# Loads are MERGEd from a staging table on (epoch, timestamp)
+day04_BQ_STAGING_TABLE_FULL = f"{day04_BQ_TABLE_FULL}_staging"
+day04_BQ_STAGING_EXPIRATION_HOURS = 6  # Staging tables left behind by failed runs expire
+day04_BQ_CLUSTER_FIELDS = ['epoch']  # Table is partitioned by DATE(timestamp)
+
 # ============================================================================
 # CARDANO NETWORK CONSTANTS
 # ============================================================================
@@ -73,7 +78,36 @@ day04_CSV_OUTPUT_PATH = os.path.join(
 
 day04_API_TIMEOUT = 30  # seconds
 day04_API_RETRY_ATTEMPTS = 3
-day04_API_RETRY_DELAY = 2  # seconds
+day04_API_RETRY_DELAY = 2  # seconds (base of the exponential backoff)
+
+# Blockfrost free tier: 10 requests/second with a burst of 500
+day04_API_RATE_LIMIT_PER_SECOND = 10
+day04_API_RATE_LIMIT_BURST = 500
+
+# On-disk cache of Blockfrost responses (protects the 50K requests/day free tier
+# when extraction is triggered often). Completed epochs (epochs/{n}) never change
+# and are cached for good; the running epoch is never cached past its end_time.
+day04_HTTP_CACHE_DIR = os.path.join(day04_RAW_DATA_DIR, 'http_cache')
+day04_HTTP_CACHE_SECONDS = float(os.getenv('DAY04_HTTP_CACHE_SECONDS', '300'))  # 0 disables
+day04_HTTP_CACHE_TTL_SECONDS = {
+    'network': day04_HTTP_CACHE_SECONDS,
+    'epochs/latest': day04_HTTP_CACHE_SECONDS,
+}
+
+# Stake pool crawler (/pools pagination)
+day04_POOLS_PAGE_SIZE = 100  # Blockfrost maximum per page
+day04_POOLS_MAX_WORKERS = 8  # Pages fetched concurrently (the rate limit above still applies)
+day04_POOLS_CACHE_PATH = os.path.join(day04_RAW_DATA_DIR, 'stake_pools_cache.json')
+
+# Epoch history backfill (epochs/{n}, optionally epochs/{n}/stakes)
+day04_BACKFILL_DEFAULT_EPOCHS = 73  # ~1 year of 5-day epochs when --from-epoch is omitted
+day04_BACKFILL_MAX_WORKERS = 8  # Epochs fetched concurrently (the rate limit above still applies)
+day04_STAKES_PAGE_SIZE = 100  # Blockfrost maximum per page
+day04_BACKFILL_CHECKPOINT_PATH = os.path.join(day04_RAW_DATA_DIR, 'epoch_backfill_checkpoint.jsonl')
+day04_EPOCH_HISTORY_CSV_PATH = os.path.join(
+    day04_PROCESSED_DATA_DIR,
+    'cardano_epoch_history.csv'
+)
 
 # ============================================================================
 # VALIDATION
@@ -8,7 +8,12 @@ by pulling publicly available on-chain metrics that anyone can verify.
 
 import requests
 import pandas as pd
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+import argparse
+import json
+import math
 import time
 import sys
 import os
@@ -16,6 +21,11 @@ import os
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Add common modules to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'common'))
+
+from utils.http_client import RetryingHTTPClient
+
 from day04_CONFIG_settings import (
     day04_BLOCKFROST_API_KEY,
     day04_BLOCKFROST_API_URL,
@@ -25,9 +35,27 @@ from day04_CONFIG_settings import (
     day04_API_TIMEOUT,
     day04_API_RETRY_ATTEMPTS,
     day04_API_RETRY_DELAY,
+    day04_API_RATE_LIMIT_PER_SECOND,
+    day04_API_RATE_LIMIT_BURST,
+    day04_HTTP_CACHE_DIR,
+    day04_HTTP_CACHE_TTL_SECONDS,
+    day04_POOLS_PAGE_SIZE,
+    day04_POOLS_MAX_WORKERS,
+    day04_POOLS_CACHE_PATH,
+    day04_BACKFILL_DEFAULT_EPOCHS,
+    day04_BACKFILL_MAX_WORKERS,
+    day04_STAKES_PAGE_SIZE,
+    day04_BACKFILL_CHECKPOINT_PATH,
+    day04_EPOCH_HISTORY_CSV_PATH,
     day04_validate_config
 )
 
+# Column order of the BigQuery table (CSV loads map columns by position)
+day04_METRIC_COLUMNS = [
+    'timestamp', 'total_transactions', 'active_addresses', 'block_count',
+    'epoch', 'stake_pools_active', 'total_ada_staked', 'avg_transaction_fee'
+]
+
 
 class day04_CardanoMetricsExtractor:
     """
@@ -45,13 +73,34 @@ class day04_CardanoMetricsExtractor:
         self.base_url = day04_BLOCKFROST_API_URL
         self.headers = {"project_id": self.api_key}
 
-    def day04_fetch_with_retry(self, endpoint, params=None):
+        # Pooled connections, retries with backoff, Blockfrost's rate limit and
+        # a response cache (only requests passing cache_ttl are cached)
+        self.http = RetryingHTTPClient(
+            max_attempts=day04_API_RETRY_ATTEMPTS,
+            backoff_seconds=day04_API_RETRY_DELAY,
+            timeout=day04_API_TIMEOUT,
+            rate_limits={urlsplit(self.base_url).hostname: day04_API_RATE_LIMIT_PER_SECOND},
+            burst=day04_API_RATE_LIMIT_BURST,
+            pool_maxsize=max(day04_POOLS_MAX_WORKERS, day04_BACKFILL_MAX_WORKERS),
+            headers=self.headers,
+            cache_dir=day04_HTTP_CACHE_DIR
+        )
+
+    def day04_fetch_with_retry(self, endpoint, params=None, cache_ttl=None):
         """
         Fetch data from Blockfrost API with retry logic.
 
+        Timeouts, connection errors, 429 and 5xx responses are retried with
+        exponential backoff (honoring Retry-After) by the shared HTTP client.
+        With cache_ttl, the response is cached on disk (keyed by endpoint and
+        params) and expired entries are revalidated with If-None-Match /
+        If-Modified-Since when Blockfrost sent an ETag / Last-Modified.
+
         Args:
             endpoint (str): API endpoint path
             params (dict): Query parameters
+            cache_ttl (float or callable): Cache lifetime in seconds, or a
+                function of the response returning it (None: not cached)
 
         Returns:
             dict: JSON response from API
@@ -61,24 +110,50 @@ class day04_CardanoMetricsExtractor:
         """
         url = f"{self.base_url}/{endpoint}"
 
-        for attempt in range(day04_API_RETRY_ATTEMPTS):
-            try:
-                response = requests.get(
-                    url,
-                    headers=self.headers,
-                    params=params,
-                    timeout=day04_API_TIMEOUT
-                )
-                response.raise_for_status()
-                return response.json()
-
-            except requests.exceptions.RequestException as e:
-                if attempt < day04_API_RETRY_ATTEMPTS - 1:
-                    print(f"⚠️  Attempt {attempt + 1} failed, retrying in {day04_API_RETRY_DELAY}s...")
-                    time.sleep(day04_API_RETRY_DELAY)
-                else:
-                    print(f"❌ All retry attempts failed for {endpoint}")
-                    raise
+        try:
+            response = self.http.get(url, params=params, cache_ttl=cache_ttl)
+            response.raise_for_status()
+            return response.json()
+
+        except requests.exceptions.RequestException:
+            print(f"❌ Request failed for {endpoint}")
+            raise
+
+    @staticmethod
+    def day04_latest_epoch_cache_ttl(response):
+        """
+        Cache lifetime of an epochs/latest response.
+
+        Counts of the running epoch grow with every block, so the response is
+        cached for the epochs/latest TTL, but never past the epoch's end_time:
+        the next epoch is fetched as soon as it starts.
+
+        Args:
+            response (requests.Response): epochs/latest response
+
+        Returns:
+            float: Seconds to cache (0 without an end_time)
+        """
+        end_time = response.json().get('end_time')
+        if end_time is None:
+            return 0
+        return max(0, min(end_time - time.time(), day04_HTTP_CACHE_TTL_SECONDS['epochs/latest']))
+
+    @classmethod
+    def day04_epoch_cache_ttl(cls, response):
+        """
+        Cache lifetime of an epochs/{n} response.
+
+        Args:
+            response (requests.Response): epochs/{n} response
+
+        Returns:
+            float: math.inf for a completed epoch (final), otherwise as epochs/latest
+        """
+        end_time = response.json().get('end_time')
+        if end_time is not None and end_time <= time.time():
+            return math.inf
+        return cls.day04_latest_epoch_cache_ttl(response)
 
     def day04_fetch_latest_epoch_metrics(self):
         """
@@ -89,7 +164,7 @@ class day04_CardanoMetricsExtractor:
         """
         print("📊 Fetching latest epoch data...")
 
-        data = self.day04_fetch_with_retry("epochs/latest")
+        data = self.day04_fetch_with_retry("epochs/latest", cache_ttl=self.day04_latest_epoch_cache_ttl)
 
         print(f"   ✓ Epoch {data.get('epoch', 'N/A')}")
         print(f"   ✓ Transactions: {data.get('tx_count', 0):,}")
@@ -106,7 +181,7 @@ class day04_CardanoMetricsExtractor:
         """
         print("🌐 Fetching network information...")
 
-        data = self.day04_fetch_with_retry("network")
+        data = self.day04_fetch_with_retry("network", cache_ttl=day04_HTTP_CACHE_TTL_SECONDS['network'])
 
         supply = data.get('supply', {})
         stake = data.get('stake', {})
@@ -120,35 +195,146 @@ class day04_CardanoMetricsExtractor:
 
         return data
 
+    def day04_fetch_pools_page(self, page):
+        """
+        Fetch one page of registered stake pool IDs.
+
+        Args:
+            page (int): 1-based page number
+
+        Returns:
+            list: Pool IDs (empty past the last page)
+        """
+        return self.day04_fetch_with_retry(
+            "pools",
+            params={"count": day04_POOLS_PAGE_SIZE, "page": page}
+        )
+
+    def day04_find_last_pools_page(self, first_page, pages):
+        """
+        Find the last non-empty /pools page at or after first_page.
+
+        Probes first_page, first_page+1, +2, +4, ... until a page is empty
+        (or short), then binary searches between the last full page and it,
+        so only O(log n) pages are requested. Fetched pages are stored in
+        `pages` and are not requested again.
+
+        Args:
+            first_page (int): Page to start probing from
+            pages (dict): page -> pool IDs, filled with every probed page
+
+        Returns:
+            int: Last non-empty page (first_page - 1 if first_page is empty)
+        """
+        def probe(page):
+            if page not in pages:
+                pages[page] = self.day04_fetch_pools_page(page)
+            return len(pages[page])
+
+        if probe(first_page) < day04_POOLS_PAGE_SIZE:
+            return first_page if pages[first_page] else first_page - 1
+
+        # Exponential probe: `low` is full, `high` is empty or short
+        low, step = first_page, 1
+        high = low + step
+        while probe(high) == day04_POOLS_PAGE_SIZE:
+            low, step = high, step * 2
+            high = low + step
+
+        if pages[high]:
+            return high
+
+        # Binary search for the last non-empty page in (low, high)
+        while high - low > 1:
+            mid = (low + high) // 2
+            if probe(mid) == day04_POOLS_PAGE_SIZE:
+                low = mid
+            elif pages[mid]:
+                return mid
+            else:
+                high = mid
+        return low
+
+    def day04_crawl_stake_pools(self):
+        """
+        Collect the IDs of all registered stake pools.
+
+        Pool IDs are cached in day04_POOLS_CACHE_PATH. Pages are ordered by
+        registration, so a later run re-checks the last full cached page and
+        only fetches the pages after it; if that page changed (pools retired
+        and pages shifted), the cache is discarded and every page is crawled.
+        Pages are fetched concurrently; the shared HTTP client's token bucket
+        keeps the workers within Blockfrost's burst/refill limits.
+
+        Returns:
+            list: Pool IDs in registration order
+        """
+        cached_ids = []
+        if os.path.exists(day04_POOLS_CACHE_PATH):
+            with open(day04_POOLS_CACHE_PATH, 'r') as f:
+                cache = json.load(f)
+            if cache.get('page_size') == day04_POOLS_PAGE_SIZE:
+                cached_ids = cache['pool_ids']
+
+        full_pages = len(cached_ids) // day04_POOLS_PAGE_SIZE
+        known_ids = cached_ids[:full_pages * day04_POOLS_PAGE_SIZE]
+        pages = {}
+        discarded = 0
+
+        if full_pages > 0:
+            pages[full_pages] = self.day04_fetch_pools_page(full_pages)
+            if pages[full_pages] != known_ids[-day04_POOLS_PAGE_SIZE:]:
+                print("   ⚠️  Pool list shifted since the last run - recrawling all pages")
+                known_ids, full_pages, pages, discarded = [], 0, {}, 1
+
+        first_page = full_pages + 1
+        last_page = self.day04_find_last_pools_page(first_page, pages)
+        missing = [page for page in range(first_page, last_page + 1) if page not in pages]
+
+        with ThreadPoolExecutor(max_workers=day04_POOLS_MAX_WORKERS) as executor:
+            for page, pool_ids in zip(missing, executor.map(self.day04_fetch_pools_page, missing)):
+                pages[page] = pool_ids
+
+        pool_ids = known_ids + [
+            pool_id for page in range(first_page, last_page + 1) for pool_id in pages[page]
+        ]
+
+        os.makedirs(os.path.dirname(day04_POOLS_CACHE_PATH), exist_ok=True)
+        tmp_path = day04_POOLS_CACHE_PATH + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                'page_size': day04_POOLS_PAGE_SIZE,
+                'updated_at': datetime.now().isoformat(),
+                'pool_ids': pool_ids
+            }, f)
+        os.replace(tmp_path, day04_POOLS_CACHE_PATH)
+
+        print(f"   ✓ Crawled {last_page} pages ({len(pages) + discarded} requested, {full_pages} from cache)")
+        return pool_ids
+
     def day04_fetch_stake_pools_count(self):
         """
-        Fetch count of active stake pools (demonstrates decentralization).
+        Count registered stake pools (demonstrates decentralization).
 
         Returns:
-            int: Number of active stake pools
+            int: Number of stake pools
         """
         print("🏊 Counting active stake pools...")
 
         try:
-            # Blockfrost pools endpoint returns list of pool IDs
-            # We'll get first page to estimate total count
-            data = self.day04_fetch_with_retry(
-                "pools",
-                params={"count": 100, "page": 1}
-            )
+            pool_count = len(set(self.day04_crawl_stake_pools()))
 
-            # For production, you'd paginate through all results
-            # For this demo, we'll use a known approximation
-            estimated_pools = 3000  # Cardano typically has 3000+ active pools
+        except requests.exceptions.RequestException as e:
+            if not os.path.exists(day04_POOLS_CACHE_PATH):
+                raise
+            with open(day04_POOLS_CACHE_PATH, 'r') as f:
+                pool_count = len(set(json.load(f)['pool_ids']))
+            print(f"   ⚠️  Could not crawl pools, using cached count: {e}")
 
-            print(f"   ✓ Active stake pools: ~{estimated_pools:,}")
-            print(f"   ℹ️  This demonstrates decentralization vs. Bitcoin's ~5 mining pools")
+        print(f"   ✓ Active stake pools: {pool_count:,}")
+        print(f"   ℹ️  This demonstrates decentralization vs. Bitcoin's ~5 mining pools")
 
-            return estimated_pools
-
-        except Exception as e:
-            print(f"   ⚠️  Could not fetch exact count, using approximation: {e}")
-            return 3000
+        return pool_count
 
     def day04_estimate_active_addresses(self, circulating_supply):
         """
@@ -218,6 +404,177 @@ class day04_CardanoMetricsExtractor:
 
         return metrics
 
+    def day04_fetch_epoch_pool_count(self, epoch):
+        """
+        Count the stake pools that had stake delegated to them in an epoch.
+
+        Pages through epochs/{n}/stakes (one entry per delegating stake
+        address) until a short page is returned. Mainnet epochs have over a
+        million delegations, so this costs thousands of requests per epoch.
+
+        Args:
+            epoch (int): Epoch number
+
+        Returns:
+            int: Distinct pool IDs in the epoch's stake distribution
+        """
+        pool_ids = set()
+        page = 1
+
+        while True:
+            stakes = self.day04_fetch_with_retry(
+                f"epochs/{epoch}/stakes",
+                params={"count": day04_STAKES_PAGE_SIZE, "page": page}
+            )
+            pool_ids.update(stake['pool_id'] for stake in stakes)
+
+            if len(stakes) < day04_STAKES_PAGE_SIZE:
+                return len(pool_ids)
+            page += 1
+
+    def day04_fetch_epoch_row(self, epoch, include_stakes=False):
+        """
+        Build the metrics row of one completed epoch.
+
+        The row is timestamped with the epoch's end time (UTC), so re-running
+        a backfill produces identical rows. Historical supply is not exposed
+        by Blockfrost, so active_addresses is left empty; stake_pools_active is
+        only filled when include_stakes is set.
+
+        Args:
+            epoch (int): Epoch number
+            include_stakes (bool): Count pools via epochs/{n}/stakes pagination
+
+        Returns:
+            dict: Row with the same columns as day04_extract_transparency_metrics
+        """
+        data = self.day04_fetch_with_retry(f"epochs/{epoch}", cache_ttl=self.day04_epoch_cache_ttl)
+        end_time = datetime.fromtimestamp(data['end_time'], tz=timezone.utc)
+
+        return {
+            'timestamp': end_time.strftime('%Y-%m-%d %H:%M:%S'),
+            'total_transactions': data.get('tx_count', 0),
+            'active_addresses': None,
+            'block_count': data.get('block_count', 0),
+            'epoch': data['epoch'],
+            'stake_pools_active': self.day04_fetch_epoch_pool_count(epoch) if include_stakes else None,
+            # active_stake is null before the first Shelley snapshot
+            'total_ada_staked': int(data.get('active_stake') or 0) / day04_LOVELACE_TO_ADA,
+            'avg_transaction_fee': day04_AVG_TX_FEE_USD
+        }
+
+    def day04_backfill_epochs(self, from_epoch, to_epoch, include_stakes=False):
+        """
+        Fetch one metrics row per epoch for a range of completed epochs.
+
+        Epochs are fetched concurrently. Each finished row is appended to
+        day04_BACKFILL_CHECKPOINT_PATH as soon as it arrives, and epochs
+        already in the checkpoint are skipped, so an interrupted backfill
+        resumes where it stopped. Epochs that fail are reported after the
+        others have been checkpointed.
+
+        Args:
+            from_epoch (int): First epoch (inclusive)
+            to_epoch (int): Last epoch (inclusive)
+            include_stakes (bool): Count pools via epochs/{n}/stakes pagination
+
+        Returns:
+            list: Rows ordered by epoch
+
+        Raises:
+            requests.exceptions.RequestException: If any epoch could not be fetched
+        """
+        rows = day04_read_backfill_checkpoint(include_stakes)
+        epochs = [epoch for epoch in range(from_epoch, to_epoch + 1) if epoch not in rows]
+
+        print(f"⏪ Backfilling epochs {from_epoch}-{to_epoch}...")
+        print(f"   ✓ {to_epoch - from_epoch + 1 - len(epochs)} epochs already checkpointed, {len(epochs)} to fetch")
+        if include_stakes:
+            print("   ℹ️  Counting pools from epochs/{n}/stakes (thousands of requests per epoch)")
+
+        failed = []
+        os.makedirs(os.path.dirname(day04_BACKFILL_CHECKPOINT_PATH), exist_ok=True)
+
+        with open(day04_BACKFILL_CHECKPOINT_PATH, 'a') as checkpoint, \
+                ThreadPoolExecutor(max_workers=day04_BACKFILL_MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(self.day04_fetch_epoch_row, epoch, include_stakes): epoch
+                for epoch in epochs
+            }
+
+            for future in as_completed(futures):
+                try:
+                    row = future.result()
+                except requests.exceptions.RequestException as e:
+                    failed.append((futures[future], e))
+                    continue
+
+                checkpoint.write(json.dumps(row) + '\n')
+                checkpoint.flush()
+                rows[row['epoch']] = row
+
+        if failed:
+            print(f"   ⚠️  {len(failed)} epochs failed: {sorted(epoch for epoch, _ in failed)}")
+            print("   → Re-run the same backfill to resume from the checkpoint")
+            raise failed[0][1]
+
+        print(f"   ✓ {len(epochs)} epochs fetched")
+        return [rows[epoch] for epoch in range(from_epoch, to_epoch + 1)]
+
+
+def day04_read_backfill_checkpoint(include_stakes=False):
+    """
+    Read the epoch rows saved by previous backfill runs.
+
+    A line cut off by an interrupted run is ignored. With include_stakes,
+    rows saved without a pool count are ignored so they are fetched again.
+
+    Args:
+        include_stakes (bool): Only return rows with stake_pools_active
+
+    Returns:
+        dict: epoch -> row
+    """
+    rows = {}
+    if not os.path.exists(day04_BACKFILL_CHECKPOINT_PATH):
+        return rows
+
+    with open(day04_BACKFILL_CHECKPOINT_PATH, 'r') as f:
+        for line in f:
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if include_stakes and row.get('stake_pools_active') is None:
+                continue
+            rows[row['epoch']] = row
+
+    return rows
+
+
+def day04_save_epoch_history(rows):
+    """
+    Write backfilled epoch rows to day04_EPOCH_HISTORY_CSV_PATH.
+
+    The file is replaced (not appended) and has the BigQuery table's column
+    order; empty counts are written as blank fields (NULL in BigQuery).
+
+    Args:
+        rows (list): Rows from day04_backfill_epochs
+    """
+    print(f"💾 Saving epoch history to CSV...")
+
+    df = pd.DataFrame(rows, columns=day04_METRIC_COLUMNS).sort_values('epoch')
+    for column in ['active_addresses', 'stake_pools_active']:
+        df[column] = df[column].astype('Int64')
+
+    os.makedirs(os.path.dirname(day04_EPOCH_HISTORY_CSV_PATH), exist_ok=True)
+    tmp_path = day04_EPOCH_HISTORY_CSV_PATH + '.tmp'
+    df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, day04_EPOCH_HISTORY_CSV_PATH)
+
+    print(f"   ✓ Wrote {len(df)} epochs to {day04_EPOCH_HISTORY_CSV_PATH}\n")
+
 
 def day04_save_to_csv(metrics):
     """
@@ -245,8 +602,64 @@ def day04_save_to_csv(metrics):
     print(f"   ✓ File size: {os.path.getsize(day04_CSV_OUTPUT_PATH)} bytes\n")
 
 
-def main():
+def day04_run_backfill(extractor, args):
+    """
+    Backfill the requested epoch range and optionally bulk-load it.
+
+    Args:
+        extractor (day04_CardanoMetricsExtractor): Extractor to fetch with
+        args (argparse.Namespace): Parsed command line arguments
+    """
+    # Only completed epochs have final counts
+    latest_epoch = extractor.day04_fetch_with_retry(
+        "epochs/latest", cache_ttl=extractor.day04_latest_epoch_cache_ttl
+    )['epoch']
+    to_epoch = latest_epoch - 1 if args.to_epoch is None else args.to_epoch
+    if to_epoch >= latest_epoch:
+        print(f"   ⚠️  Epoch {latest_epoch} is still in progress - backfilling up to {latest_epoch - 1}")
+        to_epoch = latest_epoch - 1
+
+    from_epoch = args.from_epoch
+    if from_epoch is None:
+        from_epoch = max(0, to_epoch - day04_BACKFILL_DEFAULT_EPOCHS + 1)
+    if from_epoch > to_epoch:
+        raise ValueError(f"Empty epoch range: {from_epoch}-{to_epoch}")
+
+    rows = extractor.day04_backfill_epochs(from_epoch, to_epoch, include_stakes=args.stakes)
+    day04_save_epoch_history(rows)
+    extractor.http.print_latency_report()
+
+    if args.load:
+        from day04_DATA_load_bigquery import day04_BigQueryLoader
+
+        loader = day04_BigQueryLoader()
+        loader.day04_create_dataset_if_not_exists()
+        loader.day04_create_table_if_not_exists()
+        loader.day04_load_csv_to_bigquery(day04_EPOCH_HISTORY_CSV_PATH, only_new=False)
+        print()
+
+    print(f"✅ SUCCESS! Epochs {from_epoch}-{to_epoch} backfilled.")
+    if not args.load:
+        print("🚀 Next step: Run day04_DATA_load_bigquery.py --history to load into BigQuery\n")
+
+
+def main(argv=None):
     """Main execution function."""
+    parser = argparse.ArgumentParser(description='Extract Cardano transparency metrics from Blockfrost')
+    parser.add_argument('--backfill', action='store_true',
+                        help='Fetch one row per completed epoch instead of a live snapshot')
+    parser.add_argument('--from-epoch', type=int, default=None,
+                        help=f'First epoch to backfill (default: last {day04_BACKFILL_DEFAULT_EPOCHS} epochs)')
+    parser.add_argument('--to-epoch', type=int, default=None,
+                        help='Last epoch to backfill (default: latest completed epoch)')
+    parser.add_argument('--stakes', action='store_true',
+                        help='Count stake pools per epoch by paginating epochs/{n}/stakes')
+    parser.add_argument('--load', action='store_true',
+                        help='Bulk-load the backfilled epochs into BigQuery')
+    args = parser.parse_args(argv)
+    if args.from_epoch is not None and args.to_epoch is not None and args.from_epoch > args.to_epoch:
+        parser.error('--from-epoch must not be after --to-epoch')
+
     try:
         # Validate configuration
         print("🔧 Validating configuration...")
@@ -256,11 +669,16 @@ def main():
         # Initialize extractor
         extractor = day04_CardanoMetricsExtractor()
 
+        if args.backfill:
+            day04_run_backfill(extractor, args)
+            return 0
+
         # Extract metrics
         metrics = extractor.day04_extract_transparency_metrics()
 
         # Save to CSV
         day04_save_to_csv(metrics)
+        extractor.http.print_latency_report()
 
         print("✅ SUCCESS! Cardano transparency metrics extracted.")
         print("🚀 Next step: Run day04_DATA_load_bigquery.py to load into BigQuery\n")
@@ -4,11 +4,20 @@ Loads on-chain transparency data into BigQuery for analysis
 
 This script creates the BigQuery infrastructure and loads Cardano blockchain
 transparency metrics, making them queryable for educational and analytical purposes.
+
+The table is partitioned by DATE(timestamp) and clustered by epoch. Loads go
+through a staging table and a MERGE on (epoch, timestamp), and the live CSV
+only contributes rows newer than the table's max timestamp, so repeated runs
+never duplicate rows and each run scans and writes about the same bytes as
+history grows.
 """
 
+import argparse
+import io
 import pandas as pd
 import sys
 import os
+from datetime import datetime
 from google.cloud import bigquery
 from google.cloud.exceptions import NotFound
 
@@ -20,8 +29,12 @@ from day04_CONFIG_settings import (
     day04_BQ_DATASET,
     day04_BQ_TABLE,
     day04_BQ_TABLE_FULL,
+    day04_BQ_STAGING_TABLE_FULL,
+    day04_BQ_STAGING_EXPIRATION_HOURS,
+    day04_BQ_CLUSTER_FIELDS,
     day04_BQ_LOCATION,
     day04_CSV_OUTPUT_PATH,
+    day04_EPOCH_HISTORY_CSV_PATH,
     day04_validate_config
 )
 
@@ -37,6 +50,7 @@ class day04_BigQueryLoader:
         self.dataset_id = day04_BQ_DATASET
         self.table_id = day04_BQ_TABLE
         self.table_ref = day04_BQ_TABLE_FULL
+        self.staging_ref = day04_BQ_STAGING_TABLE_FULL
 
     def day04_create_dataset_if_not_exists(self):
         """
@@ -108,8 +122,9 @@ class day04_BigQueryLoader:
             bigquery.SchemaField(
                 "stake_pools_active",
                 "INTEGER",
-                mode="REQUIRED",
-                description="Number of active stake pools (demonstrates decentralization - typically 3000+)"
+                mode="NULLABLE",
+                description="Number of active stake pools (demonstrates decentralization - typically 3000+; "
+                            "empty for backfilled epochs loaded without --stakes)"
             ),
             bigquery.SchemaField(
                 "total_ada_staked",
@@ -129,12 +144,31 @@ class day04_BigQueryLoader:
         """
         Create BigQuery table with transparency metrics schema if it doesn't exist.
 
+        The table is partitioned by DATE(timestamp) and clustered by epoch.
+
         Returns:
             google.cloud.bigquery.Table: The table object
+
+        Raises:
+            ValueError: If the table exists but is not partitioned by timestamp
         """
         try:
             table = self.client.get_table(self.table_ref)
             print(f"✓ Table {self.table_ref} already exists")
+
+            partitioning = table.time_partitioning
+            if partitioning is None or partitioning.field != "timestamp":
+                name = self.table_ref.split('.')[-1]
+                raise ValueError(
+                    f"{self.table_ref} is not partitioned by DATE(timestamp).\n"
+                    "   → Recreate it once (keeps history, drops duplicate rows):\n"
+                    f"     CREATE TABLE `{self.table_ref}_partitioned`\n"
+                    f"       PARTITION BY DATE(timestamp) CLUSTER BY {', '.join(day04_BQ_CLUSTER_FIELDS)}\n"
+                    f"       AS SELECT DISTINCT * FROM `{self.table_ref}`;\n"
+                    f"     DROP TABLE `{self.table_ref}`;\n"
+                    f"     ALTER TABLE `{self.table_ref}_partitioned` RENAME TO {name};"
+                )
+
             return table
 
         except NotFound:
@@ -143,6 +177,11 @@ class day04_BigQueryLoader:
             schema = self.day04_get_table_schema()
 
             table = bigquery.Table(self.table_ref, schema=schema)
+            table.time_partitioning = bigquery.TimePartitioning(
+                type_=bigquery.TimePartitioningType.DAY,
+                field="timestamp"
+            )
+            table.clustering_fields = day04_BQ_CLUSTER_FIELDS
             table.description = (
                 "Cardano blockchain transparency metrics extracted via Blockfrost API. "
                 "Demonstrates: (1) Network transparency - all transactions visible, "
@@ -151,59 +190,149 @@ class day04_BigQueryLoader:
             )
 
             table = self.client.create_table(table)
-            print(f"   ✓ Table created with {len(schema)} columns")
+            print(f"   ✓ Table created with {len(schema)} columns "
+                  f"(partitioned by DATE(timestamp), clustered by {', '.join(day04_BQ_CLUSTER_FIELDS)})")
 
             return table
 
-    def day04_load_csv_to_bigquery(self):
+    def day04_get_latest_partition(self):
+        """
+        Find the newest daily partition from the table's partition metadata.
+
+        Listing partitions reads metadata only, so no table data is scanned.
+
+        Returns:
+            datetime.date or None: Date of the newest partition (None if the table is empty)
+        """
+        partitions = [p for p in self.client.list_partitions(self.table_ref) if p.isdigit()]
+        if not partitions:
+            return None
+        return datetime.strptime(max(partitions), '%Y%m%d').date()
+
+    def day04_get_max_timestamp(self):
+        """
+        Get the latest timestamp already loaded.
+
+        Only the newest partition is scanned, so the cost does not grow with
+        the table.
+
+        Returns:
+            pd.Timestamp or None: Max timestamp (naive UTC), None if the table is empty
+        """
+        latest_partition = self.day04_get_latest_partition()
+        if latest_partition is None:
+            return None
+
+        query = f"""
+            SELECT MAX(timestamp) AS max_timestamp
+            FROM `{self.table_ref}`
+            WHERE timestamp >= TIMESTAMP '{latest_partition}'
+        """
+        row = next(iter(self.client.query(query).result()))
+        if row.max_timestamp is None:
+            return None
+
+        max_timestamp = pd.Timestamp(row.max_timestamp)
+        if max_timestamp.tzinfo is not None:
+            max_timestamp = max_timestamp.tz_convert('UTC').tz_localize(None)
+        return max_timestamp
+
+    def day04_load_csv_to_bigquery(self, csv_path=day04_CSV_OUTPUT_PATH, only_new=True):
         """
         Load CSV data into BigQuery table.
 
+        Rows are loaded into a staging table and MERGEd on (epoch, timestamp),
+        so rows already in the table are never inserted twice. With only_new
+        (the live snapshots), rows at or before the table's max timestamp are
+        dropped before staging; the MERGE's timestamp predicate then prunes
+        the target to the partitions being written. Backfilled epoch history
+        is older than the live rows, so it is loaded with only_new=False and
+        deduplicated by the MERGE alone.
+
+        Args:
+            csv_path (str): CSV to load (snapshots or the epoch history)
+            only_new (bool): Skip rows not newer than the table's max timestamp
+
         Returns:
-            google.cloud.bigquery.job.LoadJob: The completed load job
+            google.cloud.bigquery.job.QueryJob: The completed MERGE job (None if nothing was new)
         """
-        print(f"\n📤 Loading data from {day04_CSV_OUTPUT_PATH}...")
+        print(f"\n📤 Loading data from {csv_path}...")
 
         # Check if CSV exists
-        if not os.path.exists(day04_CSV_OUTPUT_PATH):
+        if not os.path.exists(csv_path):
             raise FileNotFoundError(
-                f"CSV file not found: {day04_CSV_OUTPUT_PATH}\n"
+                f"CSV file not found: {csv_path}\n"
                 "   → Run day04_DATA_extract_blockfrost.py first"
             )
 
-        # Read CSV to validate
-        df = pd.read_csv(day04_CSV_OUTPUT_PATH)
-        print(f"   ✓ Found {len(df)} rows to load")
+        # Read CSV to validate (timestamps are passed through to BigQuery unchanged)
+        df = pd.read_csv(
+            csv_path,
+            dtype={'timestamp': str, 'active_addresses': 'Int64', 'stake_pools_active': 'Int64'}
+        )
+        print(f"   ✓ Found {len(df)} rows in file")
         print(f"   ✓ Columns: {', '.join(df.columns.tolist())}")
 
-        # Configure load job
+        df = df.drop_duplicates(subset=['epoch', 'timestamp'])
+        timestamps = pd.to_datetime(df['timestamp'], format='ISO8601')
+
+        if only_new:
+            max_timestamp = self.day04_get_max_timestamp()
+            if max_timestamp is not None:
+                newer = timestamps > max_timestamp
+                df, timestamps = df[newer], timestamps[newer]
+                print(f"   ✓ Table max timestamp: {max_timestamp} ({len(df)} newer rows)")
+
+        if df.empty:
+            print("   ✓ Table is up to date - nothing to load")
+            return None
+
+        # 1. Load the rows into a staging table
         job_config = bigquery.LoadJobConfig(
             source_format=bigquery.SourceFormat.CSV,
             skip_leading_rows=1,  # Skip header
             autodetect=False,
             schema=self.day04_get_table_schema(),
-            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+            write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,
         )
 
-        # Load data
-        with open(day04_CSV_OUTPUT_PATH, "rb") as source_file:
-            load_job = self.client.load_table_from_file(
-                source_file,
-                self.table_ref,
-                job_config=job_config
-            )
-
-        # Wait for job to complete
-        print(f"   ⏳ Loading to BigQuery...")
+        print(f"   ⏳ Staging {len(df)} rows in {self.staging_ref}...")
+        load_job = self.client.load_table_from_file(
+            io.BytesIO(df.to_csv(index=False).encode('utf-8')),
+            self.staging_ref,
+            job_config=job_config
+        )
         load_job.result()  # Waits for job to complete
 
+        staging = self.client.get_table(self.staging_ref)
+        staging.expires = pd.Timestamp.now(tz='UTC') + pd.Timedelta(hours=day04_BQ_STAGING_EXPIRATION_HOURS)
+        self.client.update_table(staging, ['expires'])
+
+        # 2. MERGE into the target; the timestamp predicate prunes partitions
+        columns = [field.name for field in self.day04_get_table_schema()]
+        merge_sql = f"""
+            MERGE `{self.table_ref}` T
+            USING `{self.staging_ref}` S
+            ON T.epoch = S.epoch AND T.timestamp = S.timestamp
+               AND T.timestamp >= TIMESTAMP '{timestamps.min()}'
+            WHEN NOT MATCHED THEN
+              INSERT ({', '.join(columns)}) VALUES ({', '.join('S.' + c for c in columns)})
+        """
+        print(f"   ⏳ Merging into {self.table_ref}...")
+        merge_job = self.client.query(merge_sql)
+        merge_job.result()
+
+        self.client.delete_table(self.staging_ref, not_found_ok=True)
+
         # Get destination table
         destination_table = self.client.get_table(self.table_ref)
 
-        print(f"   ✓ Loaded {load_job.output_rows} rows")
+        print(f"   ✓ Inserted {merge_job.num_dml_affected_rows} new rows "
+              f"({len(df) - merge_job.num_dml_affected_rows} already loaded)")
+        print(f"   ✓ MERGE processed: {(merge_job.total_bytes_processed or 0) / 1024:,.1f} KB")
         print(f"   ✓ Total rows in table: {destination_table.num_rows}")
 
-        return load_job
+        return merge_job
 
     def day04_display_sample_data(self, limit=5):
         """
@@ -215,6 +344,12 @@ class day04_BigQueryLoader:
         print(f"\n📋 Sample data from {self.table_ref}:")
         print("-" * 80)
 
+        latest_partition = self.day04_get_latest_partition()
+        if latest_partition is None:
+            print("  (table is empty)")
+            return
+
+        # Only the last 30 days of partitions are read (the table grows every run)
         query = f"""
             SELECT
                 timestamp,
@@ -224,6 +359,7 @@ class day04_BigQueryLoader:
                 ROUND(total_ada_staked, 0) as total_ada_staked,
                 avg_transaction_fee
             FROM `{self.table_ref}`
+            WHERE timestamp >= TIMESTAMP_SUB(TIMESTAMP '{latest_partition}', INTERVAL 30 DAY)
             ORDER BY timestamp DESC
             LIMIT {limit}
         """
@@ -234,7 +370,8 @@ class day04_BigQueryLoader:
         for row in results:
             print(f"  Epoch {row.epoch} | {row.timestamp}")
             print(f"    Transactions: {row.total_transactions:,}")
-            print(f"    Stake Pools: {row.stake_pools_active:,} (decentralization)")
+            if row.stake_pools_active is not None:
+                print(f"    Stake Pools: {row.stake_pools_active:,} (decentralization)")
             print(f"    ADA Staked: {row.total_ada_staked:,.0f}")
             print(f"    Avg Fee: ${row.avg_transaction_fee:.2f}")
             print()
@@ -290,8 +427,13 @@ LIMIT 30
             print()
 
 
-def main():
+def main(argv=None):
     """Main execution function."""
+    parser = argparse.ArgumentParser(description='Load Cardano transparency metrics into BigQuery')
+    parser.add_argument('--history', action='store_true',
+                        help='Load the backfilled epoch history instead of the live snapshots')
+    args = parser.parse_args(argv)
+
     try:
         print("="*80)
         print("🔗 CARDANO TRANSPARENCY METRICS → BIGQUERY LOADER")
@@ -314,7 +456,10 @@ def main():
         print()
 
         # Load data
-        loader.day04_load_csv_to_bigquery()
+        if args.history:
+            loader.day04_load_csv_to_bigquery(day04_EPOCH_HISTORY_CSV_PATH, only_new=False)
+        else:
+            loader.day04_load_csv_to_bigquery(day04_CSV_OUTPUT_PATH)
 
         # Display sample
         loader.day04_display_sample_data()
@@ -334,6 +479,10 @@ def main():
         print(f"\n❌ File Error: {e}\n")
         return 1
 
+    except ValueError as e:
+        print(f"\n❌ Error: {e}\n")
+        return 1
+
     except Exception as e:
         print(f"\n❌ Error: {e}")
         import traceback
@@ -37,6 +37,16 @@ day05_AUDIO_DIR = day05_RAW_DIR / "audio"
 day05_TRANSCRIPTS_DIR = day05_RAW_DIR / "transcripts"
 day05_PROCESSED_DIR = day05_DATA_DIR / "processed"
 
+# Persistent TF-IDF index of the local catalog (rebuilt when the catalog changes)
+day05_TFIDF_INDEX_DIR = day05_PROCESSED_DIR / "tfidf_index"
+
+# Tainacan HTTP client (common/utils/http_client.py)
+day05_TAINACAN_RATE_LIMIT_PER_SECOND = float(os.getenv("DAY05_TAINACAN_RATE_LIMIT_PER_SECOND", "2"))
+day05_HTTP_RETRY_ATTEMPTS = 3
+day05_HTTP_RETRY_DELAY = 2  # seconds (base of the exponential backoff)
+day05_HTTP_CACHE_DIR = day05_RAW_DIR / "http_cache"
+day05_HTTP_CACHE_HOURS = float(os.getenv("DAY05_HTTP_CACHE_HOURS", "0"))  # > 0 caches API pages on disk
+
 # Episode Configuration
 day05_EPISODE_IDS = ["01", "02", "03", "04", "05"]
 day05_AUDIO_EXTENSIONS = [".mp3", ".wav", ".m4a", ".flac", ".ogg"]
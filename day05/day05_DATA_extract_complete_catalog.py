@@ -6,20 +6,29 @@ Usage:
     python day05_DATA_extract_complete_catalog.py
 """
 
-import requests
 import sqlite3
 import json
 import math
-import time
 from pathlib import Path
 from datetime import datetime
+from urllib.parse import urlsplit
 from tqdm import tqdm
 import sys
 
+# Add common modules to path
+sys.path.append(str(Path(__file__).parent.parent / 'common'))
+
+from utils.http_client import RetryingHTTPClient
+
 # Import day05 configuration
 from day05_CONFIG_settings import (
     day05_TAINACAN_API_URL,
     day05_PROCESSED_DIR,
+    day05_HTTP_RETRY_ATTEMPTS,
+    day05_HTTP_RETRY_DELAY,
+    day05_HTTP_CACHE_DIR,
+    day05_HTTP_CACHE_HOURS,
+    day05_TAINACAN_RATE_LIMIT_PER_SECOND,
     day05_ensure_directories
 )
 
@@ -30,11 +39,19 @@ class day05_CompleteCatalogExtractor:
     def __init__(self):
         """Initialize extractor"""
         self.base_url = day05_TAINACAN_API_URL.rstrip('/')
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Day05-Museum-Complete-Extraction/1.0',
-            'Accept': 'application/json'
-        })
+        # Pooled, rate-limited client with retries (replaces fixed sleeps between pages)
+        self.http = RetryingHTTPClient(
+            max_attempts=day05_HTTP_RETRY_ATTEMPTS,
+            backoff_seconds=day05_HTTP_RETRY_DELAY,
+            timeout=30,
+            rate_limits={urlsplit(self.base_url).hostname: day05_TAINACAN_RATE_LIMIT_PER_SECOND},
+            headers={
+                'User-Agent': 'Day05-Museum-Complete-Extraction/1.0',
+                'Accept': 'application/json'
+            },
+            cache_dir=day05_HTTP_CACHE_DIR if day05_HTTP_CACHE_HOURS > 0 else None,
+            cache_ttl_seconds=day05_HTTP_CACHE_HOURS * 3600 or None
+        )
         self.db_path = day05_PROCESSED_DIR / "museu_paulista_completo.db"
         print(f"✅ Extractor initialized")
         print(f"   API: {self.base_url}")
@@ -53,7 +70,7 @@ class day05_CompleteCatalogExtractor:
             url = f"{self.base_url}/items"
             params = {'perpage': 1}
 
-            response = self.session.get(url, params=params, timeout=30)
+            response = self.http.get(url, params=params)
             response.raise_for_status()
 
             # Try to get total from headers (WordPress/Tainacan standard)
@@ -97,7 +114,7 @@ class day05_CompleteCatalogExtractor:
             mid = (left + right) // 2
 
             try:
-                response = self.session.get(
+                response = self.http.get(
                     f"{self.base_url}/items",
                     params={'perpage': 100, 'paged': mid},
                     timeout=10
@@ -150,7 +167,7 @@ class day05_CompleteCatalogExtractor:
                 url = f"{self.base_url}/items"
                 params = {'perpage': perpage, 'paged': page}
 
-                response = self.session.get(url, params=params, timeout=30)
+                response = self.http.get(url, params=params)
                 response.raise_for_status()
 
                 data = response.json()
@@ -167,19 +184,17 @@ class day05_CompleteCatalogExtractor:
 
                 all_items.extend(items)
 
-                # Respect server - rate limiting
-                time.sleep(0.5)
-
             except Exception as e:
+                # Transient errors were already retried with backoff by the HTTP client
                 failed_pages.append(page)
                 tqdm.write(f"   ⚠️  Erro na página {page}: {str(e)[:50]}")
-                time.sleep(2)  # Wait longer on error
                 continue
 
         print(f"\n✅ Extração completa!")
         print(f"   Total extraído: {len(all_items):,} itens")
         if failed_pages:
             print(f"   ⚠️  Páginas com erro: {len(failed_pages)}")
+        self.http.print_latency_report()
 
         return all_items
 
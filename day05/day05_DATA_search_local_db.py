@@ -2,25 +2,38 @@
 Day 05: Local Database Search Script
 Searches local SQLite database for museum items with fuzzy text matching
 
+The TF-IDF index of the catalog is fitted once, saved to
+data/processed/tfidf_index/ with a fingerprint of the catalog, and reused
+until the catalog changes. Each mention is then scored with one transform
+and a sparse dot product (all mentions at once in batch mode).
+
 Usage:
     python day05_DATA_search_local_db.py
 """
 
 import sqlite3
 import csv
+import hashlib
+import json
+import joblib
 import pandas as pd
+import scipy.sparse
+from datetime import datetime
 from pathlib import Path
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import sys
 
 # Import day05 configuration
 from day05_CONFIG_settings import (
     day05_PROCESSED_DIR,
     day05_SIMILARITY_THRESHOLD,
+    day05_TFIDF_INDEX_DIR,
     day05_ensure_directories
 )
 
+# Vectorizer settings (part of the index fingerprint)
+day05_TFIDF_PARAMS = {"ngram_range": (1, 2), "min_df": 1, "max_features": 5000}
+
 
 class day05_LocalDatabaseSearcher:
     """Searches local SQLite database for museum artifacts with similarity matching"""
@@ -35,6 +48,9 @@ class day05_LocalDatabaseSearcher:
                 f"   Run: python day05_DATA_extract_complete_catalog.py first!"
             )
 
+        self.index_dir = day05_TFIDF_INDEX_DIR
+        self.index = None
+
         print(f"✅ Local database searcher initialized")
         print(f"   DB: {self.db_path}")
 
@@ -55,6 +71,137 @@ class day05_LocalDatabaseSearcher:
 
         return df
 
+    @staticmethod
+    def day05_candidate_texts(df: pd.DataFrame) -> pd.Series:
+        """
+        Build the matching text of every item (title + description)
+
+        Args:
+            df: DataFrame with all museum items
+
+        Returns:
+            Lowercased texts, limited to 1000 characters
+        """
+        def column(name):
+            return df[name].astype(str) if name in df else pd.Series("", index=df.index)
+
+        combined = column("title") + " " + column("description")
+        return combined.str.lower().str[:1000]  # Limit length
+
+    @staticmethod
+    def day05_catalog_fingerprint(df: pd.DataFrame, texts: pd.Series) -> str:
+        """
+        Fingerprint the catalog version an index was built from
+
+        Covers item IDs (in row order), their texts and the vectorizer
+        settings, so any catalog or settings change invalidates the index.
+        """
+        digest = hashlib.sha256(json.dumps(day05_TFIDF_PARAMS, sort_keys=True).encode("utf-8"))
+        ids = df["id"].astype(str) if "id" in df else pd.Series("", index=df.index)
+        for item_id, text in zip(ids, texts):
+            digest.update(f"{item_id}\x1f{text}\x1e".encode("utf-8"))
+        return digest.hexdigest()
+
+    def day05_get_index(self, df: pd.DataFrame) -> dict:
+        """
+        Get the TF-IDF index of the catalog, loading or building it once
+
+        The index saved in index_dir is reused when its fingerprint matches
+        the catalog; otherwise the vectorizer is fitted on the catalog items
+        and the index is saved again.
+
+        Args:
+            df: DataFrame with all museum items
+
+        Returns:
+            Dict with the fitted vectorizer, the item matrix (one L2-normalized
+            row per item) and the catalog fingerprint
+        """
+        if self.index is not None and self.index["df"] is df:
+            return self.index
+
+        texts = self.day05_candidate_texts(df)
+        fingerprint = self.day05_catalog_fingerprint(df, texts)
+
+        index = self.day05_load_index(fingerprint)
+        if index is None:
+            print(f"\n🧮 Construindo índice TF-IDF ({len(df):,} itens)...")
+            vectorizer = TfidfVectorizer(**day05_TFIDF_PARAMS)
+            matrix = vectorizer.fit_transform(texts).tocsr()
+            index = {"vectorizer": vectorizer, "matrix": matrix, "fingerprint": fingerprint}
+            self.day05_save_index(index)
+            print(f"   ✅ Índice salvo em {self.index_dir} ({len(vectorizer.vocabulary_):,} termos)")
+        else:
+            print(f"\n🧮 Índice TF-IDF carregado de {self.index_dir}")
+
+        index["df"] = df
+        self.index = index
+        return index
+
+    def day05_load_index(self, fingerprint: str):
+        """Load the saved index if it was built from the same catalog (None otherwise)"""
+        meta_path = self.index_dir / "meta.json"
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("fingerprint") != fingerprint:
+                return None
+
+            return {
+                "vectorizer": joblib.load(self.index_dir / "vectorizer.joblib"),
+                "matrix": scipy.sparse.load_npz(self.index_dir / "matrix.npz").tocsr(),
+                "fingerprint": fingerprint
+            }
+        except Exception:
+            # Missing, partial or incompatible (e.g. other sklearn version): rebuild
+            return None
+
+    def day05_save_index(self, index: dict):
+        """Save the vectorizer (vocabulary + IDF), item matrix and fingerprint"""
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+
+        joblib.dump(index["vectorizer"], self.index_dir / "vectorizer.joblib")
+        scipy.sparse.save_npz(self.index_dir / "matrix.npz", index["matrix"])
+
+        # meta.json is written last: a partial index never matches a fingerprint
+        with open(self.index_dir / "meta.json", "w", encoding="utf-8") as f:
+            json.dump({
+                "fingerprint": index["fingerprint"],
+                "items": index["matrix"].shape[0],
+                "built_at": datetime.now().isoformat()
+            }, f, indent=2)
+
+    def day05_score_queries(self, queries: list, df: pd.DataFrame) -> tuple:
+        """
+        Score queries against every catalog item in one sparse matrix multiply
+
+        Rows of the index and of the transformed queries are L2-normalized,
+        so the dot product is the cosine similarity.
+
+        Args:
+            queries: Search queries (item mentions from podcasts)
+            df: DataFrame with all museum items
+
+        Returns:
+            (best item position per query, best score per query) as arrays
+        """
+        index = self.day05_get_index(df)
+        query_matrix = index["vectorizer"].transform([query.lower() for query in queries])
+        similarities = query_matrix @ index["matrix"].T
+
+        best_idx = similarities.argmax(axis=1).A1
+        best_scores = similarities.max(axis=1).toarray().ravel()
+        return best_idx, best_scores
+
+    def day05_match_result(self, query: str, df: pd.DataFrame, best_idx: int, best_score: float) -> dict:
+        """Turn the best score of a query into a match or no-match result"""
+        if best_score >= day05_SIMILARITY_THRESHOLD:
+            print(f"   ✅ Match encontrado (confidence: {best_score:.3f})")
+            return self.day05_format_match_result(df.iloc[best_idx], float(best_score), "fuzzy_match_local")
+
+        print(f"   ⚠️  Melhor match abaixo do threshold: {best_score:.3f} < {day05_SIMILARITY_THRESHOLD}")
+        return self.day05_create_no_match_result(query)
+
     def day05_search_item(self, query: str, df: pd.DataFrame) -> dict:
         """
         Search for a specific item using fuzzy text matching
@@ -71,41 +218,42 @@ class day05_LocalDatabaseSearcher:
         if df.empty:
             return self.day05_create_no_match_result(query)
 
-        # Prepare texts for matching (title + description)
-        candidate_texts = []
-        for _, row in df.iterrows():
-            title = str(row.get('title', ''))
-            description = str(row.get('description', ''))
-            combined = f"{title} {description}".lower()
-            candidate_texts.append(combined[:1000])  # Limit length
-
-        # Add query to corpus
-        all_texts = [query.lower()] + candidate_texts
-
-        # Calculate TF-IDF similarity
         try:
-            vectorizer = TfidfVectorizer(ngram_range=(1, 2), min_df=1, max_features=5000)
-            tfidf_matrix = vectorizer.fit_transform(all_texts)
+            best_idx, best_scores = self.day05_score_queries([query], df)
+            return self.day05_match_result(query, df, best_idx[0], best_scores[0])
 
-            # Calculate similarity with query (first item)
-            similarities = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:]).flatten()
+        except Exception as e:
+            print(f"   ❌ Erro no fuzzy matching: {str(e)}")
+            return self.day05_create_no_match_result(query)
 
-            # Find best match
-            best_idx = similarities.argmax()
-            best_score = similarities[best_idx]
+    def day05_search_items(self, queries: list, df: pd.DataFrame) -> list:
+        """
+        Search for many items at once (batch mode)
 
-            if best_score >= day05_SIMILARITY_THRESHOLD:
-                best_item = df.iloc[best_idx]
-                print(f"   ✅ Match encontrado (confidence: {best_score:.3f})")
+        All queries are transformed together and scored with a single
+        matrix multiply against the catalog index.
 
-                return self.day05_format_match_result(best_item, best_score, "fuzzy_match_local")
-            else:
-                print(f"   ⚠️  Melhor match abaixo do threshold: {best_score:.3f} < {day05_SIMILARITY_THRESHOLD}")
-                return self.day05_create_no_match_result(query)
+        Args:
+            queries: Search queries (item mentions from podcasts)
+            df: DataFrame with all museum items
 
+        Returns:
+            One match result per query, in order
+        """
+        if df.empty or not queries:
+            return [self.day05_create_no_match_result(query) for query in queries]
+
+        try:
+            best_idx, best_scores = self.day05_score_queries(queries, df)
         except Exception as e:
             print(f"   ❌ Erro no fuzzy matching: {str(e)}")
-            return self.day05_create_no_match_result(query)
+            return [self.day05_create_no_match_result(query) for query in queries]
+
+        results = []
+        for query, idx, score in zip(queries, best_idx, best_scores):
+            print(f"\n🔍 Buscando: '{query}'")
+            results.append(self.day05_match_result(query, df, idx, score))
+        return results
 
     @staticmethod
     def day05_format_match_result(row: pd.Series, confidence: float, match_type: str) -> dict:
@@ -220,19 +368,15 @@ def day05_main():
     # Load all museum items from database
     df_items = searcher.day05_load_all_items()
 
-    # Search for each validated item
-    matched_items = []
-
-    for i, item in enumerate(validated_items, 1):
-        print(f"\n{'='*80}")
-        print(f"Processando {i}/{len(validated_items)}")
+    # Search for all validated items in one batch
+    print(f"\n{'='*80}")
+    print(f"Processando {len(validated_items)} itens")
 
-        query = item['item_mention']
-        match_result = searcher.day05_search_item(query, df_items)
+    queries = [item['item_mention'] for item in validated_items]
+    match_results = searcher.day05_search_items(queries, df_items)
 
-        # Combine original item data with match result
-        combined = {**item, **match_result}
-        matched_items.append(combined)
+    # Combine original item data with match result
+    matched_items = [{**item, **match_result} for item, match_result in zip(validated_items, match_results)]
 
     # Save results
     output_path = day05_PROCESSED_DIR / "matched_items.csv"
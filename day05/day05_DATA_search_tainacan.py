@@ -10,15 +10,25 @@ import requests
 import csv
 import json
 from pathlib import Path
+from urllib.parse import urlsplit
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import sys
-import time
+
+# Add common modules to path
+sys.path.append(str(Path(__file__).parent.parent / 'common'))
+
+from utils.http_client import RetryingHTTPClient
 
 # Import day05 configuration
 from day05_CONFIG_settings import (
     day05_TAINACAN_API_URL,
     day05_PROCESSED_DIR,
+    day05_HTTP_RETRY_ATTEMPTS,
+    day05_HTTP_RETRY_DELAY,
+    day05_HTTP_CACHE_DIR,
+    day05_HTTP_CACHE_HOURS,
+    day05_TAINACAN_RATE_LIMIT_PER_SECOND,
     day05_SIMILARITY_THRESHOLD,
     day05_MAX_SEARCH_RESULTS,
     day05_ensure_directories
@@ -31,11 +41,19 @@ class day05_TainacanSearcher:
     def __init__(self):
         """Initialize Tainacan API client"""
         self.api_url = day05_TAINACAN_API_URL.rstrip('/')
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Day05-Museum-Pipeline/1.0',
-            'Accept': 'application/json'
-        })
+        # Pooled, rate-limited client with retries (replaces fixed sleeps between calls)
+        self.http = RetryingHTTPClient(
+            max_attempts=day05_HTTP_RETRY_ATTEMPTS,
+            backoff_seconds=day05_HTTP_RETRY_DELAY,
+            timeout=30,
+            rate_limits={urlsplit(self.api_url).hostname: day05_TAINACAN_RATE_LIMIT_PER_SECOND},
+            headers={
+                'User-Agent': 'Day05-Museum-Pipeline/1.0',
+                'Accept': 'application/json'
+            },
+            cache_dir=day05_HTTP_CACHE_DIR if day05_HTTP_CACHE_HOURS > 0 else None,
+            cache_ttl_seconds=day05_HTTP_CACHE_HOURS * 3600 or None
+        )
         print(f"✅ Tainacan API client initialized")
         print(f"   API URL: {self.api_url}")
 
@@ -63,7 +81,7 @@ class day05_TainacanSearcher:
                     'paged': page
                 }
 
-                response = self.session.get(url, params=params, timeout=30)
+                response = self.http.get(url, params=params)
                 response.raise_for_status()
 
                 items = response.json()
@@ -75,7 +93,6 @@ class day05_TainacanSearcher:
                 print(f"   Page {page}: +{len(items)} items (total: {len(all_items)})")
 
                 page += 1
-                time.sleep(0.5)  # Rate limiting
 
             except requests.exceptions.RequestException as e:
                 print(f"   ⚠️  Error fetching page {page}: {str(e)}")
@@ -101,7 +118,7 @@ class day05_TainacanSearcher:
         try:
             url = f"{self.api_url}/items"
             params = {'search': query, 'perpage': day05_MAX_SEARCH_RESULTS}
-            response = self.session.get(url, params=params, timeout=30)
+            response = self.http.get(url, params=params)
 
             if response.status_code == 200:
                 api_results = response.json()
@@ -309,8 +326,6 @@ def day05_main():
         combined = {**item, **match_result}
         matched_items.append(combined)
 
-        time.sleep(0.5)  # Rate limiting
-
     # Save results
     output_path = day05_PROCESSED_DIR / "matched_items.csv"
     day05_save_matched_items(matched_items, output_path)
@@ -332,6 +347,8 @@ def day05_main():
         avg_confidence = sum(m['match_confidence'] for m in matched_items if m['matched']) / matched
         print(f"   📊 Average confidence: {avg_confidence:.3f}")
 
+    searcher.http.print_latency_report()
+
     print("\n✅ Search complete!")
     print(f"📂 Results saved to: {output_path}")
     print("\n🔜 Next step: python day05_DATA_load_bigquery.py")
@@ -61,7 +61,8 @@ DAY11_LOG_DIR = Path(__file__).parent / "logs"
 
 # Error Handling
 DAY11_RETRY_ATTEMPTS = int(os.getenv("DAY11_RETRY_ATTEMPTS", "3"))
-DAY11_RETRY_DELAY_SECONDS = int(os.getenv("DAY11_RETRY_DELAY_SECONDS", "10"))
+DAY11_RETRY_DELAY_SECONDS = int(os.getenv("DAY11_RETRY_DELAY_SECONDS", "10"))  # Base of the exponential backoff
+DAY11_SLACK_RATE_LIMIT_PER_SECOND = 1.0  # Slack allows about one webhook message per second
 DAY11_ENABLE_ERROR_NOTIFICATIONS = os.getenv("DAY11_ENABLE_ERROR_NOTIFICATIONS", "true").lower() == "true"
 
 # Logging Configuration
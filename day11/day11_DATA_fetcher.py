@@ -1,10 +1,10 @@
 """
 Day 11 Data Fetcher
-Fetches GA4 and Google Ads data from Day 01 sources (BigQuery or local CSV)
+Fetches GA4 and Google Ads data from Day 01 sources (BigQuery or local Parquet/CSV)
 
 This module handles data retrieval with fallback logic:
 1. Try BigQuery first (if enabled)
-2. Fall back to local CSV files from Day 01
+2. Fall back to local Parquet/CSV files from Day 01
 3. Generate synthetic data as last resort
 
 Author: Gleyson - Retail Marketing Automation Specialist
@@ -35,6 +35,10 @@ from day11_CONFIG_settings import (
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Columns the report needs from the Day 01 files
+DAY11_GA4_COLUMNS = ["date", "source", "sessions", "conversions", "bounce_rate"]
+DAY11_ADS_COLUMNS = ["date", "campaign_name", "spend", "clicks", "impressions", "conversions"]
+
 
 class Day11DataFetcher:
     """Fetches marketing data from Day 01 sources with fallback logic."""
@@ -135,30 +139,53 @@ class Day11DataFetcher:
         return ga4_df, ads_df
 
     def _day11_fetch_from_csv(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        """Fetch data from local CSV files (Day 01 output)."""
-        ga4_csv_path = DAY11_DAY01_DATA_DIR / "ga4_sessions.csv"
-        ads_csv_path = DAY11_DAY01_DATA_DIR / "ads_campaigns.csv"
-
-        if not ga4_csv_path.exists() or not ads_csv_path.exists():
-            raise FileNotFoundError(f"CSV files not found in {DAY11_DAY01_DATA_DIR}")
-
-        ga4_df = pd.read_csv(ga4_csv_path)
-        ads_df = pd.read_csv(ads_csv_path)
-
-        # Convert date columns to datetime
-        ga4_df['date'] = pd.to_datetime(ga4_df['date'])
-        ads_df['date'] = pd.to_datetime(ads_df['date'])
+        """
+        Fetch data from local Day 01 output files.
 
+        Prefers the typed Parquet files (reading only the report columns and
+        the row groups of the last N days); falls back to CSV.
+        """
         # Filter to last N days
         end_date = datetime.now()
         start_date = end_date - timedelta(days=DAY11_REPORT_DAYS_BACK)
 
-        ga4_df = ga4_df[ga4_df['date'] >= start_date]
-        ads_df = ads_df[ads_df['date'] >= start_date]
+        ga4_df = self._day11_read_day01_file("ga4_sessions", DAY11_GA4_COLUMNS, start_date)
+        ads_df = self._day11_read_day01_file("ads_campaigns", DAY11_ADS_COLUMNS, start_date)
 
-        logger.info(f"Loaded {len(ga4_df)} GA4 rows and {len(ads_df)} Ads rows from CSV")
+        logger.info(f"Loaded {len(ga4_df)} GA4 rows and {len(ads_df)} Ads rows from local files")
         return ga4_df, ads_df
 
+    def _day11_read_day01_file(self, name: str, columns: list, start_date: datetime) -> pd.DataFrame:
+        """
+        Read one Day 01 dataset with rows dated after start_date.
+
+        Args:
+            name: File name without extension (e.g. "ga4_sessions")
+            columns: Columns to read
+            start_date: Rows on or before this day are skipped
+
+        Returns:
+            DataFrame with a datetime64 'date' column
+        """
+        parquet_path = DAY11_DAY01_DATA_DIR / f"{name}.parquet"
+        csv_path = DAY11_DAY01_DATA_DIR / f"{name}.csv"
+
+        # Day 01 writes one format per run: use the most recent file
+        existing = [path for path in (parquet_path, csv_path) if path.exists()]
+        if not existing:
+            raise FileNotFoundError(f"{name}.parquet/.csv not found in {DAY11_DAY01_DATA_DIR}")
+        path = max(existing, key=lambda p: p.stat().st_mtime)
+
+        if path.suffix == ".parquet":
+            import pyarrow.parquet as pq
+
+            # Dates are stored as DATE (midnight), so "date >= start_date" means "day after start_date's day"
+            table = pq.read_table(path, columns=columns, filters=[("date", ">", start_date.date())])
+            return table.to_pandas(date_as_object=False)
+
+        df = pd.read_csv(path, usecols=columns, parse_dates=["date"])
+        return df[df["date"] >= start_date]
+
     def _day11_generate_synthetic_data(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """Generate synthetic data for testing/demo purposes."""
         import random
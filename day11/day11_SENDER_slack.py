@@ -10,12 +10,20 @@ Author: Gleyson - Retail Marketing Automation Specialist
 
 import requests
 import logging
-import time
+import sys
+from pathlib import Path
 from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+# Add common modules to path
+sys.path.append(str(Path(__file__).parent.parent / 'common'))
+
+from utils.http_client import RetryingHTTPClient
 from day11_CONFIG_settings import (
     DAY11_SLACK_WEBHOOK_URL,
     DAY11_RETRY_ATTEMPTS,
     DAY11_RETRY_DELAY_SECONDS,
+    DAY11_SLACK_RATE_LIMIT_PER_SECOND,
     DAY11_DRY_RUN
 )
 
@@ -37,6 +45,18 @@ class Day11SlackSender:
         if not self.webhook_url:
             logger.warning("No Slack webhook URL configured!")
 
+        # Retries 429 (honoring Slack's Retry-After), 5xx, timeouts and connection errors
+        rate_limits = {}
+        if self.webhook_url:
+            rate_limits[urlsplit(self.webhook_url).hostname] = DAY11_SLACK_RATE_LIMIT_PER_SECOND
+        self.http = RetryingHTTPClient(
+            max_attempts=DAY11_RETRY_ATTEMPTS,
+            backoff_seconds=DAY11_RETRY_DELAY_SECONDS,
+            timeout=10,
+            rate_limits=rate_limits,
+            verbose=False
+        )
+
     def day11_send_message(self, payload: Dict, retry: bool = True) -> bool:
         """
         Send a message to Slack.
@@ -59,46 +79,44 @@ class Day11SlackSender:
             return True
 
         attempts = DAY11_RETRY_ATTEMPTS if retry else 1
+        retries_before = self.http.stats['retries']
+
+        try:
+            logger.info(f"Sending to Slack (up to {attempts} attempts)...")
+
+            response = self.http.post(
+                self.webhook_url,
+                json=payload,
+                headers={"Content-Type": "application/json"},
+                max_attempts=attempts,
+                # The webhook path is a secret: keep it out of latency metrics
+                endpoint="POST slack webhook"
+            )
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to send message after {attempts} attempts: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            return False
 
-        for attempt in range(1, attempts + 1):
-            try:
-                logger.info(f"Sending to Slack (attempt {attempt}/{attempts})...")
-
-                response = requests.post(
-                    self.webhook_url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                    timeout=10
-                )
-
-                if response.status_code == 200:
-                    logger.info("✓ Message sent successfully to Slack")
-                    return True
-                else:
-                    logger.warning(
-                        f"Slack API returned status {response.status_code}: {response.text}"
-                    )
-
-                    # Don't retry on client errors (4xx)
-                    if 400 <= response.status_code < 500:
-                        logger.error("Client error - not retrying")
-                        return False
-
-            except requests.exceptions.Timeout:
-                logger.warning(f"Timeout on attempt {attempt}")
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Request failed on attempt {attempt}: {e}")
-            except Exception as e:
-                logger.error(f"Unexpected error on attempt {attempt}: {e}")
-                return False
-
-            # Wait before retry (except on last attempt)
-            if attempt < attempts:
-                wait_time = DAY11_RETRY_DELAY_SECONDS * attempt  # Exponential backoff
-                logger.info(f"Waiting {wait_time}s before retry...")
-                time.sleep(wait_time)
-
-        logger.error(f"Failed to send message after {attempts} attempts")
+        retries = self.http.stats['retries'] - retries_before
+        if retries:
+            logger.info(f"Slack request retried {retries} time(s)")
+
+        if response.status_code == 200:
+            logger.info("✓ Message sent successfully to Slack")
+            return True
+
+        logger.warning(
+            f"Slack API returned status {response.status_code}: {response.text}"
+        )
+
+        # Client errors (4xx other than 429) are not retried
+        if 400 <= response.status_code < 500 and response.status_code != 429:
+            logger.error("Client error - not retrying")
+        else:
+            logger.error(f"Failed to send message after {attempts} attempts")
         return False
 
     def day11_test_connection(self) -> bool:
@@ -1,6 +1,6 @@
 """
 Day 11 Test with REAL Data from Day 01
-Tests the workflow using actual CSV files instead of synthetic data
+Tests the workflow using actual Day 01 output files (Parquet or CSV) instead of synthetic data
 
 This demonstrates that the fallback strategy works correctly:
 1. Tries BigQuery (will fail without credentials)
@@ -31,18 +31,33 @@ from day11_DATA_fetcher import day11_calculate_metrics
 from day11_FORMATTER_slack import Day11SlackFormatter, day11_format_simple_text_report
 
 
+def find_day01_file(processed_dir, name):
+    """Return the newest of <name>.parquet / <name>.csv (Day 01 writes one format per run)."""
+    candidates = [os.path.join(processed_dir, f"{name}.{ext}") for ext in ('parquet', 'csv')]
+    existing = [path for path in candidates if os.path.exists(path)]
+    return max(existing, key=os.path.getmtime) if existing else None
+
+
+def read_day01_file(path):
+    """Read a Day 01 Parquet or CSV file."""
+    if path.endswith('.parquet'):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
 def load_day01_csv_directly():
-    """Load CSV files from Day 01 directly without date filtering."""
+    """Load Day 01 output files (Parquet or CSV) directly without date filtering."""
 
     parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    ga4_path = os.path.join(parent_dir, 'day01', 'data', 'processed', 'ga4_sessions.csv')
-    ads_path = os.path.join(parent_dir, 'day01', 'data', 'processed', 'ads_campaigns.csv')
+    processed_dir = os.path.join(parent_dir, 'day01', 'data', 'processed')
+    ga4_path = find_day01_file(processed_dir, 'ga4_sessions')
+    ads_path = find_day01_file(processed_dir, 'ads_campaigns')
 
-    if not os.path.exists(ga4_path) or not os.path.exists(ads_path):
-        raise FileNotFoundError(f"Day 01 CSV files not found. Please run Day 01 first.")
+    if not ga4_path or not ads_path:
+        raise FileNotFoundError(f"Day 01 output files not found. Please run Day 01 first.")
 
-    ga4_df = pd.read_csv(ga4_path)
-    ads_df = pd.read_csv(ads_path)
+    ga4_df = read_day01_file(ga4_path)
+    ads_df = read_day01_file(ads_path)
 
     # Convert date columns
     ga4_df['date'] = pd.to_datetime(ga4_df['date'])
@@ -60,7 +75,7 @@ def main():
     print()
 
     # Load real data
-    print("Step 1/4: Loading REAL data from Day 01 CSV files...")
+    print("Step 1/4: Loading REAL data from Day 01 output files...")
     try:
         ga4_df, ads_df = load_day01_csv_directly()
         print(f"✓ Loaded {len(ga4_df)} GA4 rows and {len(ads_df)} Ads rows")
@@ -102,7 +117,7 @@ def main():
 
     slack_payload = formatter.day11_format_daily_report(
         metrics,
-        "✓ Using REAL data from Day 01 CSV files"
+        "✓ Using REAL data from Day 01 output files"
     )
 
     print(f"✓ Slack message formatted with {len(slack_payload['blocks'])} blocks")
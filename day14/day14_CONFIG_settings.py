@@ -15,6 +15,9 @@ load_dotenv()
 DAY14_API_BASE_URL = "https://api.queridodiario.ok.org.br"
 DAY14_API_GAZETTES_ENDPOINT = f"{DAY14_API_BASE_URL}/gazettes"
 DAY14_API_RATE_LIMIT = 60  # requests per minute
+DAY14_API_TIMEOUT = 30  # seconds
+DAY14_API_RETRY_ATTEMPTS = 3
+DAY14_API_RETRY_DELAY = 2  # seconds (base of the exponential backoff)
 
 # Major Brazilian cities IBGE codes for transport monitoring
 DAY14_TERRITORY_IDS = {
@@ -8,9 +8,16 @@ and calculating transport regulatory KPIs.
 
 import requests
 import json
+import sys
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Dict, List, Optional
-import time
+from urllib.parse import urlsplit
+
+# Add common modules to path
+sys.path.append(str(Path(__file__).parent.parent / 'common'))
+
+from utils.http_client import RetryingHTTPClient
 from day14_CONFIG_settings import (
     DAY14_API_GAZETTES_ENDPOINT,
     DAY14_TERRITORY_IDS,
@@ -19,6 +26,9 @@ from day14_CONFIG_settings import (
     DAY14_NUMBER_OF_EXCERPTS,
     DAY14_RESULTS_SIZE,
     DAY14_API_RATE_LIMIT,
+    DAY14_API_TIMEOUT,
+    DAY14_API_RETRY_ATTEMPTS,
+    DAY14_API_RETRY_DELAY,
     DAY14_KPI_DEFINITIONS
 )
 
@@ -28,15 +38,13 @@ class Day14QueridoDiarioClient:
 
     def __init__(self):
         self.base_url = DAY14_API_GAZETTES_ENDPOINT
-        self.rate_limit_delay = 60 / DAY14_API_RATE_LIMIT  # seconds between requests
-        self.last_request_time = 0
-
-    def _respect_rate_limit(self):
-        """Ensure we don't exceed API rate limits."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - elapsed)
-        self.last_request_time = time.time()
+        # Pooled connections, retries with backoff and a token bucket at the API rate limit
+        self.http = RetryingHTTPClient(
+            max_attempts=DAY14_API_RETRY_ATTEMPTS,
+            backoff_seconds=DAY14_API_RETRY_DELAY,
+            timeout=DAY14_API_TIMEOUT,
+            rate_limits={urlsplit(self.base_url).hostname: DAY14_API_RATE_LIMIT / 60}
+        )
 
     def query_gazettes(
         self,
@@ -57,8 +65,6 @@ class Day14QueridoDiarioClient:
         Returns:
             API response as dictionary
         """
-        self._respect_rate_limit()
-
         params = {
             'territory_ids': territory_id,
             'querystring': query_string,
@@ -73,7 +79,7 @@ class Day14QueridoDiarioClient:
             params['published_until'] = until_date
 
         try:
-            response = requests.get(self.base_url, params=params, timeout=30)
+            response = self.http.get(self.base_url, params=params)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -231,6 +237,8 @@ def day14_fetch_daily_kpis(days_back: int = 30) -> Dict:
         until_date=until_date
     )
 
+    client.http.print_latency_report()
+
     # Calculate KPIs
     calculator = Day14KPICalculator()
     kpis = calculator.generate_kpi_summary(